@@ -1,15 +1,33 @@
+import importlib
+
 from ._version import __version__
-from .namespace import SSNO
-from ontolutils.ex.prov import Person, Organization
-from ontolutils.ex.prov.attribution import Attribution
-from .ssno import StandardNameTable, Qualification, VectorQualification, Transformation, Character, AgentRole, \
-    VectorStandardName, StandardName, ScalarStandardName, DomainConceptSet
-from .utils import get_cache_dir
-from . import schema
-from .ssno.standard_name_table import parse_table
-
-CACHE_DIR = get_cache_dir()
+
 CONTEXT = "https://raw.githubusercontent.com/matthiasprobst/ssno/main/ssno_context.jsonld"
+
+# The model stack (ontolutils, pydantic, pint, rdflib) takes seconds to import. Hence, the public
+# objects and submodules are imported on first access (see __getattr__), so that "import ssnolib"
+# stays fast, e.g. for the command line interface or short-lived worker processes:
+_LAZY_ATTRIBUTES = {
+    'SSNO': '.namespace',
+    'Person': 'ontolutils.ex.prov',
+    'Organization': 'ontolutils.ex.prov',
+    'Attribution': 'ontolutils.ex.prov.attribution',
+    'StandardNameTable': '.ssno',
+    'Qualification': '.ssno',
+    'VectorQualification': '.ssno',
+    'Transformation': '.ssno',
+    'Character': '.ssno',
+    'AgentRole': '.ssno',
+    'VectorStandardName': '.ssno',
+    'StandardName': '.ssno',
+    'ScalarStandardName': '.ssno',
+    'DomainConceptSet': '.ssno',
+    'get_cache_dir': '.utils',
+    'parse_table': '.ssno.standard_name_table',
+    'iter_standard_names': '.streaming',
+    'load_tables': '.loading',
+}
+
 __all__ = ('__version__',
            'SSNO',
            'StandardNameTable',
@@ -26,5 +44,29 @@ __all__ = ('__version__',
            'Organization',
            'AgentRole',
            'CONTEXT',
-           'parse_table'
+           'parse_table',
+           'iter_standard_names',
+           'load_tables'
            )
+
+
+def __getattr__(name: str):
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    elif name == "CACHE_DIR":
+        from .utils import get_cache_dir
+        value = get_cache_dir()
+    else:
+        # submodules, e.g. ssnolib.schema:
+        try:
+            value = importlib.import_module(f"{__name__}.{name}")
+        except ModuleNotFoundError as e:
+            if e.name != f"{__name__}.{name}":
+                raise
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES) | {"CACHE_DIR"})
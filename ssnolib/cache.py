@@ -0,0 +1,111 @@
+from collections import OrderedDict
+from typing import Any, Hashable, List, NamedTuple, Optional
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: Optional[int]
+    currsize: int
+
+
+class LRUCache:
+    """Mapping with a bounded size, which evicts the least recently used entry first.
+
+    Parameters
+    ----------
+    maxsize: Optional[int]
+        Maximal number of entries. If None, the size is unbounded.
+    """
+
+    def __init__(self, maxsize: Optional[int] = 1024):
+        if maxsize is not None and maxsize < 0:
+            raise ValueError(f"maxsize must be None or >= 0, got {maxsize}")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data = OrderedDict()
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.info()})"
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Returns the cached value and marks it as recently used"""
+        try:
+            value = self._data[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: Any):
+        """Adds a value and evicts the least recently used entries if the cache is full"""
+        if self.maxsize == 0:
+            return
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if self.maxsize is not None:
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Removes an entry and returns its value (without counting a hit or miss)"""
+        return self._data.pop(key, default)
+
+    def keys(self) -> List[Hashable]:
+        """Returns the keys from the least to the most recently used one"""
+        return list(self._data)
+
+    def clear(self):
+        """Removes all entries. The statistics are kept."""
+        self._data.clear()
+
+    def info(self) -> CacheInfo:
+        """Returns the hit, miss and eviction counters as well as the size of the cache"""
+        return CacheInfo(hits=self.hits,
+                         misses=self.misses,
+                         evictions=self.evictions,
+                         maxsize=self.maxsize,
+                         currsize=len(self._data))
+
+
+def _counts_mutation(name: str):
+    method = getattr(list, name)
+
+    def _mutate(self, *args, **kwargs):
+        self.version += 1
+        return method(self, *args, **kwargs)
+
+    _mutate.__name__ = name
+    _mutate.__doc__ = method.__doc__
+    return _mutate
+
+
+class VersionedList(list):
+    """List counting its in-place changes in `version`.
+
+    Caches derived from the items of the list can compare the version to detect changes,
+    which neither alter the identity nor the length of the list, e.g. `lst[0] = item`.
+    """
+    version = 0  # unpickled lists are not initialized
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.version = 0
+
+
+for _name in ("__setitem__", "__delitem__", "__iadd__", "__imul__", "append", "extend", "insert",
+              "pop", "remove", "clear", "sort", "reverse"):
+    setattr(VersionedList, _name, _counts_mutation(_name))
+del _name
@@ -1,2 +1,9 @@
 standard_name_core_pattern = r'^[a-z0-9]+(?:_[a-z0-9]+)*$'
 raise_error_on_unparsable_unit = True
+standard_name_cache_size = 1024  # max. number of derived standard names cached per table (None: unbounded)
+unresolvable_name_cache_size = 4096  # max. number of unresolvable names remembered per table (None: unbounded)
+max_transformation_depth = 10  # max. nesting depth of transformations when resolving standard names
+unit_cache_size = 512  # max. number of unit strings whose parsed/formatted form and QUDT IRI are cached
+use_snapshots = False  # reuse binary snapshots of parsed tables stored in snapshot_dir (see parse_table)
+snapshot_dir = None  # directory of the snapshots (None: "snapshots" in the cache directory of ssnolib)
+max_snapshots = 32  # max. number of snapshots kept, the least recently used are removed (None: unbounded)
@@ -0,0 +1,692 @@
+import bisect
+import json
+import pathlib
+import re
+import warnings
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Pattern, Union
+
+from ssnolib import config
+
+STANDARD_NAME_PLACEHOLDER = "standard_name"
+
+
+def _normalize_id(_id) -> Optional[str]:
+    """Returns the identifier of a qualification (or a reference to one) as used for ordering"""
+    if _id is None:
+        return None
+    _id = getattr(_id, "id", _id)  # before/after may still hold the Qualification object
+    return str(_id).strip("_:")
+
+
+class QualificationGrammar:
+    """Compiled qualification grammar of a Standard Name Table.
+
+    The grammar is built once from the qualifications of a table and holds the
+    qualifications in construction order, the regular expression pattern (using
+    the placeholder "standard_name" for the core standard name), the precompiled
+    regular expressions per core standard name and the valid values per qualification.
+
+    Parameters
+    ----------
+    qualifications: List[Qualification]
+        The qualifications (incl. VectorQualifications) of the Standard Name Table.
+    """
+
+    def __init__(self, qualifications: List["Qualification"]):
+        from .ssno.standard_name_table import _generate_ordered_list_of_qualifications
+
+        lookup = {_normalize_id(q.id): q for q in qualifications}
+        # the SPARQL based implementation processed the qualifications ordered by ssno:before:
+        _sorted = sorted(qualifications, key=lambda q: (q.before is not None, str(q.before or '')))
+        qres = {_normalize_id(q.id): {'before': _normalize_id(q.before),
+                                      'after': _normalize_id(q.after)} for q in _sorted}
+        sorted_list = _generate_ordered_list_of_qualifications(qres)
+
+        self.qualifications: List["Qualification"] = []
+        self.core_position: int = 0
+        for e in sorted_list:
+            if e in lookup:
+                self.qualifications.append(lookup[e])
+            else:
+                self.core_position = len(self.qualifications)
+        self.qualification_ids: List[str] = [str(q.id) for q in self.qualifications]
+
+        # valid values per qualification. The key is the phrase as it appears in a standard name,
+        # hence including the preposition:
+        self.valid_values: Dict[str, Dict[str, "TextVariable"]] = {}
+        for q in self.qualifications:
+            phrases = {}
+            for tv in q.hasValidValues:
+                if q.hasPreposition:
+                    phrases.setdefault(f"{q.hasPreposition}_{tv.hasStringValue}", tv)
+                else:
+                    phrases.setdefault(str(tv.hasStringValue), tv)
+            self.valid_values[str(q.id)] = phrases
+
+        self.pattern: str = self._build_pattern()
+        self._regex_cache: Dict[str, Pattern] = {}
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.get_rule_as_string()})"
+
+    def _build_pattern(self) -> str:
+        out = ""
+        for i, q in enumerate(self.qualifications):
+            if i == self.core_position:
+                out += f"{STANDARD_NAME_PLACEHOLDER}_?"
+            out += f'(?:({"|".join(self.valid_values[str(q.id)])}))?_?'
+        if self.core_position == len(self.qualifications):
+            out += f"{STANDARD_NAME_PLACEHOLDER}_?"
+        if out.endswith("?_?"):
+            return "^" + out.strip("?_?") + "?$"
+        return "^" + out + "$"
+
+    def get_regex(self, core_standard_name: str) -> Pattern:
+        """Returns the compiled regular expression for the given core standard name"""
+        regex = self._regex_cache.get(core_standard_name, None)
+        if regex is None:
+            regex = re.compile(self.pattern.replace(STANDARD_NAME_PLACEHOLDER, core_standard_name))
+            self._regex_cache[core_standard_name] = regex
+        return regex
+
+    def match(self, standard_name: str, core_standard_name: str) -> Optional[Tuple[Optional[str], ...]]:
+        """Matches a standard name against the grammar using the given core standard name.
+
+        Returns
+        -------
+        Optional[Tuple[Optional[str], ...]]
+            The matched qualification phrases (one entry per qualification in order of
+            `qualifications`, None if not used) or None if the name does not match.
+        """
+        m = self.get_regex(core_standard_name).match(standard_name)
+        if m is None:
+            return None
+        return m.groups()
+
+    def get_rule_as_string(self) -> str:
+        """Returns the qualification rule, e.g. "[component] standard_name [in medium]" """
+        parts = []
+        for q in self.qualifications:
+            if q.hasPreposition:
+                parts.append(f'[{q.hasPreposition.replace("_", " ")} {q.name}]')
+            else:
+                parts.append(f'[{q.name}]')
+        parts.insert(self.core_position, STANDARD_NAME_PLACEHOLDER)
+        return " ".join(parts)
+
+
+class CoreNameTrie:
+    """Trie over the words (separated by "_") of the core standard names of a table.
+
+    Finds all core standard names contained in a (derived) standard name in a single
+    pass over its words instead of testing every core standard name.
+
+    Parameters
+    ----------
+    core_standard_names: Iterable[str]
+        The core standard names to insert.
+    """
+    _END = None  # key marking the end of a core standard name in a trie node
+
+    def __init__(self, core_standard_names: Iterable[str] = ()):
+        self._root: Dict = {}
+        self._size = 0
+        for name in core_standard_names:
+            self.add(name)
+
+    def __len__(self):
+        return self._size
+
+    def __contains__(self, core_standard_name: str) -> bool:
+        node = self._root
+        for word in core_standard_name.split("_"):
+            node = node.get(word, None)
+            if node is None:
+                return False
+        return self._END in node
+
+    def add(self, core_standard_name: str):
+        """Inserts a core standard name"""
+        node = self._root
+        for word in core_standard_name.split("_"):
+            node = node.setdefault(word, {})
+        if self._END not in node:
+            node[self._END] = core_standard_name
+            self._size += 1
+
+    def find(self, standard_name: str) -> List[str]:
+        """Returns all core standard names occurring in the given standard name.
+
+        Only occurrences starting and ending at word boundaries are considered. The
+        result is ordered by length (longest first) and position of the occurrence.
+        """
+        words = standard_name.split("_")
+        found = []
+        for start in range(len(words)):
+            node = self._root
+            for word in words[start:]:
+                node = node.get(word, None)
+                if node is None:
+                    break
+                if self._END in node:
+                    found.append((start, node[self._END]))
+        found.sort(key=lambda f: (-len(f[1]), f[0]))
+        return list(dict.fromkeys(name for _, name in found))
+
+
+def _regex_alternation(words: Iterable[str]) -> str:
+    """Returns a regex matching any of the words.
+
+    The alternation is factorized like a trie (e.g. "air_(?:density|pressure)"), so
+    the regex engine decides on every character instead of testing word after word.
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+    if not trie:
+        return "(?!)"  # matches nothing
+
+    def _to_regex(node) -> str:
+        optional = "" in node
+        branches = [re.escape(char) + _to_regex(child) for char, child in sorted(node.items()) if char != ""]
+        if not branches:
+            return ""
+        if len(branches) == 1 and not optional:
+            return branches[0]
+        return "(?:" + "|".join(branches) + ")" + ("?" if optional else "")
+
+    return _to_regex(trie)
+
+
+@dataclass(frozen=True)
+class NameParse:
+    """Result of matching a standard name with a StandardNameMatcher.
+
+    A name is either a core standard name with optional qualifications or the result of a
+    transformation, in which case `arguments` holds the value of each character: the parse
+    of the standard name it refers to or the string of the valid value.
+    """
+    standard_name: str
+    core_standard_name: Optional[str] = None
+    qualifications: Tuple[Tuple[str, str], ...] = ()  # (qualification ID, phrase)
+    transformation: Optional[str] = None  # name of the transformation, e.g. "mean_of_X"
+    arguments: Tuple[Tuple[str, Union["NameParse", str]], ...] = ()  # (character, parse or valid value)
+
+
+class StandardNameMatcher:
+    """Validates and parses string standard names without a Standard Name Table.
+
+    The matcher is compiled from the core standard names, qualifications and transformations
+    of a table (see `from_table`). Qualified names are matched by (at most two) anchored regular
+    expressions, in which the alternatives of the core names and qualification phrases are
+    factorized like a trie. Hence, the time to match a qualified name does not grow with the number
+    of core standard names. Transformations are matched by a chart parser over the words of the
+    name, which memoizes the valid spans (see `_parse`).
+
+    The matcher is described by plain data (`to_dict`), which can be written to and read from
+    JSON (`to_json`, `from_json`) and is what is transferred when pickling, e.g. to worker processes.
+
+    Parameters
+    ----------
+    spec: Dict
+        The description of the grammar as returned by `to_dict`.
+    """
+    SPEC_VERSION = 1
+
+    def __init__(self, spec: Dict):
+        if spec.get("version", None) != self.SPEC_VERSION:
+            raise ValueError(f"Unsupported matcher version {spec.get('version', None)}. "
+                             f"Expected {self.SPEC_VERSION}.")
+        self._spec = spec
+        self._core_standard_names: Dict[str, bool] = spec["core_standard_names"]
+        # sorted core standard names for the prefix search of `complete`:
+        self._sorted_core_standard_names = sorted(self._core_standard_names)
+        self._sorted_vector_core_standard_names = [n for n in self._sorted_core_standard_names
+                                                   if self._core_standard_names[n]]
+        self._qualification_ids: List[str] = [q["id"] for q in spec["qualifications"]]
+        self._transformations = []
+        for t in spec["transformations"]:
+            template = self.get_template(t["name"], t["characters"])
+            characters = {c: None if values is None else frozenset(values) for c, values in
+                          t["characters"].items()}
+            self._transformations.append((t["name"], template, characters))
+        self._suggester = None  # built on first use of `suggest`
+        patterns = spec.get("patterns", None) or self._build_patterns(spec)
+        self._spec["patterns"] = patterns
+        self._regexes = [re.compile(p) for p in patterns]
+
+    def __repr__(self):
+        return (f"{self.__class__.__name__}(core_standard_names={len(self._core_standard_names)}, "
+                f"qualifications={len(self._qualification_ids)}, transformations={len(self._transformations)})")
+
+    def __getstate__(self):
+        return self.to_dict()
+
+    def __setstate__(self, state):
+        self.__init__(state)
+
+    def __contains__(self, standard_name: str) -> bool:
+        return self.match(standard_name) is not None
+
+    @staticmethod
+    def get_template(name: str, characters: Iterable[str]) -> List[Tuple[bool, str]]:
+        """Returns the words of the name of a transformation, each with a flag whether it is a character,
+        e.g. [(False, "mean"), (False, "of"), (True, "X")] for "mean_of_X" """
+        return [(word in characters, word) for word in name.split("_")]
+
+    @staticmethod
+    def _build_patterns(spec: Dict) -> List[str]:
+        vector_cores = [n for n, is_vector in spec["core_standard_names"].items() if is_vector]
+        scalar_cores = [n for n, is_vector in spec["core_standard_names"].items() if not is_vector]
+        has_vector_qualification = any(q["vector"] for q in spec["qualifications"])
+
+        def _build(cores, include_vector_qualifications):
+            out = ""
+            for i, q in enumerate(spec["qualifications"]):
+                if i == spec["core_position"]:
+                    # the core standard name must start and end at a word boundary:
+                    out += f"(?<![a-z0-9])(?P<core>{_regex_alternation(cores)})(?![a-z0-9])_?"
+                if q["vector"] and not include_vector_qualifications:
+                    continue
+                out += f'(?:(?P<q{i}>{_regex_alternation(q["phrases"])}))?_?'
+            if spec["core_position"] == len(spec["qualifications"]):
+                out += f"(?<![a-z0-9])(?P<core>{_regex_alternation(cores)})(?![a-z0-9])_?"
+            if out.endswith(")?_?"):
+                out = out[:-2]
+            return "^" + out + "$"
+
+        if not has_vector_qualification:
+            return [_build(list(spec["core_standard_names"]), True)]
+        # a VectorQualification can only qualify a VectorStandardName:
+        return [_build(vector_cores, True), _build(scalar_cores, False)]
+
+    @classmethod
+    def from_table(cls, snt: "StandardNameTable") -> "StandardNameMatcher":
+        """Compiles the matcher from the core standard names, qualifications and transformations of a table"""
+        from ssnolib.namespace import SSNO
+        from .ssno.standard_name import VectorStandardName
+        from .ssno.standard_name_table import Transformation, VectorQualification
+
+        grammar = snt.get_qualification_grammar()
+        core_standard_names = {}
+        for sn in snt.standardNames or []:
+            core_standard_names.setdefault(str(sn.standardName), isinstance(sn, VectorStandardName))
+        qualifications = [
+            {"id": str(q.id),
+             "name": str(q.name),
+             "phrases": list(grammar.valid_values[str(q.id)]),
+             "vector": isinstance(q, VectorQualification)} for q in grammar.qualifications
+        ]
+
+        value_sets = {str(q.id): [str(v.hasStringValue) for v in q.hasValidValues] for q in grammar.qualifications}
+        for dcs in snt.hasDomainConceptSet or []:
+            value_sets[str(dcs.id)] = [str(v.hasStringValue) for v in dcs.hasValidValues]
+        transformations = []
+        skipped = []
+        for t in snt.hasModifier or []:
+            if not isinstance(t, Transformation):
+                continue
+            characters = {}
+            for char in t.hasCharacter:
+                if str(char.associatedWith) == str(SSNO.AnyStandardName):
+                    characters[char.character] = None
+                elif str(char.associatedWith) in value_sets:
+                    characters[char.character] = value_sets[str(char.associatedWith)]
+                else:
+                    # no name can be built with the transformation, but the others remain usable:
+                    skipped.append(f"{t.name}: unknown associatedWith value {char.associatedWith}")
+                    break
+            else:
+                transformations.append({"id": str(t.id), "name": str(t.name), "characters": characters})
+        if skipped:
+            warnings.warn(f"{len(skipped)} transformation(s) are skipped:\n" + "\n".join(skipped), UserWarning)
+        return cls({
+            "version": cls.SPEC_VERSION,
+            "core_standard_names": core_standard_names,
+            "qualifications": qualifications,
+            "core_position": grammar.core_position,
+            "transformations": transformations
+        })
+
+    def to_dict(self) -> Dict:
+        """Returns the JSON-serializable description of the matcher incl. its compiled patterns"""
+        return self._spec
+
+    def to_json(self, filename: Union[str, pathlib.Path], overwrite: bool = False) -> pathlib.Path:
+        """Writes the matcher to a JSON file, from which it can be restored with `from_json`"""
+        filename = pathlib.Path(filename)
+        if filename.exists() and not overwrite:
+            raise ValueError(f'File {filename} exists and overwrite is False.')
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f)
+        return filename
+
+    @classmethod
+    def from_json(cls, filename: Union[str, pathlib.Path]) -> "StandardNameMatcher":
+        """Restores a matcher written with `to_json`"""
+        with open(filename, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def match(self, standard_name: str, max_depth: Optional[int] = None) -> Optional[NameParse]:
+        """Validates a standard name and returns how it is built.
+
+        Parameters
+        ----------
+        standard_name: str
+            The standard name to match.
+        max_depth: Optional[int]=None
+            Maximal nesting depth of transformations. Defaults to `config.max_transformation_depth`.
+
+        Returns
+        -------
+        Optional[NameParse]
+            The parse of the standard name or None if it is not valid.
+        """
+        return self._parse(standard_name, max_depth, transformation_only=False)
+
+    def match_transformation(self, standard_name: str, max_depth: Optional[int] = None) -> Optional[NameParse]:
+        """Like `match`, but only returns a parse if the name is the result of a transformation"""
+        return self._parse(standard_name, max_depth, transformation_only=True)
+
+    def _match_qualified(self, standard_name: str) -> Optional[NameParse]:
+        if standard_name in self._core_standard_names:
+            return NameParse(standard_name=standard_name, core_standard_name=standard_name)
+        for regex in self._regexes:
+            m = regex.match(standard_name)
+            if m is not None:
+                groups = m.groupdict()
+                return NameParse(
+                    standard_name=standard_name,
+                    core_standard_name=groups.pop("core"),
+                    qualifications=tuple((self._qualification_ids[int(k[1:])], v)
+                                         for k, v in sorted(groups.items(), key=lambda kv: int(kv[0][1:]))
+                                         if v is not None)
+                )
+        return None
+
+    def _parse(self, standard_name: str, max_depth: Optional[int], transformation_only: bool) -> Optional[NameParse]:
+        """Chart parser over the words of the name.
+
+        Every span of words is parsed at most once per remaining transformation depth. The
+        results, including failures, are memoized in a chart, so that a name is parsed in
+        polynomial time of its number of words, independent of how the transformations are
+        nested or how many ways there are to split the name.
+        """
+        if max_depth is None:
+            max_depth = config.max_transformation_depth
+        if not re.match(config.standard_name_core_pattern, standard_name):
+            return None
+        words = standard_name.split("_")
+        chart: Dict[Tuple[int, int, int], Optional[NameParse]] = {}
+
+        def _span(i: int, j: int, remaining_depth: int, transformation_only: bool = False) -> Optional[NameParse]:
+            key = (i, j, remaining_depth)
+            if not transformation_only and key in chart:
+                return chart[key]
+            name = "_".join(words[i:j])
+            result = None if transformation_only else self._match_qualified(name)
+            if result is None and remaining_depth > 0:
+                for t_name, template, characters in self._transformations:
+                    arguments = _template(i, j, template, characters, remaining_depth - 1)
+                    if arguments is not None:
+                        result = NameParse(standard_name=name, transformation=t_name, arguments=arguments)
+                        break
+            if not transformation_only:
+                chart[key] = result
+            return result
+
+        def _template(i: int, j: int, template, characters, remaining_depth: int) -> Optional[Tuple]:
+            """Matches words[i:j] with the words of a transformation. Every character spans at least
+            one word, literal words must be equal."""
+            n_literals_after = [sum(not is_char for is_char, _ in template[ti:]) for ti in range(len(template) + 1)]
+            memo = {}
+
+            def _rec(ti: int, wi: int):
+                if (ti, wi) in memo:
+                    return memo[(ti, wi)]
+                result = None
+                if ti == len(template):
+                    result = () if wi == j else None
+                else:
+                    is_char, token = template[ti]
+                    if not is_char:
+                        if wi < j and words[wi] == token:
+                            result = _rec(ti + 1, wi + 1)
+                    else:
+                        # at least one word per remaining character and literal word:
+                        n_chars_after = len(template) - ti - 1 - n_literals_after[ti + 1]
+                        for end in range(wi + 1, j - n_literals_after[ti + 1] - n_chars_after + 1):
+                            valid_values = characters[token]
+                            if valid_values is None:
+                                argument = _span(wi, end, remaining_depth)
+                            else:
+                                term = "_".join(words[wi:end])
+                                argument = term if term in valid_values else None
+                            if argument is not None:
+                                rest = _rec(ti + 1, end)
+                                if rest is not None:
+                                    result = ((token, argument),) + rest
+                                    break
+                memo[(ti, wi)] = result
+                return result
+
+            return _rec(0, i)
+
+        return _span(0, len(words), max_depth, transformation_only)
+
+    def suggest(self, standard_name: str, k: int = 5, max_distance: int = 2) -> List[str]:
+        """Returns up to k valid standard names close to the given name, closest first.
+        See `ssnolib.suggestion.NameSuggester`."""
+        if self._suggester is None:
+            from .suggestion import NameSuggester
+            self._suggester = NameSuggester(self)
+        return self._suggester.suggest(standard_name, k=k, max_distance=max_distance)
+
+    def _qualified_name_slots(self, is_vector: bool) -> List[Optional[List[str]]]:
+        """Returns the phrases per position of a qualified name. The position of the
+        core standard name is None."""
+        slots = [q["phrases"] for q in self._spec["qualifications"]]
+        if not is_vector:
+            # a VectorQualification can only qualify a VectorStandardName:
+            slots = [[] if q["vector"] else phrases for q, phrases in zip(self._spec["qualifications"], slots)]
+        slots.insert(self._spec["core_position"], None)
+        return slots
+
+    def iter_names(self, max_depth: int = 1) -> Iterator[str]:
+        """Yields all standard names constructible with the grammar.
+
+        The names are generated lazily: first the core standard names with all combinations of
+        qualifications, then the transformations applied to names of lower depth. Note, that an
+        ambiguous grammar may construct the same string in different ways, which is then yielded
+        more than once.
+
+        Parameters
+        ----------
+        max_depth: int=1
+            Maximal nesting depth of transformations. 0 yields only (qualified) core standard names.
+        """
+        if max_depth < 0:
+            raise ValueError(f"max_depth must be >= 0, not {max_depth}")
+        return self._iter_names(max_depth)
+
+    def _iter_names(self, depth: int) -> Iterator[str]:
+        for core, is_vector in self._core_standard_names.items():
+            yield from self._iter_words(self._qualified_name_slots(is_vector), core)
+        if depth == 0:
+            return
+        for _, template, characters in self._transformations:
+            yield from self._iter_template(template, characters, depth)
+
+    @staticmethod
+    def _iter_words(slots: List[Optional[List[str]]], core: str, prefix: Tuple[str, ...] = ()) -> Iterator[str]:
+        if not slots:
+            yield "_".join(prefix)
+            return
+        head, tail = slots[0], slots[1:]
+        if head is None:
+            yield from StandardNameMatcher._iter_words(tail, core, prefix + (core,))
+            return
+        yield from StandardNameMatcher._iter_words(tail, core, prefix)  # qualification not used
+        for phrase in head:
+            yield from StandardNameMatcher._iter_words(tail, core, prefix + (phrase,))
+
+    def _iter_template(self, template, characters, depth: int, prefix: Tuple[str, ...] = ()) -> Iterator[str]:
+        if not template:
+            yield "_".join(prefix)
+            return
+        (is_char, token), tail = template[0], template[1:]
+        if not is_char:
+            yield from self._iter_template(tail, characters, depth, prefix + (token,))
+            return
+        valid_values = characters[token]
+        # the names of lower depth are generated again for every prefix instead of being stored:
+        for argument in (self._iter_names(depth - 1) if valid_values is None else sorted(valid_values)):
+            yield from self._iter_template(tail, characters, depth, prefix + (argument,))
+
+    def count_names(self, max_depth: int = 1) -> int:
+        """Returns the number of names yielded by `iter_names` without generating them.
+
+        The number is computed combinatorially: a qualified name has (1 + number of phrases)
+        choices per qualification, a transformation the product of the choices of its characters.
+        """
+        if max_depth < 0:
+            raise ValueError(f"max_depth must be >= 0, not {max_depth}")
+        count = 0
+        for is_vector in self._core_standard_names.values():
+            n = 1
+            for slot in self._qualified_name_slots(is_vector):
+                if slot is not None:
+                    n *= 1 + len(slot)
+            count += n
+        n_lower = count
+        for _ in range(max_depth):
+            n_transformed = 0
+            for _, template, characters in self._transformations:
+                n = 1
+                for is_char, token in template:
+                    if is_char:
+                        n *= n_lower if characters[token] is None else len(characters[token])
+                n_transformed += n
+            n_lower = count + n_transformed
+        return n_lower
+
+    def complete(self, prefix: str, limit: int = 20, max_depth: int = 1) -> List[str]:
+        """Returns valid standard names starting with the given prefix.
+
+        The grammar is walked from left to right and every branch, which cannot lead to
+        the prefix, is cut. The core standard names starting with a (remaining) prefix are
+        found by bisection in the sorted list of core standard names. Hence, only as many
+        names are generated as are returned. Qualified core standard names are returned before
+        transformed names.
+
+        Parameters
+        ----------
+        prefix: str
+            The beginning of the standard name.
+        limit: int=20
+            Maximal number of names to return.
+        max_depth: int=1
+            Maximal nesting depth of transformations.
+        """
+        completions = []
+        if limit <= 0:
+            return completions
+        seen = set()
+        for name in self._complete(prefix, max_depth):
+            if name not in seen:
+                seen.add(name)
+                completions.append(name)
+                if len(completions) == limit:
+                    break
+        return completions
+
+    @staticmethod
+    def _consume(rest: Optional[str], word: str) -> Optional[str]:
+        """Returns what remains of the prefix after appending the word to a name or None, if
+        the name cannot start with the prefix anymore"""
+        if rest == "" or word.startswith(rest):
+            return ""
+        if rest.startswith(word + "_"):
+            return rest[len(word) + 1:]
+        return None
+
+    def _complete(self, prefix: str, depth: int) -> Iterator[str]:
+        for name in self._complete_qualification(0, prefix, (), False):
+            if name.startswith(prefix):
+                yield name
+        if depth == 0:
+            return
+        for _, template, characters in self._transformations:
+            for name in self._complete_template(template, characters, depth, 0, prefix, ()):
+                if name.startswith(prefix):
+                    yield name
+
+    def _complete_qualification(self, i: int, rest: str, words: Tuple[str, ...], vector: bool,
+                                has_core: bool = False) -> Iterator[str]:
+        """Completes a qualified name from the i-th qualification on. Before the core standard name,
+        `vector` tells if a VectorQualification was used, afterward if the core standard name is a vector."""
+        qualifications = self._spec["qualifications"]
+        if i == self._spec["core_position"] and not has_core:
+            for core in self._complete_core(rest, vector_only=vector):
+                yield from self._complete_qualification(i, self._consume(rest, core), words + (core,),
+                                                        self._core_standard_names[core], True)
+            return
+        if i == len(qualifications):
+            if rest == "":
+                yield "_".join(words)
+            return
+        q = qualifications[i]
+        yield from self._complete_qualification(i + 1, rest, words, vector, has_core)  # qualification not used
+        if q["vector"] and has_core and not vector:
+            return
+        for phrase in q["phrases"]:
+            _rest = self._consume(rest, phrase)
+            if _rest is not None:
+                yield from self._complete_qualification(i + 1, _rest, words + (phrase,), vector or q["vector"],
+                                                        has_core)
+
+    def _complete_core(self, rest: str, vector_only: bool) -> Iterator[str]:
+        names = self._sorted_vector_core_standard_names if vector_only else self._sorted_core_standard_names
+        if rest == "":
+            yield from names
+            return
+        i = bisect.bisect_left(names, rest)
+        while i < len(names) and names[i].startswith(rest):
+            yield names[i]
+            i += 1
+        # core standard names followed by further words of the prefix:
+        for k, char in enumerate(rest):
+            if char == "_":
+                core = rest[:k]
+                if core in self._core_standard_names and (self._core_standard_names[core] or not vector_only):
+                    yield core
+
+    def _complete_template(self, template, characters, depth: int, ti: int, rest: str,
+                           words: Tuple[str, ...]) -> Iterator[str]:
+        if ti == len(template):
+            if rest == "":
+                yield "_".join(words)
+            return
+        is_char, token = template[ti]
+        if not is_char or characters[token] is not None:
+            for word in (sorted(characters[token]) if is_char else (token,)):
+                _rest = self._consume(rest, word)
+                if _rest is not None:
+                    yield from self._complete_template(template, characters, depth, ti + 1, _rest, words + (word,))
+            return
+        if rest == "":
+            for argument in self._iter_names(depth - 1):
+                yield from self._complete_template(template, characters, depth, ti + 1, "", words + (argument,))
+            return
+        # the argument starts with the remaining prefix...
+        for argument in self._complete(rest, depth - 1):
+            yield from self._complete_template(template, characters, depth, ti + 1, "", words + (argument,))
+        # ... or the prefix continues after the argument:
+        for k, char in enumerate(rest):
+            if char == "_" and self.match(rest[:k], max_depth=depth - 1) is not None:
+                yield from self._complete_template(template, characters, depth, ti + 1, rest[k + 1:],
+                                                   words + (rest[:k],))
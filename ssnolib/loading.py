@@ -0,0 +1,143 @@
+import glob
+import pathlib
+import time
+import warnings
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+# suffixes of the files found in a directory. Other files may be loaded if given explicitly:
+_TABLE_SUFFIXES = (".jsonld", ".json-ld", ".ttl", ".nt", ".rdf", ".owl", ".yaml", ".yml", ".xml")
+
+
+@dataclass(frozen=True)
+class TableLoadInfo:
+    """Result of loading a single table file.
+
+    The key is the key of the table in the registry. If the file could not be loaded, the key
+    is None and the error holds the reason.
+    """
+    filename: pathlib.Path
+    key: Optional[str]
+    seconds: float
+    error: Optional[str] = None
+
+
+class TableRegistry(dict):
+    """The loaded Standard Name Tables keyed by their identifier (or ID, if they have no
+    identifier). `timings` holds a `TableLoadInfo` for each file in the order of the files."""
+
+    def __init__(self):
+        super().__init__()
+        self.timings: List[TableLoadInfo] = []
+
+    @property
+    def errors(self) -> List[TableLoadInfo]:
+        """Returns the files, which could not be loaded"""
+        return [info for info in self.timings if info.error is not None]
+
+
+def _get_key(snt: "StandardNameTable") -> str:
+    return str(snt.identifier or snt.id)
+
+
+def _expand(paths_or_glob: Union[str, pathlib.Path, Iterable[Union[str, pathlib.Path]]]) -> List[pathlib.Path]:
+    """Returns the files of the paths. Directories are searched for table files and strings
+    containing wildcards are expanded."""
+    if isinstance(paths_or_glob, (str, pathlib.Path)):
+        paths_or_glob = [paths_or_glob]
+    filenames = []
+    for path in paths_or_glob:
+        if isinstance(path, str) and glob.has_magic(path):
+            filenames.extend(pathlib.Path(f) for f in sorted(glob.glob(path, recursive=True)))
+            continue
+        path = pathlib.Path(path)
+        if path.is_dir():
+            filenames.extend(sorted(f for f in path.iterdir() if f.suffix.lower() in _TABLE_SUFFIXES))
+        else:
+            filenames.append(path)
+    return list(dict.fromkeys(filenames))
+
+
+def _load_table(filename: pathlib.Path) -> Tuple[Optional["StandardNameTable"], float, Optional[str]]:
+    """Loads a table file and returns the table, the time needed in seconds and the error, if any.
+
+    RDF files are read with `parse_table`, all other formats (e.g. YAML or CF-style XML) with the
+    reader plugins of `StandardNameTable.parse`.
+    """
+    from .ssno import plugins
+    from .ssno.standard_name_table import StandardNameTable, parse_table, _RDF_FORMATS
+
+    fmt = filename.suffix[1:].lower()
+    start = time.perf_counter()
+    try:
+        if plugins.get(fmt, None) is not None and fmt not in ("jsonld", "json-ld"):
+            snt = StandardNameTable.parse(filename, fmt=fmt)
+        elif fmt in _RDF_FORMATS:
+            snt = parse_table(filename, fmt=fmt)
+        else:
+            raise ValueError(f'Unknown format "{fmt}".')
+    except Exception as e:  # the other files are loaded nevertheless
+        return None, time.perf_counter() - start, f"{type(e).__name__}: {e}"
+    return snt, time.perf_counter() - start, None
+
+
+def load_tables(paths_or_glob: Union[str, pathlib.Path, Iterable[Union[str, pathlib.Path]]],
+                workers: Optional[int] = None) -> TableRegistry:
+    """Loads many Standard Name Table files, optionally in parallel.
+
+    The format is determined from the suffix of a file: RDF files ("jsonld", "ttl", "nt", "rdf",
+    "owl") are parsed with `parse_table`, YAML and CF-style XML files with `StandardNameTable.parse`.
+    Files which cannot be loaded are reported in a single warning and listed in `errors` of the
+    returned registry.
+
+    Parameters
+    ----------
+    paths_or_glob: Union[str, pathlib.Path, Iterable[Union[str, pathlib.Path]]]
+        A file, a directory (all table files in it are loaded), a glob pattern (e.g. "tables/**/*.yaml")
+        or a list of them.
+    workers: Optional[int]=None
+        Number of worker processes. If None or 1, the files are loaded in the current process. Note,
+        that on platforms spawning processes, the call must be protected by `if __name__ == "__main__"`.
+
+    Returns
+    -------
+    TableRegistry
+        The tables keyed by their identifier or, if not given, by their ID. The time needed to load
+        each file is given by `timings`.
+
+    Examples
+    --------
+    >>> registry = load_tables("tables/*.jsonld", workers=4)
+    >>> for info in registry.timings:
+    ...     print(info.filename, info.key, f"{info.seconds:.2f} s")
+    """
+    filenames = _expand(paths_or_glob)
+    if workers is not None and workers > 1 and len(filenames) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        # start with the largest files, so that no worker is left with a large file at the end:
+        order = sorted(filenames, key=lambda f: f.stat().st_size if f.is_file() else 0, reverse=True)
+        with ProcessPoolExecutor(max_workers=min(workers, len(filenames))) as executor:
+            results = dict(zip(order, executor.map(_load_table, order)))
+    else:
+        results = {filename: _load_table(filename) for filename in filenames}
+
+    registry = TableRegistry()
+    sources: Dict[str, pathlib.Path] = {}
+    for filename in filenames:
+        snt, seconds, error = results[filename]
+        key = None
+        if snt is not None:
+            key = _get_key(snt)
+            if key in sources:
+                error = f'The key "{key}" of the table is already used by the table of "{sources[key]}".'
+                key = None
+            else:
+                sources[key] = filename
+                registry[key] = snt
+        registry.timings.append(TableLoadInfo(filename=filename, key=key, seconds=seconds, error=error))
+
+    if registry.errors:
+        warnings.warn(f"{len(registry.errors)} table file(s) could not be loaded:\n"
+                      + "\n".join(f"{info.filename}: {info.error}" for info in registry.errors), UserWarning)
+    return registry
@@ -0,0 +1,77 @@
+import math
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Union
+
+from ssnolib import config
+
+INVALID_PATTERN = "invalid_pattern"  # name does not match config.standard_name_core_pattern
+NOT_FOUND = "not_found"  # name is neither a core name nor constructable by qualifications/transformations
+ERROR = "error"  # resolving the name raised an error, e.g. the unit could not be computed
+# additional reasons of StandardNameTable.verify_many:
+OK = "ok"  # the name is valid and the unit is compatible
+INVALID_UNIT = "invalid_unit"  # the given unit cannot be parsed
+INCOMPATIBLE_UNIT = "incompatible_unit"  # the dimensionality of the unit differs from the one of the standard name
+
+
+@dataclass(frozen=True)
+class ResolutionFailure:
+    """A standard name, which could not be resolved by a Standard Name Table.
+
+    The object evaluates to False, so that failures can be filtered like None values.
+    """
+    name: str
+    reason: str
+    message: Optional[str] = None
+
+    def __bool__(self):
+        return False
+
+
+def resolve(snt: "StandardNameTable", name: str) -> Union["StandardName", ResolutionFailure]:
+    """Resolves a single string standard name and returns a ResolutionFailure instead of None"""
+    if not re.match(config.standard_name_core_pattern, name):
+        return ResolutionFailure(
+            name=name,
+            reason=INVALID_PATTERN,
+            message="General pattern not matched. Must be lowercase and parts may be separated by '_'."
+        )
+    try:
+        standard_name = snt.get_standard_name(name)
+    except (ValueError, TypeError, KeyError, AttributeError) as e:
+        return ResolutionFailure(name=name, reason=ERROR, message=str(e))
+    if standard_name is None:
+        return ResolutionFailure(name=name, reason=NOT_FOUND)
+    return standard_name
+
+
+# the table of a worker process. Set once per process by the pool initializer:
+_WORKER_TABLE = None
+
+
+def _init_worker(snt: "StandardNameTable"):
+    global _WORKER_TABLE
+    _WORKER_TABLE = snt
+
+
+def _resolve_chunk(names: List[str]) -> List[Union["StandardName", ResolutionFailure]]:
+    return [resolve(_WORKER_TABLE, name) for name in names]
+
+
+def resolve_parallel(snt: "StandardNameTable",
+                     names: List[str],
+                     workers: int) -> Dict[str, Union["StandardName", ResolutionFailure]]:
+    """Resolves the (unique) names in a process pool.
+
+    The table is transferred once to each worker process, which then resolves chunks of
+    names sharing its compiled grammar, indexes and caches.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    chunksize = max(1, math.ceil(len(names) / (workers * 4)))
+    chunks = [names[i:i + chunksize] for i in range(0, len(names), chunksize)]
+    resolved = {}
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(snt,)) as executor:
+        for chunk, results in zip(chunks, executor.map(_resolve_chunk, chunks)):
+            resolved.update(zip(chunk, results))
+    return resolved
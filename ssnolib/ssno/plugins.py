@@ -1,12 +1,10 @@
 import abc
 import logging
 import pathlib
-import warnings
-from typing import Dict, Union
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
 from ontolutils.ex.prov import Attribution
 
-from . import ScalarStandardName, VectorStandardName
 
 logger = logging.getLogger("ssnolib")
 
@@ -24,48 +22,105 @@ class TableReader(abc.ABC):
         """Parse the file"""
 
 
+def _local_name(tag: str) -> str:
+    """Returns the tag of an XML element without namespace"""
+    return tag.rsplit('}', 1)[-1]
+
+
+def _text(element) -> Optional[str]:
+    """Returns the stripped text of an XML element or None if it is empty"""
+    if element is None or element.text is None:
+        return None
+    return element.text.strip() or None
+
+
 class XMLReader(TableReader):
+    """Reader for XML tables like the CF standard name table.
+
+    The file is read with `xml.etree.ElementTree.iterparse`: each `<entry>` and `<alias>`
+    element is processed as soon as it has been read and cleared afterward, hence the
+    memory does not depend on the size of the file.
+    """
+
+    def iter_elements(self) -> Iterator[Tuple[str, "xml.etree.ElementTree.Element"]]:
+        """Yields (tag, element) of all children of the root element (e.g. "entry", "alias",
+        "version_number"). An element is cleared after the next one has been requested."""
+        import xml.etree.ElementTree as ET
+
+        depth = 0
+        root = None
+        for event, element in ET.iterparse(str(self.filename), events=('start', 'end')):
+            if event == 'start':
+                if root is None:
+                    root = element
+                depth += 1
+                continue
+            depth -= 1
+            if depth == 1:
+                yield _local_name(element.tag), element
+                element.clear()
+                # the root still references the cleared children:
+                root.clear()
 
     def parse(self, make_standard_names_lowercase: bool = False) -> Dict:
         """Parse the file"""
-        try:
-            import xmltodict
-        except ImportError:
-            raise ImportError('Package "xmltodict" is missing, but required to import from XML files.')
-
-        with open(str(self.filename), 'r', encoding='utf-8') as file:
-            my_xml = file.read()
-        xmldict = xmltodict.parse(my_xml)
-        _name = list(xmldict.keys())[0]
-
-        xmldata = xmldict[_name]
 
-        def _parse_standard_name(sndict):
-            unit = sndict.get('canonical_units', '')
+        def _parse_standard_name(element) -> Dict:
+            children = {_local_name(child.tag): _text(child) for child in element}
+            unit = children.get('canonical_units', '')
             if unit == '1':
                 unit = ''
             elif unit is None:
                 unit = ''
-            description = sndict.get('description', '')
+            description = children.get('description', '')
             if description is None:
                 description = ''
-            standard_name = sndict.get('@id')
+            standard_name = element.get('id')
             assert standard_name is not None, 'Expected key "@id" in the XML file.'
-            assert unit is not None, 'Expected key "canonical_units" in the XML file.'
-            assert description is not None, 'Expected key "description" in the XML file.'
             return dict(standardName=standard_name.lower() if make_standard_names_lowercase else standard_name,
                         unit=unit,
                         description=description)
 
-        version = xmldata.get('version', None)
+        header = {}
+        standard_names = []
+        aliases: Dict[str, List[str]] = {}  # alias -> standard names
+        for tag, element in self.iter_elements():
+            if tag == 'entry':
+                standard_names.append(_parse_standard_name(element))
+            elif tag == 'alias':
+                alias = element.get('id')
+                if alias is None:
+                    continue
+                entry_ids = [_text(child) for child in element if _local_name(child.tag) == 'entry_id']
+                if make_standard_names_lowercase:
+                    alias = alias.lower()
+                    entry_ids = [e.lower() for e in entry_ids if e]
+                aliases[alias] = [e for e in entry_ids if e]
+            else:
+                header.setdefault(tag, _text(element))
+
+        if not standard_names:
+            raise KeyError('Expected key "entry" in the XML file.')
+
+        # aliases are former names of standard names:
+        standard_names_dict = {sn['standardName']: sn for sn in standard_names}
+        for alias, entry_ids in aliases.items():
+            for entry_id in entry_ids:
+                sn = standard_names_dict.get(entry_id, None)
+                if sn is not None and 'alias' not in sn:
+                    sn['alias'] = dict(standardName=alias,
+                                       unit=sn['unit'],
+                                       description=f'Alias of the standard name "{entry_id}".')
+
+        version = header.get('version', None)
         if version is None:
-            version = xmldata.get('version_number', None)
+            version = header.get('version_number', None)
 
-        # last_modified = xmldata.get('last_modified', None)
+        # last_modified = header.get('last_modified', None)
 
-        contact = xmldata.get('contact', None)
-        institution = xmldata.get('institution', None)
-        if "@" in contact and institution is not None:
+        contact = header.get('contact', None)
+        institution = header.get('institution', None)
+        if contact is not None and "@" in contact and institution is not None:
             # it is an email address
             from ontolutils.ex.prov import Organization
             org = Organization(mbox=contact, name=institution)
@@ -77,26 +132,13 @@ class XMLReader(TableReader):
 
             # else cannot be parsed
 
-        sn_data = xmldata.get('entry', None)
-        if sn_data is None:
-            raise KeyError('Expected key "entry" in the XML file.')
         data = {
-            'standard_name': [_parse_standard_name(sn) for sn in sn_data],
             'version': version,
             # 'modified': last_modified,
-            'qualifiedAttribution': agent
+            'qualifiedAttribution': agent,
+            'title': header.get('title', None) or self.filename.stem,
+            'standardNames': standard_names
         }
-
-        if 'title' not in xmldata:
-            data['title'] = self.filename.stem
-
-        sndata = data.pop('standard_name')
-        for sn in sndata:
-            if sn['description'] is None:
-                name = sn['standard_name']
-                warnings.warn(f'Description of "{name}" is None. Setting to empty string.', UserWarning)
-                sn['description'] = ""
-        data['standardNames'] = sndata
         return data
 
 
@@ -108,26 +150,22 @@ class YAMLReader(TableReader):
         except ImportError as e:
             raise ImportError('Package "pyyaml" is missing, but required to import from YAML files.') from e
 
+        # the C implementation of libyaml is much faster, but not available in all installations:
+        loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
         with open(self.filename, 'r') as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=loader)
         standardNames = data.get('standardNames', data.get("standard_names", {}))
 
-        def _parse_standard_names(name, sndata: Dict):
+        def _parse_standard_names(name, sndata: Dict) -> Dict:
+            """Returns the record of a standard name, see `build_standard_names`"""
+            record = {'standardName': name, 'kind': 'vector' if 'vector' in sndata else 'scalar'}
             for ustr in ('unit', 'units', 'canonical_unit', 'canonicalUnits'):
                 if ustr in sndata:
-                    sndata['unit'] = sndata.pop(ustr)
+                    record['unit'] = sndata[ustr]
                     break
-            _data = {
-                'standard_name': name,
-                **sndata
-            }
-            is_vector = 'vector' in _data
-            for k in list(_data.keys()):
-                if k not in ('unit', 'description', 'standard_name'):
-                    _data.pop(k)
-            if is_vector:
-                return VectorStandardName(**_data)
-            return ScalarStandardName(**_data)
+            if 'description' in sndata:
+                record['description'] = sndata['description']
+            return record
 
         qualifiedAttribution = data.get('creator', None)
         # make the orcid id the ID of the creator:
@@ -209,7 +247,9 @@ class JSONLDReader(TableReader):
             else:
                 data = _data
             snt = StandardNameTable.from_jsonld(data=data, limit=1)
-            return snt.model_dump(exclude_none=True)
+            # return the validated objects. Dumping them would let `StandardNameTable.parse`
+            # validate and build all of them a second time:
+            return {field: value for field, value in snt if value is not None}
 
 
 _plugins = {
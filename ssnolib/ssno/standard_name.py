@@ -1,8 +1,7 @@
 import re
 import warnings
-from typing import Union, List, Optional
+from typing import Callable, Dict, Iterable, Union, List, Optional
 
-import pint.errors
 from ontolutils import namespaces, urirefs, LangString
 from ontolutils.ex.dcat import Dataset
 from ontolutils.ex.skos import Concept
@@ -12,7 +11,7 @@ from pydantic import ValidationError
 from pydantic_core import InitErrorDetails
 
 from ssnolib import config
-from .unit_utils import _parse_unit, _format_unit
+from .unit_utils import get_qudt_unit_index
 
 
 @namespaces(ssno="https://matthiasprobst.github.io/ssno#",
@@ -63,6 +62,8 @@ class StandardName(Concept):
             if alias.startswith('_:'):
                 return str(alias)
             return HttpUrl(alias)
+        elif isinstance(alias, dict):
+            return StandardName(**alias)
         elif not isinstance(alias, StandardName):
             raise TypeError(f"Expected a StandardName, got {type(alias)}")
         return alias
@@ -88,36 +89,46 @@ class StandardName(Concept):
     @field_validator("unit", mode='before')
     @classmethod
     def _parse_unit(cls, unit: Union[HttpUrl, str], cfg) -> str:
-        """Parse the unit and return the unit as string."""
+        """Parse the unit and return the unit as string.
+
+        If the validation context has a "units" dictionary (see `build_standard_names`), it is
+        used as cache of the validated units, so that each unit is validated only once.
+        """
+        units = cfg.context.get("units", None) if isinstance(cfg.context, dict) else None
+        if units is not None:
+            try:
+                return units[unit]
+            except (KeyError, TypeError):
+                pass
+        validated_unit = cls._validate_unit(unit, cfg)
+        if units is not None:
+            try:
+                units[unit] = validated_unit
+            except TypeError:
+                pass  # not hashable
+        return validated_unit
+
+    @classmethod
+    def _validate_unit(cls, unit: Union[HttpUrl, str], cfg) -> str:
         if unit is None or unit in ('', '1', '-', 1):
             return str(qudt_lookup['dimensionless'])
         if isinstance(unit, str):
             if unit.startswith('http'):
                 return str(HttpUrl(unit))
-            err = False
-            try:
-                return str(qudt_lookup[unit.strip()])
-            except KeyError:
-                err = True
-
-            try:
-                _unit = _format_unit(str(_parse_unit(unit.strip())))
-                return str(qudt_lookup[_unit])
-            except (AttributeError, KeyError, pint.errors.DimensionalityError) as _:
-                err = True
-
-            if err:
-                if config.raise_error_on_unparsable_unit:
-                    err = InitErrorDetails(
-                        type="value_error",
-                        loc=("unit",),
-                        input=unit,
-                        ctx={"error": f'your_message Unable to parse: "{unit}" of standard name '
-                                      f'"{cfg.data["standardName"]}"', }
-                    )
-                    raise ValidationError.from_exception_data(title=cls.__name__, line_errors=[err, ])
-                else:
-                    warnings.warn(f'Could not parse unit: "{unit}".', UserWarning)
+            iri = get_qudt_unit_index().resolve(unit)
+            if iri is not None:
+                return iri
+            if config.raise_error_on_unparsable_unit:
+                err = InitErrorDetails(
+                    type="value_error",
+                    loc=("unit",),
+                    input=unit,
+                    ctx={"error": f'your_message Unable to parse: "{unit}" of standard name '
+                                  f'"{cfg.data["standardName"]}"', }
+                )
+                raise ValidationError.from_exception_data(title=cls.__name__, line_errors=[err, ])
+            else:
+                warnings.warn(f'Could not parse unit: "{unit}".', UserWarning)
             return str(unit)
         return str(HttpUrl(unit))
 
@@ -141,3 +152,50 @@ class ScalarStandardName(StandardName):
 @urirefs(VectorStandardName='ssno:VectorStandardName')
 class VectorStandardName(StandardName):
     pass
+
+
+_STANDARD_NAME_KINDS = {
+    None: StandardName,
+    "scalar": ScalarStandardName,
+    "vector": VectorStandardName,
+}
+
+
+def build_standard_names(records: Iterable[Union[Dict, StandardName]],
+                         on_error: Optional[Callable[[Dict, ValidationError], None]] = None
+                         ) -> List[StandardName]:
+    """Builds standard names from plain records, e.g. the output of a table reader.
+
+    A record is a dictionary with the fields of a standard name (e.g. "standardName", "unit" and
+    "description") and an optional "kind" ("scalar" or "vector") selecting the class. Standard
+    name objects are passed through. Each unique unit is validated (and looked up in the QUDT
+    index) only once for all records.
+
+    Parameters
+    ----------
+    records: Iterable[Union[Dict, StandardName]]
+        The records.
+    on_error: Optional[Callable[[Dict, ValidationError], None]]
+        Called with the record and the error if a record is invalid. The record is skipped.
+        If not given, the error is raised.
+
+    Returns
+    -------
+    List[StandardName]
+        The standard names in the order of the records.
+    """
+    context = {"units": {}}
+    standard_names = []
+    for record in records:
+        if isinstance(record, StandardName):
+            standard_names.append(record)
+            continue
+        data = dict(record)
+        cls = _STANDARD_NAME_KINDS[data.pop("kind", None)]
+        try:
+            standard_names.append(cls.model_validate(data, context=context))
+        except ValidationError as e:
+            if on_error is None:
+                raise
+            on_error(record, e)
+    return standard_names
@@ -1,11 +1,16 @@
 import enum
+import hashlib
+import io
 import json
+import os
 import pathlib
+import pickle
 import re
+import uuid
 import warnings
 from dataclasses import make_dataclass
 from datetime import datetime
-from typing import List, Union, Dict, Optional, Tuple
+from typing import List, Union, Dict, Optional, Tuple, Iterable, Iterator
 
 import rdflib
 from dateutil.parser import parse
@@ -17,16 +22,19 @@ from ontolutils.ex.qudt.utils import iri2str
 from ontolutils.ex.skos import Concept, ConceptScheme
 from ontolutils.namespacelib.m4i import M4I
 from ontolutils.typing import ResourceType, NoneBlankNodeType
-from pydantic import field_validator, Field, HttpUrl, ValidationError, AnyUrl
+from pydantic import field_validator, Field, HttpUrl, ValidationError, AnyUrl, PrivateAttr
 from rdflib import URIRef
 
-from ssnolib import config
+from ssnolib import config, resolution
+from ssnolib._version import __version__
+from ssnolib.cache import LRUCache, CacheInfo, VersionedList
+from ssnolib.grammar import QualificationGrammar, CoreNameTrie, StandardNameMatcher, NameParse
 from ssnolib.namespace import SSNO
 from ssnolib.sparql_utils import build_simple_sparql_query, WHERE
-from ssnolib.utils import parse_and_exclude_none, download_file
+from ssnolib.utils import parse_and_exclude_none, download_file, get_cache_dir
 from . import plugins
-from .standard_name import StandardName, VectorStandardName, ScalarStandardName
-from .unit_utils import _parse_unit, reverse_qudt_lookup, _format_unit
+from .standard_name import StandardName, VectorStandardName, ScalarStandardName, build_standard_names
+from .unit_utils import _parse_unit, reverse_qudt_lookup, _format_unit, get_qudt_unit_index
 
 MAX_ITER = 1000
 __this_dir__ = pathlib.Path(__file__).parent
@@ -50,7 +58,20 @@ ROLE_LOOKUP: Dict[str, str] = {
 
 ROLE2IRI = {v.lower().replace(" ", ""): k for k, v in ROLE_LOOKUP.items()}
 
-_CACHE_VALID_STANDARD_NAMES = {}
+# fields of a StandardNameTable from which the cached lookup structures are derived:
+_CACHE_RELEVANT_FIELDS = ('standardNames', 'hasModifier', 'hasDomainConceptSet')
+_SNAPSHOT_MAGIC = b"SSNO-SNT-SNAPSHOT "  # followed by the version of ssnolib, the snapshot format and a newline
+# version of the content of snapshots. Increase it whenever the pickled state of a table changes:
+_SNAPSHOT_FORMAT = "2"
+# settings of ssnolib.config changing the table parsed from a source. They are part of the snapshot key:
+_SNAPSHOT_CONFIG = ('standard_name_core_pattern', 'raise_error_on_unparsable_unit')
+
+
+def _get_list_token(standard_names: Optional[VersionedList]) -> Optional[Tuple[int, int]]:
+    """Returns the token identifying the state of the list of standard names"""
+    if standard_names is None:
+        return None
+    return id(standard_names), standard_names.version
 
 
 def _parse_id(_id):
@@ -337,6 +358,18 @@ class StandardNameTable(ConceptScheme):
         default=None,
         alias="standard_name_table_used_by"
     )
+    _qualification_grammar: Optional[QualificationGrammar] = PrivateAttr(default=None)
+    _standard_name_index: Optional[Dict[str, StandardName]] = PrivateAttr(default=None)
+    _standard_name_index_token: Optional[Tuple[int, int]] = PrivateAttr(default=None)
+    _core_name_trie: Optional[CoreNameTrie] = PrivateAttr(default=None)
+    _matcher: Optional[StandardNameMatcher] = PrivateAttr(default=None)
+    _derived_name_cache: LRUCache = PrivateAttr(
+        default_factory=lambda: LRUCache(maxsize=config.standard_name_cache_size)
+    )
+    _unresolvable_name_cache: LRUCache = PrivateAttr(
+        default_factory=lambda: LRUCache(maxsize=config.unresolvable_name_cache_size)
+    )
+    _entry_hashes: Optional[Dict[str, str]] = PrivateAttr(default=None)
 
     def __str__(self) -> str:
         if self.identifier:
@@ -345,6 +378,117 @@ class StandardNameTable(ConceptScheme):
             return str(self.title)
         return ''
 
+    def model_post_init(self, __context):
+        # tables built by `model_construct` (e.g. from snapshots) skip the validators:
+        self._get_standard_names()
+
+    def __copy__(self):
+        copied = super().__copy__()
+        # the (shallow) copy must not share the lookup structures and caches, which are changed in
+        # place: otherwise, names resolved (or not) after changing the copy would leak into this table
+        copied._qualification_grammar = None
+        copied._standard_name_index = None
+        copied._standard_name_index_token = None
+        copied._core_name_trie = None
+        copied._matcher = None
+        copied._derived_name_cache = LRUCache(maxsize=self._derived_name_cache.maxsize)
+        copied._unresolvable_name_cache = LRUCache(maxsize=self._unresolvable_name_cache.maxsize)
+        if self._entry_hashes is not None:
+            copied._entry_hashes = dict(self._entry_hashes)
+        return copied
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in _CACHE_RELEVANT_FIELDS:
+            self.invalidate_caches()
+        if name == 'standardNames':
+            # the standard names may no longer be the ones built from the entries of the reloaded source:
+            self._entry_hashes = None
+
+    def invalidate_caches(self):
+        """Discards all lookup structures derived from the standard names and modifiers.
+
+        Caches are invalidated automatically when `standardNames`, `hasModifier` or
+        `hasDomainConceptSet` are (re-)assigned. Call this method after changing
+        objects of these lists in place, e.g. the valid values of a qualification.
+        """
+        self._qualification_grammar = None
+        self._standard_name_index = None
+        self._core_name_trie = None
+        self._matcher = None
+        self._derived_name_cache.clear()
+        self._unresolvable_name_cache.clear()
+
+    def cache_info(self) -> Dict[str, CacheInfo]:
+        """Returns the statistics (hits, misses, evictions, maximal and current size) of the cache
+        of derived standard names ("derived") and of the names which could not be resolved
+        ("unresolvable"). The sizes are set by `config.standard_name_cache_size` and
+        `config.unresolvable_name_cache_size`."""
+        return {"derived": self._derived_name_cache.info(),
+                "unresolvable": self._unresolvable_name_cache.info()}
+
+    def _get_standard_name_index(self) -> Dict[str, StandardName]:
+        """Returns the index mapping the string of each core standard name to its object.
+
+        The index is kept in sync by `append` and `add_new_standard_name` and rebuilt if
+        the list of standard names is replaced or changed in place. As the core standard
+        names may have been removed, the derived standard names are discarded then, too.
+        """
+        standard_names = self._get_standard_names()
+        token = _get_list_token(standard_names)
+        if self._standard_name_index is None or self._standard_name_index_token != token:
+            index = {}
+            for sn in standard_names or []:
+                index.setdefault(sn.standardName, sn)
+            self._standard_name_index = index
+            self._standard_name_index_token = token
+            self._core_name_trie = None
+            self._matcher = None
+            self._derived_name_cache.clear()
+            self._unresolvable_name_cache.clear()
+        return self._standard_name_index
+
+    def _get_standard_names(self) -> Optional[VersionedList]:
+        """Returns the list of standard names. A list, which has not been validated (e.g. set with
+        `model_construct`), is replaced by a VersionedList, so that its in-place changes are counted."""
+        standard_names = self.__dict__.get("standardNames", None)
+        if standard_names is not None and not isinstance(standard_names, VersionedList):
+            standard_names = VersionedList(standard_names)
+            self.__dict__["standardNames"] = standard_names
+        return standard_names
+
+    def _get_core_name_trie(self) -> CoreNameTrie:
+        """Returns the trie used to find the core standard names within a derived standard name"""
+        index = self._get_standard_name_index()
+        if self._core_name_trie is None:
+            self._core_name_trie = CoreNameTrie(index)
+        return self._core_name_trie
+
+    def _resolve_qualified_name(self, standard_name: str) -> Optional[Tuple[StandardName, Tuple[Optional[str], ...]]]:
+        """Finds the core standard name and the qualification phrases a standard name is built of.
+
+        All core standard names contained in the name are tested (longest first) against the
+        qualification grammar. A VectorQualification can only qualify a VectorStandardName.
+
+        Returns
+        -------
+        Optional[Tuple[StandardName, Tuple[Optional[str], ...]]]
+            The core standard name and the matched phrase per qualification of the grammar or
+            None, if the name cannot be built from the qualifications.
+        """
+        index = self._get_standard_name_index()
+        grammar = self.get_qualification_grammar()
+        for core_standard_name in self._get_core_name_trie().find(standard_name):
+            groups = grammar.match(standard_name, core_standard_name)
+            if groups is None:
+                continue
+            core = index[core_standard_name]
+            if not isinstance(core, VectorStandardName) and any(
+                    g and isinstance(q, VectorQualification) for g, q in zip(groups, grammar.qualifications)):
+                continue
+            return core, groups
+        return None
+
     @field_validator('created', mode='before')
     @classmethod
     def _created(cls, created):
@@ -464,6 +608,14 @@ class StandardNameTable(ConceptScheme):
 
         return [_parseStandardNameType(sn) for sn in _standardNames]
 
+    @field_validator('standardNames', mode='after')
+    @classmethod
+    def _track_standard_names(cls, standardNames: Optional[List[StandardName]]) -> Optional[List[StandardName]]:
+        # count in-place changes of the list, which the standard name index must follow:
+        if standardNames is None:
+            return None
+        return VersionedList(standardNames)
+
     @field_validator('hasDomainConceptSet', mode='before')
     @classmethod
     def _check(cls, hasDomainConceptSet: List[DomainConceptSet]) -> List[DomainConceptSet]:
@@ -478,13 +630,29 @@ class StandardNameTable(ConceptScheme):
         return str(subject)
 
     def append(self, field_name: str, field):
-        self.__pydantic_validator__.validate_assignment(self.model_construct(), field_name, field)
+        validated = self.__pydantic_validator__.validate_assignment(self.model_construct(), field_name, field)
         obj = getattr(self, field_name)
         if obj is None:
             setattr(self, field_name, [field, ])
             return
         if not isinstance(obj, list):
             raise TypeError("Can only append to list objects.")
+        if field_name == 'standardNames':
+            # the new standard names are validated already. Avoid re-validating the whole list
+            # and update the index instead of rebuilding it:
+            index = self._get_standard_name_index()
+            obj = self._get_standard_names()
+            new_standard_names = getattr(validated, field_name)
+            obj.extend(new_standard_names)
+            for sn in new_standard_names:
+                index.setdefault(sn.standardName, sn)
+                if self._core_name_trie is not None:
+                    self._core_name_trie.add(sn.standardName)
+            self._standard_name_index_token = _get_list_token(obj)
+            # names which could not be resolved so far may be valid now:
+            self._unresolvable_name_cache.clear()
+            self._matcher = None
+            return
         obj.append(field)
         setattr(self, field_name, obj)
 
@@ -515,7 +683,7 @@ class StandardNameTable(ConceptScheme):
 
         original_qudt_lookup = qudt_units.qudt_lookup
         if qudt_lookup:
-            qudt_units.qudt_lookup.update(qudt_lookup)
+            get_qudt_unit_index().update(qudt_lookup)
 
         if isinstance(source, (str, pathlib.Path)):
             filename = source
@@ -533,21 +701,184 @@ class StandardNameTable(ConceptScheme):
                 'You may overwrite this by providing the parameter fmt'
             )
 
+        snapshot_filename = None
+        if config.use_snapshots:
+            snapshot_filename = _get_snapshot_filename(pathlib.Path(filename), cls, fmt, sorted(kwargs.items()),
+                                                       sorted((qudt_lookup or {}).items()))
+            snt = _load_snapshot(cls, snapshot_filename)
+            if snt is not None:
+                return snt
+
         data: Dict = reader(filename).parse(**kwargs)
 
-        # unfortunately, we need to remove all units which we could not parse...
-        standardNames = []
-        for sn in data["standardNames"].copy():
-            try:
-                if isinstance(sn, dict):
-                    standardNames.append(StandardName(**sn))
-                else:
-                    standardNames.append(sn)
-            except ValidationError as e:
-                warnings.warn(f"Could not parse {sn}. {e}", UserWarning)
-        data["standardNames"] = standardNames
+        # unfortunately, we need to remove all standard names which we could not parse (e.g. because
+        # of the unit). They are reported together:
+        errors = []
+        data["standardNames"] = build_standard_names(
+            data["standardNames"],
+            on_error=lambda sn, e: errors.append(f"Could not parse {sn}. {e}")
+        )
+        if errors:
+            warnings.warn(f"{len(errors)} standard name(s) could not be parsed and are skipped:\n"
+                          + "\n".join(errors), UserWarning)
         qudt_units.qudt_lookup = original_qudt_lookup
-        return cls(**data)
+        snt = cls(**data)
+        if snapshot_filename is not None:
+            _save_snapshot(snt, snapshot_filename)
+        return snt
+
+    def reload(self,
+               source: Union[str, pathlib.Path],
+               fmt: Optional[str] = None,
+               **kwargs) -> Dict[str, Dict[str, List[str]]]:
+        """Updates the standard names and modifiers of the table from an (edited) source.
+
+        Instead of parsing the whole source again, its entries are compared with the loaded ones
+        by content hashes. Only added and changed standard names are built and unchanged ones keep
+        their objects. The lookup structures are updated selectively, e.g. only the derived standard
+        names built from a changed or removed standard name are discarded. All other metadata of
+        the table is kept.
+
+        The hashes of the entries of the source are stored with every reload. If the table was not
+        loaded by `reload` before, the standard names are built and compared by their content.
+
+        Parameters
+        ----------
+        source: Union[str, pathlib.Path]
+            The filename of the source.
+        fmt: Optional[str]=None
+            The format of the source. If not provided, the format is determined from the suffix of the
+            source. The standard names of JSON-LD sources are read without building an RDF graph and
+            only the rest of the document is parsed.
+        kwargs
+            Additional keyword arguments passed to the reader plugin.
+
+        Returns
+        -------
+        Dict[str, Dict[str, List[str]]]
+            The names of the "added", "removed" and "changed" entries of "standardNames" and "hasModifier".
+        """
+        records, modifiers = _read_table_entries(source, fmt, **kwargs)
+
+        old_standard_names = {}
+        for sn in self.standardNames or []:
+            old_standard_names.setdefault(sn.standardName, sn)
+        entry_hashes = self._entry_hashes or {}
+        new_entry_hashes = {}
+        standard_names = []
+        pending = {}  # position -> record to build
+        for record in records:
+            name = record.standardName if isinstance(record, StandardName) else record.get("standardName")
+            entry_hash = _get_entry_hash(record)
+            old = old_standard_names.get(name, None)
+            if old is not None and entry_hashes.get(name, None) == entry_hash:
+                standard_names.append(old)
+            else:
+                pending[len(standard_names)] = record
+                standard_names.append(None)
+            new_entry_hashes.setdefault(name, entry_hash)
+
+        errors = []
+        failed = set()
+
+        def _on_error(record, e):
+            failed.add(id(record))
+            errors.append(f"Could not parse {record}. {e}")
+
+        built = iter(build_standard_names(pending.values(), on_error=_on_error))
+        for position, record in pending.items():
+            if id(record) in failed:
+                continue
+            sn = next(built)
+            old = old_standard_names.get(sn.standardName, None)
+            if old is not None and sn.standardName not in entry_hashes and _get_entry_hash(old) == _get_entry_hash(sn):
+                sn = old
+            standard_names[position] = sn
+        if errors:
+            warnings.warn(f"{len(errors)} standard name(s) could not be parsed and are skipped:\n"
+                          + "\n".join(errors), UserWarning)
+        standard_names = [sn for sn in standard_names if sn is not None]
+
+        new_names = set()
+        added, changed, changed_kind = [], [], []
+        for sn in standard_names:
+            name = sn.standardName
+            if name in new_names:
+                continue
+            new_names.add(name)
+            old = old_standard_names.get(name, None)
+            if old is None:
+                added.append(name)
+            elif old is not sn:
+                changed.append(name)
+                if isinstance(old, VectorStandardName) != isinstance(sn, VectorStandardName):
+                    changed_kind.append(name)
+        removed = [name for name in old_standard_names if name not in new_names]
+
+        if self.standardNames is None:
+            self.standardNames = standard_names
+        else:
+            # replace the content of the list, hence the lookup structures are not discarded:
+            self._get_standard_names()[:] = standard_names
+            self._update_caches(added, removed, changed, changed_kind)
+        self._entry_hashes = {name: h for name, h in new_entry_hashes.items() if name in new_names}
+
+        modifier_changes = {"added": [], "removed": [], "changed": []}
+        if modifiers is not None:
+            old_modifiers = {str(m.name): m for m in self.hasModifier or []}
+            new_modifiers = []
+            for m in modifiers:
+                old = old_modifiers.get(str(m.name), None)
+                if old is None:
+                    modifier_changes["added"].append(str(m.name))
+                elif _get_entry_hash(old) == _get_entry_hash(m):
+                    m = old
+                else:
+                    modifier_changes["changed"].append(str(m.name))
+                new_modifiers.append(m)
+            new_modifier_names = {str(m.name) for m in new_modifiers}
+            modifier_changes["removed"] = [name for name in old_modifiers if name not in new_modifier_names]
+            # the order of the modifiers is not relevant (and not preserved by RDF):
+            if {id(m) for m in new_modifiers} != {id(m) for m in self.hasModifier or []}:
+                # the qualification grammar and all names derived from it must be rebuilt:
+                self.hasModifier = new_modifiers or None
+        return {"standardNames": {"added": added, "removed": removed, "changed": changed},
+                "hasModifier": modifier_changes}
+
+    def _update_caches(self, added: List[str], removed: List[str], changed: List[str], changed_kind: List[str]):
+        """Updates the lookup structures after standard names have been added, removed or changed in place"""
+        standard_names = self._get_standard_names()
+        if self._standard_name_index is not None:
+            index = self._standard_name_index
+            for name in removed:
+                index.pop(name, None)
+            updated = set(added) | set(changed)
+            if updated:
+                for sn in standard_names:
+                    if sn.standardName in updated and index.get(sn.standardName, None) is not sn:
+                        index[sn.standardName] = sn
+                        updated.discard(sn.standardName)
+            self._standard_name_index_token = _get_list_token(standard_names)
+        if removed:
+            self._core_name_trie = None
+        elif self._core_name_trie is not None:
+            for name in added:
+                self._core_name_trie.add(name)
+        if added or removed or changed_kind:
+            self._matcher = None
+
+        # derived names contain their core standard names. A new standard name may be the core of
+        # a derived name, too:
+        affected = added + removed + changed
+        for derived_name in self._derived_name_cache.keys():
+            if any(_contains_name(derived_name, name) for name in affected):
+                self._derived_name_cache.pop(derived_name)
+        # names could not be resolved without the added standard names (or e.g. because a scalar
+        # standard name was qualified with a vector qualification):
+        affected = added + changed_kind
+        for unresolvable_name in self._unresolvable_name_cache.keys():
+            if any(_contains_name(unresolvable_name, name) for name in affected):
+                self._unresolvable_name_cache.pop(unresolvable_name)
 
     def verify_name(self, standard_name: str):
         """Verifies a string standard name. Focuses on verifying a string representation of a standard name.
@@ -563,39 +894,10 @@ class StandardNameTable(ConceptScheme):
         if self.standardNames is None:
             return False  # no standard names exist!
 
-        standard_name_dict = {sn.standardName: sn for sn in self.standardNames}
-
-        str_standard_names = list(standard_name_dict.keys())
-
-        if standard_name in str_standard_names:
+        if standard_name in self._get_standard_name_index():
             return True
 
-        hasModifier = self.hasModifier or []
-        qdict = {q.id: q for q in hasModifier if isinstance(q, Qualification)}
-        regex_pattern, qualifications = self.get_qualification_regex()
-
-        for existing_standard_name in str_standard_names:
-
-            if existing_standard_name in standard_name:
-                # found a corresponding core standard name. replace it in regex pattern:
-                pattern = rf'{regex_pattern.replace("standard_name", existing_standard_name)}'
-
-                if re.match(pattern, standard_name):
-                    groups = re.match(pattern, standard_name).groups()
-                    qs = [qdict[qid] for qid in qualifications]
-                    for g, q in zip(groups, qs):
-                        if g:
-                            if isinstance(q, VectorQualification):
-                                # A VectorQualification can only qualify a VectorStandardName:
-                                if not isinstance(standard_name_dict[existing_standard_name], VectorStandardName):
-                                    return False
-
-                            for s in self.standardNames:
-                                if s.standardName == existing_standard_name:
-                                    break
-                    return True
-                return False
-        return False
+        return self._resolve_qualified_name(standard_name) is not None
 
     def verify(self, standard_name: StandardName):
         """Verifies a string standard name. Verifies a StandardName object, including its unit.
@@ -604,26 +906,82 @@ class StandardNameTable(ConceptScheme):
         if not re.match(config.standard_name_core_pattern, standard_name.standardName):
             print("General pattern not matched. Must be lowercase and parts may be separated by '_'.")
             return False
-        str_standard_names = [sn.standardName for sn in self.standardNames]
         str_standard_name = standard_name.standardName
-        if str_standard_name in str_standard_names:
+        if str_standard_name in self._get_standard_name_index():
             return True
-        regex_pattern, _ = self.get_qualification_regex()
-        for existing_standard_name in str_standard_names:
-            if existing_standard_name in str_standard_name:
-                reference_canonical_units = self.get_standard_name(existing_standard_name).unit
-                if standard_name.unit != reference_canonical_units:
-                    raise ValueError("Canonical units do not match the reference standard name.")
-                # found a corresponding core standard name. replace it in regex pattern:
-                pattern = rf'{regex_pattern.replace("standard_name", existing_standard_name)}'
-
-                if re.match(pattern, str_standard_name):
-                    return True
-                return False
-        return False
+        resolved = self._resolve_qualified_name(str_standard_name)
+        if resolved is None:
+            return False
+        core_standard_name, _ = resolved
+        if standard_name.unit != core_standard_name.unit:
+            raise ValueError("Canonical units do not match the reference standard name.")
+        return True
+
+    def verify_many(self, names: Iterable[str], units: Iterable[Optional[str]]) -> Tuple["np.ndarray", "np.ndarray"]:
+        """Verifies many pairs of string standard names and units, e.g. the columns of a catalogue.
+
+        In contrast to `verify`, no StandardName objects are needed, no error is raised and units
+        only need to be dimensionally compatible with the unit of the standard name, e.g. "mm/s"
+        is accepted for "velocity" with unit "m/s". Every unique name is resolved once and every
+        unique unit is parsed once.
+
+        Parameters
+        ----------
+        names: Iterable[str]
+            The string standard names. May be a list, numpy array or pandas Series.
+        units: Iterable[Optional[str]]
+            The units (symbols or QUDT IRIs) of the same length as `names`. Missing units
+            (None, "", NaN) are dimensionless.
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            A boolean array, which is True for valid rows, and an array with the reason per row,
+            one of the codes of `ssnolib.resolution`: OK, INVALID_PATTERN, NOT_FOUND, ERROR,
+            INVALID_UNIT or INCOMPATIBLE_UNIT.
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError('Package "numpy" is required for this function.')
+        from .unit_utils import _get_dimensionality
+
+        names = list(names)
+        units = [None if unit is None or unit != unit else str(unit) for unit in units]  # unit != unit for NaN
+        if len(names) != len(units):
+            raise ValueError(f"names and units must have the same length, got {len(names)} and {len(units)}.")
+
+        resolved = {}
+        reasons = {}
+        for name, unit in zip(names, units):
+            if (name, unit) in reasons:
+                continue
+            if not isinstance(name, str):
+                reasons[(name, unit)] = resolution.INVALID_PATTERN
+                continue
+            standard_name = resolved.get(name, None)
+            if standard_name is None:
+                standard_name = resolved[name] = resolution.resolve(self, name)
+            if not standard_name:
+                reasons[(name, unit)] = standard_name.reason
+                continue
+            dimensionality = _get_dimensionality(unit)
+            if dimensionality is None:
+                reasons[(name, unit)] = resolution.INVALID_UNIT
+                continue
+            reference_dimensionality = _get_dimensionality(str(standard_name.unit))
+            if reference_dimensionality is None:
+                reasons[(name, unit)] = resolution.ERROR
+            elif dimensionality != reference_dimensionality:
+                reasons[(name, unit)] = resolution.INCOMPATIBLE_UNIT
+            else:
+                reasons[(name, unit)] = resolution.OK
+
+        row_reasons = np.array([reasons[(name, unit)] for name, unit in zip(names, units)], dtype=object)
+        return row_reasons == resolution.OK, row_reasons
 
     def get_standard_name_dict(self) -> Dict[str, StandardName]:
-        return {sn.standardName: sn for sn in self.standardNames}
+        return dict(self._get_standard_name_index())
 
     def get_standard_names_as_frozen_dataclass(self):
         """Returns a frozen dataclass with the standard names as attributes."""
@@ -631,8 +989,21 @@ class StandardNameTable(ConceptScheme):
         s = make_dataclass("StandardNames", [(k, type(v)) for k, v in sn_dict.items()], frozen=True)
         return s(**sn_dict)
 
-    def _get_by_transformation(self, standard_name: str) -> Union[StandardName, None]:
-        matches, found_transformation = check_if_standard_name_can_be_build_with_transformation(standard_name, self)
+    def _resolve_parse(self, parse: NameParse) -> Union[StandardName, None]:
+        """Returns the standard name of a parse of the matcher without parsing the name again"""
+        sn = self._get_standard_name_index().get(parse.standard_name, None)
+        if sn is None:
+            sn = self._derived_name_cache.get(parse.standard_name)
+        if sn is not None:
+            return sn
+        if parse.transformation is None:
+            return self._get_by_qualification(parse.standard_name)
+        return self._get_by_transformation(parse.standard_name, parse)
+
+    def _get_by_transformation(self, standard_name: str, parse: Optional[NameParse] = None) -> Union[
+        StandardName, None]:
+        matches, found_transformation = check_if_standard_name_can_be_build_with_transformation(standard_name, self,
+                                                                                               parse)
         if found_transformation is not None:
             descriptions = []
             for m in matches:
@@ -661,17 +1032,124 @@ class StandardNameTable(ConceptScheme):
                 standard_name_table=self.id
             )
 
-            _cache_valid_standard_name(self, valid_standard_name)
+            self._derived_name_cache.put(standard_name, valid_standard_name)
             return valid_standard_name
 
     def get_standard_name(self, standard_name: str) -> Union[StandardName, None]:
-        cached_name = _get_cached_name(self, standard_name)
+        core_standard_name = self._get_standard_name_index().get(standard_name, None)
+        if core_standard_name is not None:
+            return core_standard_name
+        cached_name = self._derived_name_cache.get(standard_name)
         if cached_name is not None:
             return cached_name
+        if self._unresolvable_name_cache.get(standard_name, False):
+            return None
         is_sn_by_qualification = self._get_by_qualification(standard_name)
         if is_sn_by_qualification is not None:
             return is_sn_by_qualification
-        return self._get_by_transformation(standard_name)
+        sn_by_transformation = self._get_by_transformation(standard_name)
+        if sn_by_transformation is None:
+            self._unresolvable_name_cache.put(standard_name, True)
+        return sn_by_transformation
+
+    def iter_valid_names(self, max_transform_depth: int = 1) -> Iterator[str]:
+        """Lazily yields all standard names which can be constructed from the core standard names,
+        qualifications and transformations of the table.
+
+        Parameters
+        ----------
+        max_transform_depth: int=1
+            Maximal nesting depth of transformations, e.g. "mean_of_derivative_of_X_wrt_Y" has depth 2.
+            0 yields only the (qualified) core standard names.
+
+        Returns
+        -------
+        Iterator[str]
+            The valid standard names. The names are generated one by one and not stored.
+        """
+        return self.matcher.iter_names(max_transform_depth)
+
+    def count_valid_names(self, max_transform_depth: int = 1) -> int:
+        """Returns the number of names yielded by `iter_valid_names` without enumerating them"""
+        return self.matcher.count_names(max_transform_depth)
+
+    def complete(self, prefix: str, limit: int = 20, max_transform_depth: int = 1) -> List[str]:
+        """Returns up to `limit` valid standard names starting with `prefix`, e.g. to autocomplete
+        user input. Qualified core standard names are returned before transformed names.
+
+        Parameters
+        ----------
+        prefix: str
+            The beginning of the standard name.
+        limit: int=20
+            Maximal number of names to return.
+        max_transform_depth: int=1
+            Maximal nesting depth of transformations.
+
+        Returns
+        -------
+        List[str]
+            The completed standard names.
+        """
+        return self.matcher.complete(prefix, limit=limit, max_depth=max_transform_depth)
+
+    def suggest(self, standard_name: str, k: int = 5, max_distance: int = 2) -> List[str]:
+        """Returns up to k valid standard names close to the given (invalid) name, e.g. to
+        propose corrections of typos. The closest names (by edit distance) are returned first.
+
+        Parameters
+        ----------
+        standard_name: str
+            The standard name, e.g. one for which `verify_name` failed.
+        k: int=5
+            Maximal number of suggestions.
+        max_distance: int=2
+            Maximal edit distance per word of the name (and of a core standard name to the whole name).
+
+        Returns
+        -------
+        List[str]
+            The suggested standard names.
+        """
+        return self.matcher.suggest(standard_name, k=k, max_distance=max_distance)
+
+    def resolve_many(self,
+                     names: Iterable[str],
+                     *,
+                     workers: Optional[int] = None,
+                     return_errors: bool = True) -> List[Union[StandardName, resolution.ResolutionFailure, None]]:
+        """Resolves many string standard names at once.
+
+        Every unique name is resolved only once and all names share the compiled grammar,
+        indexes and caches of the table.
+
+        Parameters
+        ----------
+        names: Iterable[str]
+            The standard names to resolve.
+        workers: Optional[int]=None
+            Number of worker processes. If None or 1, the names are resolved in the current
+            process. Note, that the table must be picklable and that on platforms spawning
+            processes, the call must be protected by `if __name__ == "__main__"`.
+        return_errors: bool=True
+            If True, a `ResolutionFailure` (which evaluates to False) holding the reason is returned
+            for every name which could not be resolved. Otherwise, None is returned for these names.
+
+        Returns
+        -------
+        List[Union[StandardName, ResolutionFailure, None]]
+            The resolved standard names in the order of the input.
+        """
+        names = [str(n) for n in names]
+        unique_names = list(dict.fromkeys(names))
+        if workers is not None and workers > 1 and len(unique_names) > 1:
+            resolved = resolution.resolve_parallel(self, unique_names, workers)
+        else:
+            resolved = {name: resolution.resolve(self, name) for name in unique_names}
+        if return_errors:
+            return [resolved[name] for name in names]
+        return [None if isinstance(resolved[name], resolution.ResolutionFailure) else resolved[name]
+                for name in names]
 
     def _get_by_qualification(self, standard_name: str) -> Union[StandardName, None]:
         """Check if the Standard Name Table has a given standard name. If the name is not found it will be checked
@@ -688,65 +1166,46 @@ class StandardNameTable(ConceptScheme):
             The standard name object if found or constructed, otherwise None
         """
         with set_config(show_lang_in_str=False):
-            for sn in self.standardNames:
-                if sn.standardName == standard_name:
-                    return sn
+            sn = self._get_standard_name_index().get(standard_name, None)
+            if sn is not None:
+                return sn
 
             # let's try to construct the standard name:
             if not re.match(config.standard_name_core_pattern, standard_name):
                 warnings.warn("General pattern not matched. Must be lowercase and parts may be separated by '_'.")
                 return None
 
-            hasModifier = self.hasModifier or []
-            qdict = {q.id: q for q in hasModifier if isinstance(q, Qualification)}
-            regex_pattern, qualifications = self.get_qualification_regex()
-            for existing_standard_name in self.standardNames:
-                if existing_standard_name.standardName == standard_name:
-                    return existing_standard_name  # identical match
-
-                if existing_standard_name.standardName in standard_name:
-                    # found a corresponding core standard name. replace it in regex pattern:
-                    core_standard_name: StandardName = existing_standard_name
-                    pattern = rf'{regex_pattern.replace("standard_name", existing_standard_name.standardName)}'
-
-                    qualification_descriptions = {}
-
-                    if re.match(pattern, standard_name):
-                        groups = re.match(pattern, standard_name).groups()
-                        qs = [qdict[qid] for qid in qualifications]
-                        for g, q in zip(groups, qs):
-                            if g:
-                                for s in self.standardNames:
-                                    if s.standardName == existing_standard_name.standardName:
-                                        for tv in q.hasValidValues:
-                                            if q.hasPreposition:
-                                                if f"{q.hasPreposition}_{str(tv.hasStringValue)}" == g:
-                                                    qualification_descriptions[g] = str(tv.hasVariableDescription)
-                                                    break
-                                            else:
-                                                if str(tv.hasStringValue) == g:
-                                                    qualification_descriptions[g] = str(tv.hasVariableDescription)
-                                                    break
-                        if self.id.endswith("/"):
-                            new_sn_id = self.id + "derived_standard_name/" + standard_name
-                        else:
-                            new_sn_id = self.id + "/derived_standard_name/" + standard_name
-                        if core_standard_name.description == "" or core_standard_name.description is None:
-                            core_standard_name_description = "No description available."
-                        else:
-                            core_standard_name_description = core_standard_name.description
-
-                        qualification_description_string = " ".join(
-                            f"{k}: {v}" for k, v in qualification_descriptions.items())
-                        constructed_sn = StandardName(
-                            id=new_sn_id,
-                            standardName=standard_name,
-                            unit=core_standard_name.unit,
-                            description=f"{core_standard_name.standardName}: {core_standard_name_description} {qualification_description_string}",
-                            standard_name_table=self.id
-                        )
-                        _cache_valid_standard_name(self, constructed_sn)
-                        return constructed_sn
+            grammar = self.get_qualification_grammar()
+            resolved = self._resolve_qualified_name(standard_name)
+            if resolved is not None:
+                core_standard_name, groups = resolved
+
+                qualification_descriptions = {}
+                for g, qid in zip(groups, grammar.qualification_ids):
+                    if g:
+                        tv = grammar.valid_values[qid].get(g, None)
+                        if tv is not None:
+                            qualification_descriptions[g] = str(tv.hasVariableDescription)
+                if self.id.endswith("/"):
+                    new_sn_id = self.id + "derived_standard_name/" + standard_name
+                else:
+                    new_sn_id = self.id + "/derived_standard_name/" + standard_name
+                if core_standard_name.description == "" or core_standard_name.description is None:
+                    core_standard_name_description = "No description available."
+                else:
+                    core_standard_name_description = core_standard_name.description
+
+                qualification_description_string = " ".join(
+                    f"{k}: {v}" for k, v in qualification_descriptions.items())
+                constructed_sn = StandardName(
+                    id=new_sn_id,
+                    standardName=standard_name,
+                    unit=core_standard_name.unit,
+                    description=f"{core_standard_name.standardName}: {core_standard_name_description} {qualification_description_string}",
+                    standard_name_table=self.id
+                )
+                self._derived_name_cache.put(standard_name, constructed_sn)
+                return constructed_sn
             return None
 
     def model_dump_jsonld(
@@ -845,6 +1304,75 @@ class StandardNameTable(ConceptScheme):
             f.write(self.model_dump_jsonld(context=context, base_uri=base_uri))
         return pathlib.Path(filename)
 
+    def to_snapshot(self, filename: Union[str, pathlib.Path]) -> pathlib.Path:
+        """Writes the table to a binary snapshot file, which can be loaded without validation.
+
+        The snapshot stores the (already validated) objects of the table and is only readable by
+        the same version of ssnolib. If `config.use_snapshots` is True, `parse_table` and
+        `StandardNameTable.parse` write snapshots to `config.snapshot_dir` and reuse them.
+
+        Parameters
+        ----------
+        filename: Union[str, pathlib.Path]
+            The snapshot file. An existing file is replaced.
+
+        Returns
+        -------
+        pathlib.Path
+            The snapshot file.
+        """
+        filename = pathlib.Path(filename)
+        state = {"fields": dict(self.__dict__),
+                 "fields_set": set(self.model_fields_set),
+                 "extra": dict(self.__pydantic_extra__ or {})}
+        # written to a temporary file first, so that concurrent processes never read a partial snapshot:
+        tmp_filename = filename.with_name(f"{filename.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            with open(tmp_filename, "wb") as f:
+                f.write(_SNAPSHOT_MAGIC + f"{__version__} {_SNAPSHOT_FORMAT}".encode() + b"\n")
+                pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_filename, filename)
+        finally:
+            tmp_filename.unlink(missing_ok=True)
+        return filename
+
+    @classmethod
+    def from_snapshot(cls, filename: Union[str, pathlib.Path]) -> "StandardNameTable":
+        """Loads a table written by `to_snapshot`.
+
+        The objects are not validated again. Only load snapshots you (or your ssnolib cache) wrote:
+        like any pickle, a snapshot can execute code when loaded.
+
+        Parameters
+        ----------
+        filename: Union[str, pathlib.Path]
+            The snapshot file.
+
+        Raises
+        ------
+        ValueError
+            If the file is no snapshot, it is corrupt or has been written by another version of ssnolib
+            or in another snapshot format.
+        """
+        with open(filename, "rb") as f:
+            content = f.read()
+        header, _, payload = content.partition(b"\n")
+        if not header.startswith(_SNAPSHOT_MAGIC):
+            raise ValueError(f"{filename} is not a Standard Name Table snapshot.")
+        version, _, snapshot_format = header[len(_SNAPSHOT_MAGIC):].decode(errors="replace").partition(" ")
+        if version != __version__:
+            raise ValueError(f"The snapshot {filename} has been written by ssnolib {version}, "
+                             f"but this is ssnolib {__version__}.")
+        if snapshot_format != _SNAPSHOT_FORMAT:
+            raise ValueError(f"The snapshot {filename} has the format {snapshot_format or '1'}, "
+                             f"but format {_SNAPSHOT_FORMAT} is expected.")
+        try:
+            state = pickle.loads(payload)
+        except Exception as e:
+            raise ValueError(f"The snapshot {filename} is corrupt: {e}") from e
+        # the list of standard names is versioned by `model_post_init`:
+        return cls.model_construct(_fields_set=state["fields_set"], **state["fields"], **state["extra"])
+
     def to_ttl(
             self,
             filename,
@@ -997,139 +1525,40 @@ class StandardNameTable(ConceptScheme):
         filename = download_file(url=url)
         return parse_table(source=filename, fmt=fmt)
 
-    def get_qualification_regex(self) -> Tuple[str, List[str]]:
-        hasModifier = self.hasModifier or []
-        qualifications = {m.id: m for m in hasModifier if isinstance(m, Qualification)}
-        g = rdflib.Graph()
-        g.parse(
-            data=self.model_dump_jsonld(base_uri="https://tmp#"),
-            format='json-ld'
-        )
+    def get_qualification_grammar(self) -> QualificationGrammar:
+        """Returns the compiled qualification grammar of the table.
 
-        query = """
-                PREFIX ssno: <https://matthiasprobst.github.io/ssno#>
-                PREFIX schema: <https://schema.org/>
-
-                SELECT ?qualification ?name ?before ?after ?preposition
-                WHERE {
-                    {
-                        ?qualification a ssno:Qualification ;
-                                       schema:name ?name .
-                    } UNION {
-                        ?qualification a ssno:VectorQualification ;
-                                       schema:name ?name .
-                    }
-                    OPTIONAL { ?qualification ssno:before ?before }
-                    OPTIONAL { ?qualification ssno:after ?after }
-                    OPTIONAL { ?qualification ssno:hasPreposition ?preposition }
-                }
-                ORDER BY ?before
-                """
-        # Execute the query
-        results = g.query(query)
-
-        # Print the results
-        qres = {}
-        for row in results:
-            if row.qualification not in qres:
-                qres[str(row.qualification).strip("_:")] = {
-                    'id': _parse_id(row.qualification),
-                    'name': str(row.name) if row.name else None,
-                    'before': str(row.before).strip("_:") if row.before else None,
-                    'after': str(row.after).strip("_:") if row.after else None,
-                    'preposition': str(row.preposition) if row.preposition else None
-                }
-
-        qres_orig = qres.copy()
-        sorted_list = _generate_ordered_list_of_qualifications(
-            qres,
-            context={k: str(v) for k, v in
-                     dict(g.namespaces()).items()}
-        )
+        The grammar is built on first use and kept until `standardNames`,
+        `hasModifier` or `hasDomainConceptSet` change.
+        """
+        if self._qualification_grammar is None:
+            hasModifier = self.hasModifier or []
+            self._qualification_grammar = QualificationGrammar(
+                [m for m in hasModifier if isinstance(m, Qualification)]
+            )
+        return self._qualification_grammar
+
+    @property
+    def matcher(self) -> StandardNameMatcher:
+        """The StandardNameMatcher compiled from the standard names, qualifications and
+        transformations of the table. It validates and parses names without looking up
+        the core standard names one by one and can be exported with `matcher.to_json()`."""
+        self._get_standard_name_index()  # resets the matcher if standard names were added in place
+        if self._matcher is None:
+            self._matcher = StandardNameMatcher.from_table(self)
+        return self._matcher
 
-        qualifications_output = []
-        for e in sorted_list:
-            if e in qres_orig:
-                qualifications_output.append(f'{qres_orig[e]["id"]}')
-            else:
-                qualifications_output.append("standard_name")
-        out = ""
-        for q in qualifications_output:
-            qualification = qualifications.get(q, None)
-            if qualification:
-                valid_values = [str(v.hasStringValue) for v in qualification.hasValidValues]
-                if qualification.hasPreposition:
-                    _valid_values = [qualification.hasPreposition + "_" + v for v in valid_values]
-                    out += f'(?:({"|".join(_valid_values)}))?_?'
-                else:
-                    out += f'(?:({"|".join(valid_values)}))?_?'
-            elif q == "standard_name":
-                out += f"{q}_?"
-        qualifications_output.remove("standard_name")
-        if out.endswith("?_?"):
-            return "^" + out.strip("?_?") + "?$", qualifications_output
-        return "^" + out + "$", qualifications_output
+    def get_qualification_regex(self) -> Tuple[str, List[str]]:
+        """Returns the regex pattern of the qualification rule, in which "standard_name" is the
+        placeholder for the core standard name, and the IDs of the qualifications in the order of
+        the regex groups."""
+        grammar = self.get_qualification_grammar()
+        return grammar.pattern, list(grammar.qualification_ids)
 
     def get_qualification_rule_as_string(self) -> str:
         """Returns the qualification rule similar to the CF standard name table documentation
         (https://cfconventions.org/Data/cf-standard-names/docs/guidelines.html#process)."""
-        # get all qualifications:
-        g = rdflib.Graph()
-        g.parse(
-            data=self.model_dump_jsonld(base_uri="https://tmp#"),
-            format='json-ld')
-
-        query = """
-                PREFIX ssno: <https://matthiasprobst.github.io/ssno#>
-                PREFIX schema: <https://schema.org/>
-
-                SELECT ?qualification ?name ?before ?after ?preposition
-                WHERE {
-                    {
-                        ?qualification a ssno:Qualification ;
-                                       schema:name ?name .
-                    } UNION {
-                        ?qualification a ssno:VectorQualification ;
-                                       schema:name ?name .
-                    }
-                    OPTIONAL { ?qualification ssno:before ?before }
-                    OPTIONAL { ?qualification ssno:after ?after }
-                    OPTIONAL { ?qualification ssno:hasPreposition ?preposition }
-                }
-                ORDER BY ?before
-                """
-        # Execute the query
-        results = g.query(query)
-
-        # Print the results
-        qres = {}
-        for row in results:
-            if row.qualification not in qres:
-                qres[str(row.qualification).strip("_:")] = {
-                    'name': str(row.name) if row.name else None,
-                    'before': str(row.before).strip("_:") if row.before else None,
-                    'after': str(row.after).strip("_:") if row.after else None,
-                    'preposition': str(row.preposition) if row.preposition else None
-                }
-
-        qres_orig = qres.copy()
-        sorted_list = _generate_ordered_list_of_qualifications(
-            qres,
-            context={k: str(v) for k, v in
-                     dict(g.namespaces()).items()}
-        )
-
-        qualifications_output = []
-        for e in sorted_list:
-            if e in qres_orig:
-                q = qres_orig[e]
-                if q["preposition"]:
-                    qualifications_output.append(f'[{q["preposition"].replace("_", " ")} {q["name"]}]')
-                else:
-                    qualifications_output.append(f'[{qres_orig[e]["name"]}]')
-            else:
-                qualifications_output.append("standard_name")
-        return " ".join(qualifications_output)
+        return self.get_qualification_grammar().get_rule_as_string()
 
     def add_new_standard_name(self, name: Union[str, StandardName], verify: bool = True) -> StandardName:
         """Add a new standard name to the Standard Name Table.
@@ -1149,7 +1578,10 @@ class StandardNameTable(ConceptScheme):
         """
         if not verify and isinstance(name, StandardName):
             self.append("standardNames", name)
+            return name
         if isinstance(name, StandardName):
+            if name.standardName in self._get_standard_name_index():
+                raise ValueError(f"Standard Name '{name.standardName}' already exists in the Standard Name Table.")
             self.verify(name)
             self.append("standardNames", name)
             return name
@@ -1158,9 +1590,8 @@ class StandardNameTable(ConceptScheme):
 
         name = new_standard_name.standardName
 
-        for sn in self.standardNames:
-            if name == sn.standardName:
-                raise ValueError(f"Standard Name '{name}' already exists in the Standard Name Table.")
+        if name in self._get_standard_name_index():
+            raise ValueError(f"Standard Name '{name}' already exists in the Standard Name Table.")
         if not self.verify_name(name):
             raise ValueError(f"Standard Name '{name}' is invalid. Could not verified by the qualification rules")
 
@@ -1401,9 +1832,9 @@ class StandardNameTable(ConceptScheme):
 
     def __getitem__(self, standard_name: str):
         standard_name = str(standard_name)
-        for sn in self.standardNames:
-            if sn.standardName == standard_name:
-                return sn
+        sn = self._get_standard_name_index().get(standard_name, None)
+        if sn is not None:
+            return sn
         raise KeyError(f"Standard Name '{standard_name}' not found in the Standard Name Table.")
 
 
@@ -1436,35 +1867,225 @@ def _expand_short_uri_from_dict(data: dict, context: dict) -> dict:
     return data
 
 
-def parse_table(source=None, data=None, fmt: Optional[str] = None):
-    """Instantiates a table from a file."""
+def _get_snapshot_filename(content: Union[bytes, pathlib.Path], cls: type, *key: str) -> pathlib.Path:
+    """Returns the cache file for the snapshot of a table parsed from the given content (or file).
+
+    The name is the hash of the content, the class, the version of ssnolib and of the snapshot
+    format, the configuration influencing the result (see `_SNAPSHOT_CONFIG`) and all other
+    parameters (key) of the parser. The file is located in `config.snapshot_dir`.
+    """
+    if isinstance(content, bytes):
+        content_hash = hashlib.sha256(content)
+    else:
+        # large files (e.g. N-Triples dumps) are hashed in chunks:
+        content_hash = hashlib.sha256()
+        with open(content, 'rb') as f:
+            for chunk in iter(lambda: f.read(2 ** 20), b""):
+                content_hash.update(chunk)
+    settings = [(name, getattr(config, name)) for name in _SNAPSHOT_CONFIG]
+    for k in (cls.__qualname__, __version__, _SNAPSHOT_FORMAT, settings, *key):
+        content_hash.update(b"\0" + str(k).encode())
+    if config.snapshot_dir is None:
+        snapshot_dir = get_cache_dir() / "snapshots"
+    else:
+        snapshot_dir = pathlib.Path(config.snapshot_dir)
+    snapshot_dir.mkdir(parents=True, exist_ok=True)
+    return snapshot_dir / f"{content_hash.hexdigest()}.snt"
+
+
+def _load_snapshot(cls, filename: pathlib.Path) -> Optional[StandardNameTable]:
+    """Returns the table of a snapshot file or None if it does not exist or cannot be read"""
+    if not filename.exists():
+        return None
+    try:
+        snt = cls.from_snapshot(filename)
+        os.utime(filename)  # marks the snapshot as recently used
+    except (ValueError, OSError):
+        # overwritten by the caller with a new snapshot
+        return None
+    _prune_snapshots(filename)
+    return snt
+
+
+def _save_snapshot(snt: StandardNameTable, filename: pathlib.Path):
+    """Writes a snapshot of the table. A snapshot which cannot be written is skipped"""
+    try:
+        snt.to_snapshot(filename)
+    except (OSError, pickle.PicklingError, TypeError, AttributeError) as e:
+        warnings.warn(f"Could not write the snapshot {filename}: {e}", UserWarning)
+        return
+    _prune_snapshots(filename)
+
+
+def _prune_snapshots(used_snapshot: pathlib.Path):
+    """Removes the least recently used snapshots exceeding `config.max_snapshots` from the directory
+    of the snapshot, which has just been used. The used snapshot is always kept."""
+    if config.max_snapshots is None:
+        return
+    snapshots = []
+    for snapshot in used_snapshot.parent.glob("*.snt"):
+        try:
+            snapshots.append((snapshot == used_snapshot, snapshot.stat().st_mtime, snapshot))
+        except OSError:  # removed by another process
+            continue
+    snapshots.sort(reverse=True)
+    for _, _, snapshot in snapshots[config.max_snapshots:]:
+        try:
+            snapshot.unlink(missing_ok=True)
+        except OSError:
+            continue
+
+
+def _get_canonical_content(data) -> str:
+    """Returns the JSON string of the data without the IDs of blank nodes and with sorted lists"""
+    if isinstance(data, dict):
+        items = sorted((k, _get_canonical_content(v)) for k, v in data.items()
+                       if not (k in ("id", "@id") and isinstance(v, str) and v.startswith("_:")))
+        return "{" + ",".join(f"{json.dumps(k)}:{v}" for k, v in items) + "}"
+    if isinstance(data, list):
+        return "[" + ",".join(sorted(_get_canonical_content(v) for v in data)) + "]"
+    return json.dumps(data, default=str)
+
+
+def _get_entry_hash(entry: Union[Dict, Thing]) -> str:
+    """Returns the hash of the content of an entry (e.g. the record or object of a standard name).
+
+    The IDs of blank nodes are ignored, as they are generated anew whenever a source is parsed.
+    Lists are compared regardless of their order, which RDF does not preserve.
+    """
+    if isinstance(entry, Thing):
+        entry = dict(entry.model_dump(mode="json", exclude_none=True), type=type(entry).__name__)
+    return hashlib.sha256(_get_canonical_content(entry).encode("utf-8")).hexdigest()
+
+
+def _contains_name(standard_name: str, name: str) -> bool:
+    """Returns True if a (derived) standard name contains the standard name `name`"""
+    return f"_{name}_" in f"_{standard_name}_"
+
+
+def _read_table_entries(source: Union[str, pathlib.Path],
+                        fmt: Optional[str] = None,
+                        **kwargs) -> Tuple[List[Union[Dict, StandardName]], Optional[List]]:
+    """Returns the standard names (as records or objects) and the modifiers of a table source.
+
+    The modifiers are None, if the source does not describe a table.
+    """
+    if fmt is None:
+        fmt = pathlib.Path(source).suffix[1:].lower()
+    if _RDF_FORMATS.get(fmt, None) == "json-ld":
+        from ssnolib.streaming import _pop_standard_name_records
+        with open(source, 'r', encoding='utf-8') as f:
+            document = json.load(f)
+        records = _pop_standard_name_records(document)
+        try:
+            snt = parse_table(data=document, fmt="jsonld", engine="direct")
+        except ValueError:
+            return records, None
+        return records, list(snt.hasModifier or [])
+    reader = plugins.get(fmt, None)
+    if reader is not None:
+        data = reader(source).parse(**kwargs)
+        return data["standardNames"], list(data.get("hasModifier", None) or [])
+    if fmt in _RDF_FORMATS:
+        snt = parse_table(source, fmt=fmt)
+        return list(snt.standardNames or []), list(snt.hasModifier or [])
+    raise ValueError(f'No plugin found for the format "{fmt}".')
+
+
+def _get_table_prefixes() -> Dict[str, str]:
+    """Returns the prefixes used to read a table"""
+    prefixes = StandardNameTable.get_context()
+    prefixes.update({"schema": "https://schema.org/"})
+    prefixes.update({"foaf": "http://xmlns.com/foaf/0.1/"})
+    prefixes.update({"m4i": "http://w3id.org/nfdi4ing/metadata4ing#"})
+    return prefixes
+
+
+_RDF_FORMATS = {
+    "jsonld": "json-ld",
+    "json-ld": "json-ld",
+    "ttl": "turtle",
+    "turtle": "turtle",
+    "xml": "xml",
+    "rdf": "xml",
+    "owl": "xml",
+    "nt": "nt",
+    "ntriples": "nt",
+}
+
+
+def parse_table(source=None, data=None, fmt: Optional[str] = None, engine: Optional[str] = None):
+    """Instantiates a table from a file.
+
+    Parameters
+    ----------
+    source: Union[str, pathlib.Path]
+        The filename or URL of the table.
+    data: Union[str, Dict]
+        The content of the table, if no source is given.
+    fmt: Optional[str]
+        The format of the table: "jsonld", "ttl" (Turtle), "xml" (RDF/XML) or "nt" (N-Triples).
+        If not provided, it is determined from the suffix of the source.
+    engine: Optional[str]=None
+        How the objects are extracted from the RDF data: "sparql" runs a SPARQL query per kind of
+        object, "direct" walks the triples of the graph once and builds all objects from the result.
+        N-Triples are streamed line by line with the "direct" engine, hence no graph is built.
+        Defaults to "direct" for N-Triples and to "sparql" for all other formats.
+    """
+    if engine not in (None, "sparql", "direct"):
+        raise ValueError(f'Unknown engine "{engine}". Expected "sparql" or "direct".')
     if source is None and data is None:
         raise ValueError("Either source or data must be provided.")
+    if fmt:
+        fmt = fmt.strip('.').lower()
     if source:
         if str(source).startswith("https://") or str(source).startswith("http://"):
             download_file(source)
         filename = pathlib.Path(source)
         assert filename.exists(), f"File {filename} does not exist."
-        if fmt:
-            fmt = fmt.strip('.').lower()
-        else:
+        if not fmt:
             fmt = filename.suffix.strip('.').lower()
 
-        if fmt not in ("jsonld",):
-            raise ValueError(f"Unknown format {fmt}.")
-        with open(filename, 'r', encoding='utf-8') as f:
-            return parse_table(source=None, data=json.load(f), fmt=fmt)
-
-    # get namespaces:
-    prefixes = StandardNameTable.get_context()
-    prefixes.update({"schema": "https://schema.org/"})
-    prefixes.update({"foaf": "http://xmlns.com/foaf/0.1/"})
-    prefixes.update({"m4i": "http://w3id.org/nfdi4ing/metadata4ing#"})
+        if fmt not in _RDF_FORMATS:
+            raise ValueError(f"Unknown format {fmt}. Expected one of {list(_RDF_FORMATS)}.")
+        snapshot_filename = None
+        if config.use_snapshots:
+            snapshot_filename = _get_snapshot_filename(filename, StandardNameTable, _RDF_FORMATS[fmt], engine)
+            snt = _load_snapshot(StandardNameTable, snapshot_filename)
+            if snt is not None:
+                return snt
+        if _RDF_FORMATS[fmt] == "nt" and engine != "sparql":
+            snt = _parse_table_from_ntriples(filename, _get_table_prefixes())
+        else:
+            with open(filename, 'r', encoding='utf-8') as f:
+                if _RDF_FORMATS[fmt] == "json-ld":
+                    data = json.load(f)
+                else:
+                    data = f.read()
+            snt = parse_table(source=None, data=data, fmt=fmt, engine=engine)
+        if snapshot_filename is not None:
+            _save_snapshot(snt, snapshot_filename)
+        return snt
+
+    rdf_format = _RDF_FORMATS.get(fmt or "jsonld", None)
+    if rdf_format is None:
+        raise ValueError(f"Unknown format {fmt}. Expected one of {list(_RDF_FORMATS)}.")
+    prefixes = _get_table_prefixes()
+    if isinstance(data, bytes) and rdf_format != "json-ld":
+        data = data.decode("utf-8")
+    if rdf_format == "nt" and engine != "sparql":
+        return _parse_table_from_ntriples(io.StringIO(data), prefixes)
 
     g = rdflib.Graph()
-    g.parse(data=data,
-            format='json-ld',
-            context=prefixes)
+    if rdf_format == "json-ld":
+        g.parse(data=data,
+                format='json-ld',
+                context=prefixes)
+    else:
+        g.parse(data=data, format=rdf_format)
+
+    if engine == "direct":
+        return _parse_table_from_graph(g, prefixes)
 
     sparql = build_simple_sparql_query(
         prefixes=prefixes,
@@ -1800,80 +2421,285 @@ def parse_table(source=None, data=None, fmt: Optional[str] = None):
     raise ValueError("No Standard Name Table found.")
 
 
-def get_regex_from_transformation(transformation: Transformation) -> str:
-    """Generate a regex pattern from a transformation."""
+# all predicates read by `_parse_table_from_triples`. Other triples are skipped when streaming N-Triples:
+_TABLE_PREDICATES = (
+    "rdf:type", "dcterms:title", "schema:version", "dcterms:hasVersion", "dcterms:description",
+    "prov:qualifiedAttribution", "prov:agent", "prov:hadRole", "prov:hasRorId",
+    "foaf:firstName", "foaf:lastName", "foaf:mbox", "foaf:name",
+    "m4i:orcidId", "m4i:hasStringValue", "m4i:hasVariableDescription",
+    "schema:name", "ssno:hasModifier", "ssno:hasValidValues", "ssno:hasPreposition", "ssno:before", "ssno:after",
+    "ssno:altersUnit", "ssno:hasCharacter", "ssno:character", "ssno:associatedWith", "ssno:hasDomainConceptSet",
+    "ssno:standardNames", "ssno:standardName", "ssno:unit", "ssno:description",
+)
 
-    # Convert character.character values into a set for quick lookup
-    placeholders = {char.character for char in transformation.hasCharacter}
 
-    # Split the transformation name into chunks
-    chunks = str(transformation.name).split("_")
+def _get_namespaces(prefixes: Dict[str, str]) -> Dict[str, str]:
+    """Returns the prefixes extended by the ones rdflib binds by default (e.g. prov, dcterms),
+    which are available in the SPARQL queries of `parse_table`"""
+    namespaces = {prefix: str(namespace) for prefix, namespace in rdflib.Graph().namespaces()}
+    namespaces.update(prefixes)
+    return namespaces
 
-    # Replace chunks that match placeholders
-    regex_chunks = ["([a-zA-Z_]+)" if chunk in placeholders else chunk for chunk in chunks]
 
-    # Rebuild the regex pattern
-    return "_".join(regex_chunks)
+def _parse_table_from_graph(g: rdflib.Graph, prefixes: Dict[str, str]) -> StandardNameTable:
+    """Builds the (first) Standard Name Table of a graph by walking its triples once.
 
+    All triples are grouped by subject and predicate in a single pass. The objects are then
+    built from these groups, hence no query is evaluated against the graph. The objects equal
+    the ones built by the SPARQL queries of `parse_table`. Only the first value of a property is
+    used, where the SPARQL queries return a row per combination of values.
+    """
+    namespaces = _get_namespaces(prefixes)
+    namespaces.update({prefix: str(namespace) for prefix, namespace in g.namespaces()
+                       if prefix not in prefixes})
+    return _parse_table_from_triples(g, prefixes, namespaces)
+
+
+def _parse_table_from_ntriples(source, prefixes: Dict[str, str]) -> StandardNameTable:
+    """Builds the (first) Standard Name Table of an N-Triples file (or file object) while reading
+    it line by line. Only the triples needed to build the table are kept."""
+    from ssnolib.streaming import iter_ntriples
+    namespaces = _get_namespaces(prefixes)
+    predicates = set()
+    for curie in _TABLE_PREDICATES:
+        prefix, name = curie.split(":", 1)
+        predicates.add(namespaces[prefix] + name)
+    return _parse_table_from_triples(iter_ntriples(source, predicates), prefixes, namespaces)
+
+
+def _parse_table_from_triples(triples: Iterable[Tuple[rdflib.term.Node, URIRef, rdflib.term.Node]],
+                              prefixes: Dict[str, str],
+                              namespaces: Dict[str, str]) -> StandardNameTable:
+    """Builds the (first) Standard Name Table from triples, see `_parse_table_from_graph`.
+    The prefixes are used to expand values, the namespaces to resolve the properties of the table."""
+    nodes: Dict[rdflib.term.Node, Dict[URIRef, List[rdflib.term.Node]]] = {}
+    for subject, predicate, obj in triples:
+        nodes.setdefault(subject, {}).setdefault(predicate, []).append(obj)
+
+    def _iri(curie: str) -> URIRef:
+        prefix, name = curie.split(":", 1)
+        return URIRef(namespaces[prefix] + name)
+
+    rdf_type = rdflib.RDF.type
+
+    def _objects(node, curie: str) -> List[rdflib.term.Node]:
+        return nodes.get(node, {}).get(_iri(curie), [])
+
+    def _value(node, curie: str) -> Optional[rdflib.term.Node]:
+        objects = _objects(node, curie)
+        return objects[0] if objects else None
+
+    def _is_a(node, curie: str) -> bool:
+        return _iri(curie) in nodes.get(node, {}).get(rdf_type, [])
+
+    def _literal(node) -> Optional[str]:
+        return None if node is None else getattr(node, "value", node)
+
+    snt_ids = [s for s, props in nodes.items() if _iri("ssno:StandardNameTable") in props.get(rdf_type, [])]
+    if not snt_ids:
+        raise ValueError("No Standard Name Table found.")
+    snt_node = snt_ids[0]
+    snt = StandardNameTable(**parse_and_exclude_none(dict(id=_parse_id(snt_node),
+                                                          title=_value(snt_node, "dcterms:title"),
+                                                          version=_value(snt_node, "schema:version"),
+                                                          hasVersion=_value(snt_node, "dcterms:hasVersion"),
+                                                          description=_value(snt_node, "dcterms:description"))))
+
+    qualifiedAttribution = []
+    for qaid in _objects(snt_node, "prov:qualifiedAttribution"):
+        if not _is_a(qaid, "prov:Attribution"):
+            continue
+        had_role = _value(qaid, "prov:hadRole")
+        for agent_id in _objects(qaid, "prov:agent"):
+            if _is_a(agent_id, "prov:Person"):
+                person_dict = dict(id=agent_id,
+                                   firstName=_value(agent_id, "foaf:firstName"),
+                                   lastName=_value(agent_id, "foaf:lastName"),
+                                   mbox=_value(agent_id, "foaf:mbox"),
+                                   orcidId=_value(agent_id, "m4i:orcidId"))
+                attribution = Attribution(id=_parse_id(qaid), agent=Person(**parse_and_exclude_none(person_dict)))
+                if had_role:
+                    attribution.hadRole = _literal(had_role)
+                qualifiedAttribution.append(attribution)
+            elif _is_a(agent_id, "prov:Organization"):
+                orga_dict = dict(name=_value(agent_id, "foaf:name"),
+                                 mbox=_value(agent_id, "foaf:mbox"),
+                                 hasRorId=_value(agent_id, "prov:hasRorId"))
+                attribution = Attribution(
+                    id=_parse_id(agent_id),
+                    agent=Organization(**{k: _expand_short_uri(_literal(v), prefixes) for k, v in orga_dict.items() if v})
+                )
+                if had_role:
+                    attribution.hadRole = had_role
+                qualifiedAttribution.append(attribution)
+
+    def _valid_values(node, parse_ids: bool) -> List[TextVariable]:
+        valid_values = []
+        for vv_id in _objects(node, "ssno:hasValidValues"):
+            string_value = _value(vv_id, "m4i:hasStringValue")
+            if not _is_a(vv_id, "m4i:TextVariable") or string_value is None:
+                continue
+            description = _value(vv_id, "m4i:hasVariableDescription")
+            vv_dict = dict(id=_parse_id(vv_id) if parse_ids else vv_id,
+                           hasStringValue=string_value.value.strip(),
+                           hasVariableDescription=description.value.strip() if description is not None else None)
+            valid_values.append(TextVariable(**{k: _expand_short_uri(v, prefixes) for k, v in vv_dict.items() if v}))
+        return valid_values
+
+    def _position(node):
+        if isinstance(node, rdflib.BNode):
+            return _parse_id(node)
+        if isinstance(node, rdflib.Literal):
+            return node.value
+        return node
+
+    has_modifier = []
+    modifier_ids = _objects(snt_node, "ssno:hasModifier")
+    for _type, cls in (("ssno:Qualification", Qualification), ("ssno:VectorQualification", VectorQualification)):
+        for modifier_id in modifier_ids:
+            name = _value(modifier_id, "schema:name")
+            if not _is_a(modifier_id, _type) or name is None:
+                continue
+            has_modifier_dict = dict(name=name.value, description=_literal(_value(modifier_id, "dcterms:description")))
+            before = _value(modifier_id, "ssno:before")
+            if before:
+                has_modifier_dict['before'] = _position(before)
+            else:
+                after = _value(modifier_id, "ssno:after")
+                assert after, "Missing ssno:after"
+                has_modifier_dict['after'] = _position(after)
+            preposition = _value(modifier_id, "ssno:hasPreposition")
+            if preposition:
+                has_modifier_dict['hasPreposition'] = preposition.value
+            has_modifier.append(
+                cls(id=_parse_id(modifier_id),
+                    hasValidValues=_valid_values(modifier_id, parse_ids=True),
+                    **{k: _expand_short_uri(v, prefixes) for k, v in has_modifier_dict.items() if v})
+            )
+
+    for modifier_id in modifier_ids:
+        name = _value(modifier_id, "schema:name")
+        if not _is_a(modifier_id, "ssno:Transformation") or name is None:
+            continue
+        hasCharacter = []
+        for character_id in _objects(modifier_id, "ssno:hasCharacter"):
+            character = _value(character_id, "ssno:character")
+            associated_with = _value(character_id, "ssno:associatedWith")
+            if _is_a(character_id, "ssno:Character") and character is not None and associated_with is not None:
+                hasCharacter.append(Character(id=_parse_id(character_id),
+                                              character=character.value,
+                                              associatedWith=_expand_short_uri(associated_with, prefixes)))
+        has_modifier.append(
+            Transformation(id=_parse_id(modifier_id),
+                           name=name.value,
+                           description=_value(modifier_id, "dcterms:description"),
+                           altersUnit=_value(modifier_id, "ssno:altersUnit"),
+                           hasCharacter=hasCharacter)
+        )
+    if has_modifier:
+        snt.hasModifier = has_modifier
+
+    domain_concept_sets = []
+    for dcs_id in _objects(snt_node, "ssno:hasDomainConceptSet"):
+        name = _value(dcs_id, "schema:name")
+        if not _is_a(dcs_id, "ssno:DomainConceptSet") or name is None:
+            continue
+        dcs_dict = dict(name=name.value, description=_literal(_value(dcs_id, "dcterms:description")))
+        domain_concept_sets.append(
+            DomainConceptSet(id=_parse_id(dcs_id),
+                             hasValidValues=_valid_values(dcs_id, parse_ids=False),
+                             **{k: _expand_short_uri(v, prefixes) for k, v in dcs_dict.items() if v})
+        )
+    snt.hasDomainConceptSet = domain_concept_sets
+
+    # like the SPARQL queries: vector standard names first, then scalar and other standard names:
+    standard_names = {"ssno:VectorStandardName": [], "ssno:ScalarStandardName": [], "ssno:StandardName": []}
+    for sn_id in _objects(snt_node, "ssno:standardNames"):
+        standard_name = _value(sn_id, "ssno:standardName")
+        unit = _value(sn_id, "ssno:unit")
+        description = _value(sn_id, "ssno:description")
+        if standard_name is None or unit is None or description is None:
+            continue
+        for _type, sns in standard_names.items():
+            if _is_a(sn_id, _type):
+                cls = VectorStandardName if _type == "ssno:VectorStandardName" else StandardName
+                sns.append(cls(id=_parse_id(sn_id),
+                               standardName=str(standard_name),
+                               unit=str(unit),
+                               description=str(description)))
+    snt.standardNames = [sn for sns in standard_names.values() for sn in sns]
+
+    if qualifiedAttribution:
+        if len(qualifiedAttribution) == 1:
+            snt.qualifiedAttribution = qualifiedAttribution[0]
+        else:
+            snt.qualifiedAttribution = qualifiedAttribution
+    return snt
+
+
+def get_regex_from_transformation(transformation: Transformation) -> str:
+    """Generate a regex pattern from a transformation.
 
-def check_if_standard_name_can_be_build_with_transformation(standard_name: str, snt: StandardNameTable) -> Tuple[
+    Deprecated: transformed standard names are parsed by the chart parser of
+    `StandardNameTable.matcher` (see `StandardNameMatcher.match_transformation`).
+    """
+    warnings.warn("get_regex_from_transformation() is deprecated and will be removed. Use "
+                  "StandardNameTable.matcher.match_transformation() to parse transformed standard names.",
+                  DeprecationWarning, stacklevel=2)
+    template = StandardNameMatcher.get_template(str(transformation.name),
+                                                {char.character for char in transformation.hasCharacter})
+    return "_".join("([a-zA-Z_]+)" if is_character else word for is_character, word in template)
+
+
+def check_if_standard_name_can_be_build_with_transformation(standard_name: str,
+                                                            snt: StandardNameTable,
+                                                            parse: Optional[NameParse] = None) -> Tuple[
     List[StandardName], Union[Transformation, None]]:
-    if snt.hasModifier is None:
-        transformations = {}
-        qualifications = {}
-    else:
-        transformations = [t for t in snt.hasModifier if isinstance(t, Transformation)]
-        qualifications = {t.id: t for t in snt.hasModifier if isinstance(t, Qualification)}
-    if snt.hasDomainConceptSet is not None:
-        domain_concept_sets = {t.id: t for t in snt.hasDomainConceptSet if isinstance(t, DomainConceptSet)}
-    else:
-        domain_concept_sets = {}
-    for transformation in transformations:
-        pattern = get_regex_from_transformation(transformation)
-        match = re.fullmatch(f"^{pattern}$", standard_name)
-        if match:
-            terms = match.groups()
-            # the number of terms must match the number of defined characters:
-            if len(terms) != len(transformation.hasCharacter):
-                return [], None
-            else:
-                matching_standard_names = []
-                for char, term in zip(transformation.hasCharacter, terms):
-                    if str(char.associatedWith) == str(SSNO.AnyStandardName):
-                        found_ns = snt.get_standard_name(term)
-                        if found_ns:
-                            matching_standard_names.append(found_ns)
-                    elif str(char.associatedWith) in domain_concept_sets:
-                        found_dcs = domain_concept_sets.get(char.associatedWith)
-                        if term in [v.hasStringValue for v in found_dcs.hasValidValues]:
-                            found_valid_value = [v for v in found_dcs.hasValidValues if v.hasStringValue == term][0]
-                            matching_standard_names.append(found_valid_value)
-                    elif str(char.associatedWith) in qualifications:
-                        found_q = qualifications.get(char.associatedWith)
-                        if term in [v.hasStringValue for v in found_q.hasValidValues]:
-                            found_valid_value = [v for v in found_q.hasValidValues if v.hasStringValue == term][0]
-                            matching_standard_names.append(found_valid_value)
-                    else:  # must be qualification or domain concept set
-                        raise ValueError(f"Unknown associatedWith value {char.associatedWith}")
-                if len(matching_standard_names) == len(terms):
-                    return matching_standard_names, transformation
-                # matching_standard_names = [snt.get_standard_name(t) for t in terms]
-                # if all(matching_standard_names):
-                #     return matching_standard_names, transformation
-    return [], None
-
-
-def _cache_valid_standard_name(snt: StandardNameTable, standard_name: StandardName):
-    if snt.identifier not in _CACHE_VALID_STANDARD_NAMES:
-        _CACHE_VALID_STANDARD_NAMES[snt.identifier] = [standard_name, ]
-    else:
-        _CACHE_VALID_STANDARD_NAMES[snt.identifier].append(standard_name)
+    """Checks if the standard name is the result of a transformation.
 
+    The name is parsed once by the chart parser of the table's matcher, which memoizes the valid
+    spans of the name. Nested transformations are resolved from the parses of their arguments.
+    Transformations may be nested up to `config.max_transformation_depth`.
 
-def _get_cached_name(snt: StandardNameTable, standard_name: str) -> Union[StandardName, None]:
-    for sn in _CACHE_VALID_STANDARD_NAMES.get(snt.identifier, []):
-        if sn.standardName == standard_name:
-            return sn
+    Parameters
+    ----------
+    standard_name: str
+        The standard name to check.
+    snt: StandardNameTable
+        The table providing the standard names and transformations.
+    parse: Optional[NameParse]=None
+        The parse of the name, if already known (e.g. the argument of an enclosing transformation).
+
+    Returns
+    -------
+    Tuple[List[Union[StandardName, TextVariable]], Union[Transformation, None]]
+        The standard names or valid values the characters of the transformation refer to (in the
+        order of `hasCharacter`) and the transformation. ([], None) if the name cannot be built.
+    """
+    if parse is None:
+        parse = snt.matcher.match_transformation(standard_name)
+    if parse is None or parse.transformation is None:
+        return [], None
+    transformation = next((t for t in snt.hasModifier or []
+                           if isinstance(t, Transformation) and t.name == parse.transformation), None)
+    if transformation is None:
+        return [], None
+    valid_values = {}
+    for t in list(snt.hasModifier or []) + list(snt.hasDomainConceptSet or []):
+        if isinstance(t, (Qualification, DomainConceptSet)):
+            valid_values[str(t.id)] = t.hasValidValues
+    arguments = dict(parse.arguments)
+    matching_standard_names = []
+    for char in transformation.hasCharacter:
+        argument = arguments[char.character]
+        if isinstance(argument, str):
+            found = next((v for v in valid_values[str(char.associatedWith)] if v.hasStringValue == argument), None)
+        else:
+            found = snt._resolve_parse(argument)
+        if found is None:
+            return [], None
+        matching_standard_names.append(found)
+    return matching_standard_names, transformation
 
 
 def _compute_new_unit(units: Dict, operation) -> str:
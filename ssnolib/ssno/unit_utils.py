@@ -1,21 +1,34 @@
 import re
-from typing import Union
+import tokenize
+from typing import Dict, Optional, Union
 
 import pint
 import rdflib
-from ontolutils.utils.qudt_units import qudt_lookup
 
-_UREG = pint.UnitRegistry()
+from ssnolib import config
+from ssnolib.cache import LRUCache, CacheInfo
+from ssnolib.unit_index import QudtUnitIndex
+
+_UREG = None  # created on first use, since building the registry takes a noticeable time
 
 
 def _get_ureg():
+    global _UREG
+    if _UREG is None:
+        _UREG = pint.UnitRegistry()
     return _UREG
 
 
+_QUDT_UNIT_INDEX = QudtUnitIndex()
+
+
+def get_qudt_unit_index() -> QudtUnitIndex:
+    """Returns the index of the QUDT lookup table used by ssnolib"""
+    return _QUDT_UNIT_INDEX
+
+
 def reverse_qudt_lookup(qudt_unit: Union[str, rdflib.URIRef]):
-    for k, v in qudt_lookup.items():
-        if str(v) == str(qudt_unit):
-            return k
+    return _QUDT_UNIT_INDEX.iri_to_symbol(qudt_unit)
 
 
 def _replace_number_following_letter(text) -> str:
@@ -24,11 +37,51 @@ def _replace_number_following_letter(text) -> str:
     return re.sub(r'([a-zA-Z])(-?\d+)', r'\1**\2', text)
 
 
+# tables reuse few unit strings, hence the results of parsing and formatting them are cached:
+_PARSED_UNITS = LRUCache(config.unit_cache_size)
+_FORMATTED_UNITS = LRUCache(config.unit_cache_size)
+_DIMENSIONALITIES = LRUCache(config.unit_cache_size)
+_NOT_CACHED = object()
+
+
 def _parse_unit(u: str) -> pint.Unit:
-    return _get_ureg()(_replace_number_following_letter(u)).u
+    unit = _PARSED_UNITS.get(u)
+    if unit is None:
+        unit = _get_ureg()(_replace_number_following_letter(u)).u
+        _PARSED_UNITS.put(u, unit)
+    return unit
 
 
 def _format_unit(q: Union[str, pint.Quantity]) -> str:
-    if isinstance(q, str):
-        q = _get_ureg()(q)
-    return "{:~}".format(q.to_base_units().units).replace(" ", "")
+    if not isinstance(q, str):
+        return "{:~}".format(q.to_base_units().units).replace(" ", "")
+    formatted = _FORMATTED_UNITS.get(q)
+    if formatted is None:
+        formatted = "{:~}".format(_get_ureg()(q).to_base_units().units).replace(" ", "")
+        _FORMATTED_UNITS.put(q, formatted)
+    return formatted
+
+
+def _get_dimensionality(unit: Optional[str]) -> Optional[pint.util.UnitsContainer]:
+    """Returns the dimensionality of a unit string or QUDT IRI, e.g. {'[length]': 1, '[time]': -1}
+    for "m s-1", or None if the unit cannot be parsed. None and empty units are dimensionless."""
+    if unit is None or unit in ('', '1', '-'):
+        unit = 'dimensionless'
+    dimensionality = _DIMENSIONALITIES.get(unit, _NOT_CACHED)
+    if dimensionality is _NOT_CACHED:
+        symbol = _QUDT_UNIT_INDEX.iri_to_symbol(unit) if unit.startswith('http') else unit
+        try:
+            dimensionality = None if symbol is None else _parse_unit(symbol.strip()).dimensionality
+        except (pint.errors.PintError, AttributeError, AssertionError, ValueError, TypeError, tokenize.TokenError):
+            dimensionality = None
+        _DIMENSIONALITIES.put(unit, dimensionality)
+    return dimensionality
+
+
+def unit_cache_info() -> Dict[str, CacheInfo]:
+    """Returns the statistics of the caches of parsed units, formatted units, dimensionalities
+    and resolved QUDT IRIs"""
+    return {"parse": _PARSED_UNITS.info(),
+            "format": _FORMATTED_UNITS.info(),
+            "dimensionality": _DIMENSIONALITIES.info(),
+            "qudt": _QUDT_UNIT_INDEX.cache_info()}
@@ -0,0 +1,431 @@
+import json
+import pathlib
+import re
+from typing import Container, Dict, Iterator, List, Optional, TextIO, Tuple, Union
+
+import rdflib
+
+from .namespace import SSNO
+from .ssno.standard_name import StandardName, ScalarStandardName, VectorStandardName, _STANDARD_NAME_KINDS
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+# prefixes used by `model_dump_jsonld`. They are used if a document has no (or a remote) context:
+_DEFAULT_PREFIXES = {
+    "ssno": "https://matthiasprobst.github.io/ssno#",
+    "dcterms": "http://purl.org/dc/terms/",
+    "skos": "http://www.w3.org/2004/02/skos/core#",
+}
+
+_STANDARD_NAME_CLASSES = {
+    str(SSNO.StandardName): StandardName,
+    str(SSNO.ScalarStandardName): ScalarStandardName,
+    str(SSNO.VectorStandardName): VectorStandardName,
+}
+# properties of a node, which are needed to build a standard name. All others are skipped:
+_STANDARD_NAME_PROPERTIES = {
+    str(SSNO.standardName): "standardName",
+    str(SSNO.unit): "unit",
+    str(SSNO.description): "description",
+    "http://purl.org/dc/terms/description": "description",
+}
+# properties whose values may contain standard names:
+_CONTAINERS = {"@graph", str(SSNO.standardNames)}
+
+
+# one triple per line: subject, predicate, object (IRI, blank node or literal with language or datatype):
+_NTRIPLE = re.compile(
+    r'[ \t]*(<[^>]*>|_:[^ \t.]+(?:\.[^ \t.]+)*)[ \t]*<([^>]*)>[ \t]*'
+    r'(<[^>]*>|_:[^ \t.]+(?:\.[^ \t.]+)*|"(?:[^"\\]|\\.)*"(?:@[a-zA-Z]+(?:-[a-zA-Z0-9]+)*|\^\^<[^>]*>)?)'
+    r'[ \t]*\.[ \t]*(?:#.*)?$'
+)
+_NT_ESCAPE = re.compile(r'\\(?:u([0-9A-Fa-f]{4})|U([0-9A-Fa-f]{8})|(.))')
+_NT_ESCAPED_CHARACTERS = {"t": "\t", "b": "\b", "n": "\n", "r": "\r", "f": "\f", '"': '"', "'": "'", "\\": "\\"}
+
+
+def _unescape(match: re.Match) -> str:
+    code = match.group(1) or match.group(2)
+    if code:
+        return chr(int(code, 16))
+    return _NT_ESCAPED_CHARACTERS[match.group(3)]
+
+
+def _nt_term(term: str) -> rdflib.term.Node:
+    """Returns the rdflib term of an N-Triples term"""
+    if term[0] == "<":
+        iri = term[1:-1]
+        return rdflib.URIRef(_NT_ESCAPE.sub(_unescape, iri) if "\\" in iri else iri)
+    if term[0] == "_":
+        return rdflib.BNode(term[2:])
+    end = term.rindex('"')
+    lexical = term[1:end]
+    if "\\" in lexical:
+        lexical = _NT_ESCAPE.sub(_unescape, lexical)
+    suffix = term[end + 1:]
+    if suffix.startswith("@"):
+        return rdflib.Literal(lexical, lang=suffix[1:])
+    if suffix:
+        return rdflib.Literal(lexical, datatype=rdflib.URIRef(suffix[3:-1]))
+    return rdflib.Literal(lexical)
+
+
+def iter_ntriples(source: Union[str, pathlib.Path, TextIO],
+                  predicates: Optional[Container[str]] = None
+                  ) -> Iterator[Tuple[rdflib.term.Node, rdflib.URIRef, rdflib.term.Node]]:
+    """Yields the triples of an N-Triples file line by line.
+
+    No graph is built. Blank nodes keep their labels, so that triples of the same file
+    refer to the same blank node.
+
+    Parameters
+    ----------
+    source: Union[str, pathlib.Path, TextIO]
+        The N-Triples file or a file object opened in text mode.
+    predicates: Optional[Container[str]]=None
+        If given, only triples with one of these predicates (IRIs) are returned. The other
+        lines are only checked for their syntax.
+
+    Raises
+    ------
+    ValueError
+        If a line is no valid triple.
+    """
+    if not hasattr(source, "read"):
+        with open(source, "r", encoding="utf-8") as f:
+            yield from iter_ntriples(f, predicates)
+        return
+    for line_number, line in enumerate(source, 1):
+        match = _NTRIPLE.match(line)
+        if match is None:
+            stripped = line.strip()
+            if not stripped or stripped.startswith("#"):
+                continue
+            raise ValueError(f"Invalid N-Triples in line {line_number}: {stripped}")
+        subject, predicate, obj = match.groups()
+        if predicates is not None and predicate not in predicates:
+            continue
+        yield _nt_term(subject), rdflib.URIRef(predicate), _nt_term(obj)
+
+
+class _JSONStream:
+    """Reads JSON values from a text file in chunks.
+
+    Only the structure of the containers, in which standard names are expected, is scanned
+    character by character. All other values are decoded at once with `json.JSONDecoder.raw_decode`,
+    so that the buffer never holds more than a chunk plus the value being decoded.
+    """
+
+    def __init__(self, file: TextIO, chunk_size: int):
+        self._file = file
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._offset = 0  # position of the buffer in the file (for error messages)
+        self._eof = False
+
+    def _read(self, size: Optional[int] = None) -> bool:
+        """Appends the next chunk to the buffer. Returns False at the end of the file"""
+        if self._eof:
+            return False
+        chunk = self._file.read(size or self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._offset += self._pos
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Returns the next non-whitespace character without consuming it ("" at the end of the file)"""
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._read():
+                return ""
+
+    def expect(self, characters: str) -> str:
+        """Consumes the next non-whitespace character, which must be one of the given characters"""
+        character = self.peek()
+        if not character or character not in characters:
+            raise ValueError(f"Invalid JSON at position {self._offset + self._pos}: Expected one of "
+                             f"{list(characters)}, got {character or 'end of file'!r}.")
+        self._pos += 1
+        return character
+
+    def decode(self):
+        """Decodes the next value"""
+        self.peek()
+        size = self._chunk_size
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError as e:
+                if not self._read(size):
+                    raise ValueError(f"Invalid JSON at position {self._offset + e.pos}: {e.msg}.") from e
+                size *= 2
+                continue
+            if end == len(self._buffer) and self._read(size):
+                # the value may continue in the next chunk, e.g. a number
+                continue
+            self._pos = end
+            return value
+
+
+class _Context:
+    """The (local) context of a JSON-LD node. Remote contexts are ignored."""
+
+    def __init__(self, definitions: Optional[Dict] = None):
+        self._definitions = definitions or {}
+        self._expanded: Dict[str, str] = {}
+
+    def update(self, local_context) -> "_Context":
+        """Returns the context extended by a (list of) local context(s)"""
+        if not isinstance(local_context, list):
+            local_context = [local_context]
+        definitions = dict(self._definitions)
+        for c in local_context:
+            if isinstance(c, dict):
+                definitions.update(c)
+        return _Context(definitions)
+
+    def expand(self, term: str) -> str:
+        """Expands a term or compact IRI to an IRI"""
+        iri = self._expanded.get(term, None)
+        if iri is None:
+            iri = self._expanded[term] = self._expand(term)
+        return iri
+
+    def _expand(self, term: str) -> str:
+        for _ in range(10):  # terms may be defined by other terms
+            definition = self._definitions.get(term, None)
+            if isinstance(definition, dict):
+                definition = definition.get("@id", None)
+            if not isinstance(definition, str) or definition == term:
+                break
+            term = definition
+        if ":" in term and not term.startswith("_:"):
+            prefix, suffix = term.split(":", 1)
+            if not suffix.startswith("//"):
+                namespace = self._definitions.get(prefix, _DEFAULT_PREFIXES.get(prefix, None))
+                if isinstance(namespace, str):
+                    return namespace + suffix
+        return term
+
+
+def _value(value):
+    """Returns the value of a compacted or expanded JSON-LD property"""
+    if isinstance(value, list):
+        value = value[0] if value else None
+    if isinstance(value, dict):
+        if "@value" in value:
+            return value["@value"]
+        return value.get("@id", None)
+    return value
+
+
+def _to_record(node: Dict, context: _Context) -> Optional[Dict]:
+    """Returns the record (see `build_standard_names`) of the standard name described by the properties
+    of a node or None, if it is no standard name"""
+    types = node.get("@type", [])
+    if not isinstance(types, list):
+        types = [types]
+    classes = [_STANDARD_NAME_CLASSES[t] for t in map(context.expand, types) if t in _STANDARD_NAME_CLASSES]
+    if not classes or "standardName" not in node:
+        # e.g. a reference to a standard name defined elsewhere in the document
+        return None
+    if VectorStandardName in classes:
+        kind = "vector"
+    else:
+        kind = "scalar" if classes[0] is ScalarStandardName else None
+    record = {"kind": kind}
+    record.update({field: _value(node[field]) for field in ("standardName", "unit", "description") if field in node})
+    if "@id" in node:
+        record["id"] = node["@id"]
+    return record
+
+
+def _to_standard_name(node: Dict, context: _Context) -> Optional[StandardName]:
+    """Returns the standard name described by the properties of a node or None, if it is no standard name"""
+    record = _to_record(node, context)
+    if record is None:
+        return None
+    return _STANDARD_NAME_KINDS[record.pop("kind")](**record)
+
+
+def _get_properties(node: Dict, context: _Context) -> Dict:
+    """Returns the properties of a decoded node needed to build a standard name"""
+    properties = {}
+    for key, value in node.items():
+        if key in ("@id", "@type"):
+            properties[key] = value
+        else:
+            iri = context.expand(key)
+            if iri in _STANDARD_NAME_PROPERTIES:
+                properties[_STANDARD_NAME_PROPERTIES[iri]] = value
+    return properties
+
+
+def _iter_decoded(node: Dict, context: _Context) -> Iterator[StandardName]:
+    """Yields the standard names of a node, which has been decoded already"""
+    if "@context" in node:
+        context = context.update(node["@context"])
+    for key, value in node.items():
+        if context.expand(key) in _CONTAINERS:
+            for v in (value if isinstance(value, list) else [value]):
+                if isinstance(v, dict):
+                    yield from _iter_decoded(v, context)
+    standard_name = _to_standard_name(_get_properties(node, context), context)
+    if standard_name is not None:
+        yield standard_name
+
+
+def _pop_standard_name_records(document: Union[Dict, List]) -> List[Dict]:
+    """Removes the standard names from a decoded JSON-LD document and returns their records.
+
+    The document keeps all other information, e.g. the metadata and modifiers of the table,
+    and can be parsed much faster without the standard names. The records can be built with
+    `build_standard_names`.
+
+    Parameters
+    ----------
+    document: Union[Dict, List]
+        The decoded JSON-LD document. It is changed in place.
+
+    Returns
+    -------
+    List[Dict]
+        The records of the standard names in the order of the document.
+    """
+    records = []
+    if isinstance(document, list):
+        _pop_records(document, _Context(), records)
+    else:
+        _pop_records_of_node(document, _Context(), records)
+    return records
+
+
+def _pop_records_of_node(node: Dict, context: _Context, records: List[Dict]):
+    if "@context" in node:
+        context = context.update(node["@context"])
+    for key, value in node.items():
+        if context.expand(key) in _CONTAINERS:
+            if isinstance(value, dict):
+                value = node[key] = [value]
+            if isinstance(value, list):
+                _pop_records(value, context, records)
+
+
+def _pop_records(items: List, context: _Context, records: List[Dict]):
+    remaining = []
+    for item in items:
+        if isinstance(item, dict):
+            item_context = context.update(item["@context"]) if "@context" in item else context
+            record = _to_record(_get_properties(item, item_context), item_context)
+            if record is not None:
+                records.append(record)
+                continue
+            _pop_records_of_node(item, context, records)
+        remaining.append(item)
+    items[:] = remaining
+
+
+def _iter_array(stream: _JSONStream, context: _Context, decode_items: bool) -> Iterator[StandardName]:
+    """Yields the standard names of an array.
+
+    The items of an array of standard names are small and decoded at once. The items of
+    other arrays (e.g. a "@graph") may contain a whole table and are hence streamed.
+    """
+    stream.expect("[")
+    if stream.peek() == "]":
+        stream.expect("]")
+        return
+    while True:
+        if stream.peek() == "{":
+            if decode_items:
+                yield from _iter_decoded(stream.decode(), context)
+            else:
+                yield from _iter_node(stream, context)
+        else:
+            stream.decode()
+        if stream.expect(",]") == "]":
+            return
+
+
+def _iter_node(stream: _JSONStream, context: _Context) -> Iterator[StandardName]:
+    """Yields the standard names of the node starting at the current position of the stream"""
+    stream.expect("{")
+    properties = {}
+    if stream.peek() != "}":
+        while True:
+            key = stream.decode()
+            stream.expect(":")
+            if key == "@context":
+                context = context.update(stream.decode())
+            else:
+                iri = context.expand(key)
+                if iri in _CONTAINERS and stream.peek() == "[":
+                    yield from _iter_array(stream, context, decode_items=iri != "@graph")
+                elif iri in _CONTAINERS and stream.peek() == "{":
+                    yield from _iter_node(stream, context)
+                elif key in ("@id", "@type"):
+                    properties[key] = stream.decode()
+                elif iri in _STANDARD_NAME_PROPERTIES:
+                    properties[_STANDARD_NAME_PROPERTIES[iri]] = stream.decode()
+                else:
+                    stream.decode()
+            if stream.expect(",}") == "}":
+                break
+    else:
+        stream.expect("}")
+    standard_name = _to_standard_name(properties, context)
+    if standard_name is not None:
+        yield standard_name
+
+
+def iter_standard_names(source: Union[str, pathlib.Path, TextIO],
+                        chunk_size: int = 2 ** 16) -> Iterator[StandardName]:
+    """Yields the standard names of a JSON-LD file while reading it.
+
+    In contrast to `parse_table`, neither the whole document nor an RDF graph is kept in memory.
+    The file is read in chunks and every standard name is returned as soon as it has been read.
+    Compacted documents (e.g. written by `StandardNameTable.to_jsonld`), expanded documents and
+    documents with a "@graph" are supported. Remote contexts are not resolved, but the prefixes
+    used by ssnolib (e.g. "ssno") are known.
+
+    Parameters
+    ----------
+    source: Union[str, pathlib.Path, TextIO]
+        The JSON-LD file or a file object opened in text mode.
+    chunk_size: int=2**16
+        Number of characters read at once.
+
+    Returns
+    -------
+    Iterator[StandardName]
+        The standard names in the order of the file.
+
+    Examples
+    --------
+    >>> for standard_name in iter_standard_names("cf.jsonld"):
+    ...     print(standard_name.standardName, standard_name.unit)
+    """
+    if hasattr(source, "read"):
+        yield from _iter_document(_JSONStream(source, chunk_size))
+        return
+    with open(source, "r", encoding="utf-8") as f:
+        yield from _iter_document(_JSONStream(f, chunk_size))
+
+
+def _iter_document(stream: _JSONStream) -> Iterator[StandardName]:
+    first = stream.peek()
+    if first == "[":
+        yield from _iter_array(stream, _Context(), decode_items=False)
+    elif first == "{":
+        yield from _iter_node(stream, _Context())
+    else:
+        stream.expect("[{")
+    if stream.peek():
+        raise ValueError("Invalid JSON: Unexpected data after the end of the document.")
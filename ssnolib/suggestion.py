@@ -0,0 +1,180 @@
+import itertools
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+
+def levenshtein(a: str, b: str, max_distance: Optional[int] = None) -> int:
+    """Returns the edit distance (insertions, deletions, substitutions) between two strings.
+
+    If max_distance is given, the computation stops as soon as the distance is known to be
+    larger and max_distance + 1 is returned.
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    if max_distance is not None and len(a) - len(b) > max_distance:
+        return max_distance + 1
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(previous[j] + 1,
+                               current[j - 1] + 1,
+                               previous[j - 1] + (char_a != char_b)))
+        if max_distance is not None and min(current) > max_distance:
+            return max_distance + 1
+        previous = current
+    return previous[-1]
+
+
+def _deletions(word: str, max_distance: int) -> Set[str]:
+    """Returns the word and all strings obtained by deleting up to max_distance characters"""
+    found = {word}
+    level = {word}
+    for _ in range(max_distance):
+        level = {w[:i] + w[i + 1:] for w in level for i in range(len(w))}
+        found |= level
+    return found
+
+
+class DeletionIndex:
+    """Index for finding all words within an edit distance of a query ("symmetric delete").
+
+    Every word is stored under all strings obtained by deleting up to `max_distance` of its
+    characters. Two words with an edit distance of at most `max_distance` share at least one
+    of these strings, so a search only looks up the deletions of the query instead of comparing
+    it to every word. The candidates found are verified with the (bounded) edit distance.
+
+    Parameters
+    ----------
+    words: Iterable[str]
+        The words to insert.
+    max_distance: int=2
+        The largest edit distance which can be searched for.
+    """
+
+    def __init__(self, words: Iterable[str] = (), max_distance: int = 2):
+        self.max_distance = max_distance
+        self._index: Dict[str, List[str]] = {}
+        self._words: Set[str] = set()
+        for word in words:
+            self.add(word)
+
+    def __len__(self):
+        return len(self._words)
+
+    def __contains__(self, word: str) -> bool:
+        return word in self._words
+
+    def add(self, word: str):
+        """Inserts a word"""
+        if word in self._words:
+            return
+        self._words.add(word)
+        for deletion in _deletions(word, self.max_distance):
+            self._index.setdefault(deletion, []).append(word)
+
+    def search(self, word: str, max_distance: Optional[int] = None) -> List[Tuple[int, str]]:
+        """Returns (distance, word) of all words within max_distance, closest first"""
+        if max_distance is None:
+            max_distance = self.max_distance
+        if max_distance > self.max_distance:
+            raise ValueError(f"The index supports distances up to {self.max_distance}, not {max_distance}.")
+        candidates = set()
+        for deletion in _deletions(word, max_distance):
+            candidates.update(self._index.get(deletion, ()))
+        found = []
+        for candidate in candidates:
+            distance = levenshtein(word, candidate, max_distance)
+            if distance <= max_distance:
+                found.append((distance, candidate))
+        return sorted(found)
+
+
+class NameSuggester:
+    """Suggests valid standard names close to an invalid one.
+
+    The suggester indexes all words used to build names: the words of core standard names,
+    qualification phrases, valid values and transformation names. The misspelled words of a
+    name (words not in the vocabulary) are replaced by close words or split into two known words
+    ("airtemperature"). If all words are known, single words are replaced or dropped. Names starting
+    with the given name are added. The resulting names are validated with the matcher and ranked by
+    their edit distance to the name.
+
+    Parameters
+    ----------
+    matcher: StandardNameMatcher
+        The matcher of the Standard Name Table.
+    """
+    max_candidates_per_word = 5  # number of close words tried per misspelled word
+    max_misspelled_words = 3  # no suggestions are made for names with more misspelled words
+
+    def __init__(self, matcher: "StandardNameMatcher"):
+        self._matcher = matcher
+        spec = matcher.to_dict()
+        words = set()
+        for name in spec["core_standard_names"]:
+            words.update(name.split("_"))
+        for q in spec["qualifications"]:
+            for phrase in q["phrases"]:
+                words.update(phrase.split("_"))
+        for t in spec["transformations"]:
+            words.update(w for w in t["name"].split("_") if w not in t["characters"])
+            for values in t["characters"].values():
+                for value in values or []:
+                    words.update(value.split("_"))
+        self._words = sorted(words)
+        self._indexes: Dict[int, DeletionIndex] = {}  # per max. distance, built on first use
+
+    def _get_index(self, max_distance: int) -> DeletionIndex:
+        index = self._indexes.get(max_distance, None)
+        if index is None:
+            index = self._indexes[max_distance] = DeletionIndex(self._words, max_distance)
+        return index
+
+    def suggest(self, standard_name: str, k: int = 5, max_distance: int = 2) -> List[str]:
+        """Returns up to k valid standard names close to the given name, closest first.
+
+        Parameters
+        ----------
+        standard_name: str
+            The (invalid) standard name.
+        k: int=5
+            Maximal number of suggestions.
+        max_distance: int=2
+            Maximal edit distance per word. Words shorter than 3 * max_distance characters allow
+            fewer edits.
+        """
+        index = self._get_index(max_distance)
+        words = standard_name.split("_")
+        misspelled = [i for i, word in enumerate(words) if word not in index]
+        if len(misspelled) > self.max_misspelled_words:
+            return []
+
+        def _alternatives(i: int) -> List[str]:
+            # short words are only compared to words with few edits, e.g. "x" to "y" but not to "ab":
+            distance = min(max_distance, max(1, len(words[i]) // 3))
+            alternatives = [w for _, w in index.search(words[i], distance) if w != words[i]]
+            alternatives = alternatives[:self.max_candidates_per_word]
+            # two words written as one:
+            alternatives.extend(f"{words[i][:j]}_{words[i][j:]}" for j in range(1, len(words[i]))
+                                if words[i][:j] in index and words[i][j:] in index)
+            return alternatives
+
+        candidates = set()
+        if misspelled:
+            for replacement in itertools.product(*[[(i, w) for w in _alternatives(i)] for i in misspelled]):
+                _words = list(words)
+                for i, w in replacement:
+                    _words[i] = w
+                candidates.add("_".join(_words))
+        else:
+            # all words are known, but the name is invalid, e.g. because of a wrong valid value
+            # or a qualification which is not allowed for the core standard name:
+            for i in range(len(words)):
+                candidates.update("_".join(words[:i] + [w] + words[i + 1:]) for w in _alternatives(i))
+                candidates.add("_".join(words[:i] + words[i + 1:]))
+
+        # words missing at the end:
+        candidates.update(self._matcher.complete(standard_name, limit=k))
+        candidates.discard(standard_name)
+        valid = [c for c in candidates if c and self._matcher.match(c) is not None]
+        return sorted(valid, key=lambda c: (levenshtein(standard_name, c), c))[:k]
@@ -1,3 +1,5 @@
+import pathlib
+
 import streamlit as st
 
 if "rdf_file" not in st.session_state:
@@ -33,7 +35,7 @@ if hdf5_file:
     st.toast("HDF5 file uploaded successfully.", icon="📤")
     st.session_state.hdf5_file = hdf5_file
 
-rdf_file = st.file_uploader("Upload a Standard Name Table file", type=["json-ld", "jsonld", "ttl"])
+rdf_file = st.file_uploader("Upload a Standard Name Table file", type=["json-ld", "jsonld", "ttl", "xml", "rdf", "nt"])
 if rdf_file:
     st.toast("Standard Name Table uploaded successfully.", icon="📤")
     st.session_state.rdf_file = rdf_file
@@ -105,7 +107,7 @@ def get_standard_names_from_hdf5(file):
 def upload_snt(file):
     try:
         st.toast("Processing Standard Name Table file...", icon="🔄")
-        snt = parse_table(data=file.read(), fmt="json-ld")
+        snt = parse_table(data=file.read(), fmt=pathlib.Path(file.name).suffix)
         if snt.label is not None:
             st.toast(f"Standard Name Table '{snt.label}' successfully loaded.", icon="📤")
         else:
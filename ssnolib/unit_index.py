@@ -0,0 +1,135 @@
+from typing import Dict, Optional, Union
+
+import pint
+import rdflib
+from ontolutils.utils import qudt_units
+
+from ssnolib import config
+from ssnolib.cache import CacheInfo, LRUCache
+
+_NOT_CACHED = object()
+
+
+class QudtUnitIndex:
+    """Bidirectional index of the QUDT lookup table (`ontolutils.utils.qudt_units.qudt_lookup`).
+
+    Maps unit symbols (e.g. "m/s") to QUDT IRIs, IRIs back to their first symbol in the lookup table
+    and normalized pint unit strings (e.g. "m/s**2") to IRIs. The symbol and IRI maps are built on
+    first use, the pint map, which requires parsing every symbol, on the first lookup by a pint string.
+    `resolve` memoizes the IRI of raw unit strings in a bounded cache (`config.unit_cache_size`).
+    The index is rebuilt if entries are added to the lookup table directly, but should be extended
+    with `update`.
+
+    Parameters
+    ----------
+    lookup: Dict[str, rdflib.URIRef]=None
+        The lookup table from unit symbols to QUDT IRIs. Defaults to the table of ontolutils.
+    """
+
+    def __init__(self, lookup: Dict[str, rdflib.URIRef] = None):
+        self._lookup = qudt_units.qudt_lookup if lookup is None else lookup
+        self._size = None  # size of the lookup table when the index was built
+        self._symbol_to_iri: Dict[str, str] = {}
+        self._iri_to_symbol: Dict[str, str] = {}
+        self._pint_to_iri: Optional[Dict[str, str]] = None
+        self._resolved = LRUCache(config.unit_cache_size)
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        self._build()
+        return len(self._symbol_to_iri)
+
+    def _build(self):
+        if self._size == len(self._lookup):
+            return
+        self._symbol_to_iri = {}
+        self._iri_to_symbol = {}
+        self._pint_to_iri = None
+        self._resolved.clear()
+        for symbol, iri in self._lookup.items():
+            self._add(symbol, iri)
+        self._size = len(self._lookup)
+
+    def _add(self, symbol: str, iri: Union[str, rdflib.URIRef]):
+        self._symbol_to_iri[symbol] = str(iri)
+        self._iri_to_symbol.setdefault(str(iri), symbol)
+        if self._pint_to_iri is not None:
+            self._add_pint_string(symbol, str(iri))
+
+    def _add_pint_string(self, symbol: str, iri: str):
+        from .ssno.unit_utils import _get_ureg, _replace_number_following_letter
+
+        try:
+            quantity = _get_ureg()(_replace_number_following_letter(symbol)).to_base_units()
+        except (pint.errors.PintError, AssertionError, AttributeError, ValueError, TypeError):
+            return
+        # only units, which are not scaled relative to the base units, e.g. not "mm":
+        if quantity.magnitude == 1:
+            self._pint_to_iri.setdefault("{:~}".format(quantity.units).replace(" ", ""), iri)
+
+    def update(self, lookup: Dict[str, rdflib.URIRef]):
+        """Adds entries to the QUDT lookup table and the index"""
+        self._build()
+        self._lookup.update(lookup)
+        self._resolved.clear()
+        for symbol, iri in lookup.items():
+            self._add(symbol, iri)
+        self._size = len(self._lookup)
+
+    def _count(self, result):
+        if result is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return result
+
+    def symbol_to_iri(self, symbol: str) -> Optional[str]:
+        """Returns the QUDT IRI of a unit symbol of the lookup table, e.g. "m/s" """
+        self._build()
+        return self._count(self._symbol_to_iri.get(symbol, None))
+
+    def iri_to_symbol(self, iri: Union[str, rdflib.URIRef]) -> Optional[str]:
+        """Returns the (first) unit symbol of a QUDT IRI in the lookup table"""
+        self._build()
+        return self._count(self._iri_to_symbol.get(str(iri), None))
+
+    def _get_pint_to_iri(self) -> Dict[str, str]:
+        self._build()
+        if self._pint_to_iri is None:
+            self._pint_to_iri = {}
+            for symbol, iri in self._symbol_to_iri.items():
+                self._add_pint_string(symbol, iri)
+        return self._pint_to_iri
+
+    def pint_to_iri(self, unit: str) -> Optional[str]:
+        """Returns the QUDT IRI of a unit string as formatted by pint in base units, e.g. "kg/m/s" """
+        pint_to_iri = self._get_pint_to_iri()
+        return self._count(self._symbol_to_iri.get(unit, None) or pint_to_iri.get(unit, None))
+
+    def resolve(self, unit: str) -> Optional[str]:
+        """Returns the QUDT IRI of a unit string, which is either a symbol of the lookup table
+        or a unit, which pint normalizes to one, e.g. "kg/(m*s)". The result is memoized per raw string."""
+        self._build()
+        iri = self._resolved.get(unit, _NOT_CACHED)
+        if iri is _NOT_CACHED:
+            iri = self._symbol_to_iri.get(unit.strip(), None)
+            if iri is None:
+                from .ssno.unit_utils import _parse_unit, _format_unit
+
+                try:
+                    _unit = _format_unit(str(_parse_unit(unit.strip())))
+                except (AttributeError, KeyError, pint.errors.DimensionalityError):
+                    _unit = None
+                if _unit is not None:
+                    iri = self._symbol_to_iri.get(_unit, None) or self._get_pint_to_iri().get(_unit, None)
+            self._resolved.put(unit, iri)
+        return self._count(iri)
+
+    def cache_info(self) -> CacheInfo:
+        """Returns the statistics of the cache of `resolve`"""
+        return self._resolved.info()
+
+    def info(self) -> CacheInfo:
+        """Returns the hit/miss statistics of the lookups"""
+        return CacheInfo(hits=self.hits, misses=self.misses, evictions=0, maxsize=None, currsize=len(self))
@@ -0,0 +1,65 @@
+import pickle
+import unittest
+
+from ssnolib.cache import LRUCache, VersionedList
+
+
+class TestCache(unittest.TestCase):
+
+    def test_lru_cache(self):
+        cache = LRUCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        self.assertEqual(1, cache.get("a"))  # "b" is now the least recently used entry
+        cache.put("c", 3)
+        self.assertNotIn("b", cache)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(3, cache.get("c"))
+
+        info = cache.info()
+        self.assertEqual(2, info.hits)
+        self.assertEqual(1, info.misses)
+        self.assertEqual(1, info.evictions)
+        self.assertEqual(2, info.currsize)
+        self.assertEqual(2, info.maxsize)
+
+        self.assertEqual(["a", "c"], cache.keys())
+        self.assertEqual(1, cache.pop("a"))
+        self.assertIsNone(cache.pop("a"))
+        self.assertEqual(["c"], cache.keys())
+        self.assertEqual(2, cache.info().hits)
+
+        cache.clear()
+        self.assertEqual(0, len(cache))
+        self.assertEqual(2, cache.info().hits)
+
+    def test_lru_cache_size(self):
+        cache = LRUCache(maxsize=0)
+        cache.put("a", 1)
+        self.assertEqual(0, len(cache))
+
+        cache = LRUCache(maxsize=None)
+        for i in range(100):
+            cache.put(i, i)
+        self.assertEqual(100, len(cache))
+        self.assertEqual(0, cache.info().evictions)
+
+        with self.assertRaises(ValueError):
+            LRUCache(maxsize=-1)
+
+    def test_versioned_list(self):
+        lst = VersionedList([1, 2])
+        self.assertEqual([1, 2], lst)
+        self.assertEqual(0, lst.version)
+        lst[0] = 3
+        del lst[1]
+        lst += [4]
+        lst.insert(0, 5)
+        lst.pop()
+        self.assertEqual([5, 3], lst)
+        self.assertEqual(5, lst.version)
+
+        restored = pickle.loads(pickle.dumps(lst))
+        self.assertIsInstance(restored, VersionedList)
+        self.assertEqual([5, 3], restored)
+        self.assertEqual(5, restored.version)
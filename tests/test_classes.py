@@ -231,6 +231,37 @@ class TestClasses(unittest.TestCase):
 
         # http://qudt.org/vocab/unit/K
 
+    def test_build_standard_names(self):
+        from ssnolib.ssno.standard_name import build_standard_names
+        x_velocity = ssnolib.StandardName(standardName='x_velocity', unit='m/s', description='x velocity')
+        records = [
+            {'standardName': 'velocity', 'unit': 'm/s', 'description': 'velocity', 'kind': 'vector'},
+            {'standardName': 'air_temperature', 'unit': 'K', 'description': 'air temperature', 'kind': 'scalar'},
+            {'standardName': 'air_density', 'unit': 'kg m-3', 'description': 'air density'},
+            {'standardName': 'temperature', 'unit': 'K'},
+            x_velocity
+        ]
+        standard_names = build_standard_names(records)
+        self.assertEqual(['velocity', 'air_temperature', 'air_density', 'temperature', 'x_velocity'],
+                         [sn.standardName for sn in standard_names])
+        self.assertEqual([ssnolib.VectorStandardName, ssnolib.ScalarStandardName, ssnolib.StandardName,
+                          ssnolib.StandardName, ssnolib.StandardName],
+                         [type(sn) for sn in standard_names])
+        self.assertEqual('http://qudt.org/vocab/unit/K', standard_names[1].unit)
+        self.assertEqual('http://qudt.org/vocab/unit/K', standard_names[3].unit)
+        self.assertIs(x_velocity, standard_names[4])
+        self.assertEqual('kind', list(records[0])[-1])  # records are not changed
+
+        records = [{'standardName': 'air_temperature', 'unit': 'invalid_unit'},
+                   {'standardName': 'air_density', 'unit': 'kg m-3'},
+                   {'standardName': 'Invalid_Name', 'unit': 'K'}]
+        with self.assertRaises(pydantic.ValidationError):
+            build_standard_names(records)
+        errors = []
+        standard_names = build_standard_names(records, on_error=lambda record, e: errors.append(record))
+        self.assertEqual(['air_density'], [sn.standardName for sn in standard_names])
+        self.assertEqual(['air_temperature', 'Invalid_Name'], [r['standardName'] for r in errors])
+
     @unittest.skipIf(condition=9 < get_python_version()[1] < 13,
                      reason="Only testing on min and max python version")
     def test_snt_from_yaml(self):
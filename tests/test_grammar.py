@@ -0,0 +1,193 @@
+import pathlib
+import pickle
+import unittest
+
+import rdflib
+from ontolutils import set_config
+
+import ssnolib
+from ssnolib.grammar import CoreNameTrie, StandardNameMatcher
+from ssnolib.namespace import SSNO
+
+__this_dir__ = pathlib.Path(__file__).parent
+
+
+class TestGrammar(unittest.TestCase):
+
+    def test_core_name_trie(self):
+        trie = CoreNameTrie(["pressure", "static_pressure", "velocity", "x_velocity"])
+        self.assertEqual(4, len(trie))
+        self.assertIn("static_pressure", trie)
+        self.assertNotIn("static", trie)
+
+        self.assertEqual(["static_pressure", "pressure"], trie.find("total_static_pressure"))
+        self.assertEqual(["x_velocity", "velocity"], trie.find("mean_x_velocity"))
+        # only occurrences at word boundaries are found:
+        self.assertEqual([], trie.find("xvelocity"))
+        self.assertEqual([], trie.find("temperature"))
+
+        trie.add("temperature")
+        trie.add("temperature")
+        self.assertEqual(5, len(trie))
+        self.assertEqual(["temperature"], trie.find("air_temperature"))
+
+    def test_standard_name_matcher(self):
+        with set_config(blank_id_generator=lambda: f"https://example.org/#{rdflib.BNode()}"):
+            surface = ssnolib.Qualification(name="surface", description="surface",
+                                            hasValidValues=["toa", "tropopause"],
+                                            before=SSNO.AnyStandardName)
+            component = ssnolib.VectorQualification(name="component", description="component",
+                                                    hasValidValues=["x", "y"])
+            component.before = surface
+            at_surface = ssnolib.Qualification(name="surface", description="surface", hasPreposition="at",
+                                               hasValidValues=["sea_floor"], after=SSNO.AnyStandardName)
+            X = ssnolib.Character(character="X", associatedWith=SSNO.AnyStandardName)
+            Y = ssnolib.Character(character="Y", associatedWith=SSNO.AnyStandardName)
+            snt = ssnolib.StandardNameTable(id="https://example.org/snt")
+            snt.hasModifier = [
+                surface, component, at_surface,
+                ssnolib.Transformation(name="derivative_of_X_wrt_Y", altersUnit="[X]/[Y]",
+                                       hasCharacter=[X, Y], description="dX/dY"),
+                ssnolib.Transformation(name="mean_of_X", altersUnit="[X]", hasCharacter=[X], description="mean")
+            ]
+            snt.append("standardNames", ssnolib.VectorStandardName(standardName="velocity", unit="m/s",
+                                                                   description="velocity"))
+            snt.append("standardNames", ssnolib.ScalarStandardName(standardName="pressure", unit="Pa",
+                                                                   description="pressure"))
+            snt.append("standardNames", ssnolib.ScalarStandardName(standardName="x_coordinate", unit="m",
+                                                                   description="x coordinate"))
+
+            matcher = snt.matcher
+            self.assertIs(matcher, snt.matcher)
+
+            parse = matcher.match("x_toa_velocity_at_sea_floor")
+            self.assertEqual("velocity", parse.core_standard_name)
+            self.assertEqual((str(component.id), str(surface.id), str(at_surface.id)),
+                             tuple(qid for qid, _ in parse.qualifications))
+            self.assertEqual(("x", "toa", "at_sea_floor"), tuple(phrase for _, phrase in parse.qualifications))
+            self.assertEqual("x_coordinate", matcher.match("toa_x_coordinate").core_standard_name)
+
+            # component can only qualify vector standard names:
+            self.assertIsNone(matcher.match("x_pressure"))
+            self.assertIsNone(matcher.match("xvelocity"))
+            self.assertIsNone(matcher.match("X_velocity"))
+
+            parse = matcher.match("mean_of_derivative_of_pressure_wrt_x_coordinate")
+            self.assertEqual("mean_of_X", parse.transformation)
+            derivative = parse.arguments[0][1]
+            self.assertEqual("derivative_of_X_wrt_Y", derivative.transformation)
+            self.assertEqual(["pressure", "x_coordinate"], [a.standard_name for _, a in derivative.arguments])
+            self.assertIsNone(matcher.match("mean_of_mean_of_pressure", max_depth=1))
+            self.assertIn("mean_of_mean_of_pressure", matcher)
+            self.assertNotIn("mean_of_temperature", matcher)
+
+            # export and reload:
+            filename = matcher.to_json(__this_dir__ / "matcher.json", overwrite=True)
+            reloaded = StandardNameMatcher.from_json(filename)
+            filename.unlink()
+            self.assertEqual(matcher.match("mean_of_toa_pressure"), reloaded.match("mean_of_toa_pressure"))
+            self.assertEqual(matcher.match("y_velocity"), pickle.loads(pickle.dumps(matcher)).match("y_velocity"))
+
+            # the matcher is rebuilt if the table changes:
+            snt.append("standardNames", ssnolib.ScalarStandardName(standardName="temperature", unit="K",
+                                                                   description="temperature"))
+            self.assertIsNot(matcher, snt.matcher)
+            self.assertIn("mean_of_temperature", snt.matcher)
+
+    def test_matcher_skips_transformation_with_unknown_set(self):
+        # "difference_of_X_across_DEVICE" refers to a domain concept set, which is not part of the table:
+        self.addCleanup(setattr, ssnolib.config, 'use_snapshots', ssnolib.config.use_snapshots)
+        ssnolib.config.use_snapshots = False
+        snt = ssnolib.parse_table(__this_dir__ / "data/opencefadb_snt.jsonld")
+        with self.assertWarns(UserWarning) as cm:
+            matcher = snt.matcher
+        self.assertIn("difference_of_X_across_DEVICE", str(cm.warning))
+        self.assertNotIn("difference_of_X_across_DEVICE",
+                         [t["name"] for t in matcher.to_dict()["transformations"]])
+        self.assertIsNone(snt.get_standard_name("foo_bar"))
+        self.assertIsNone(snt.get_standard_name("derivative_of_blade_angle_wrt_blade_thickness"))
+        self.assertIsNotNone(snt.get_standard_name("arithmetic_mean_of_blade_angle"))
+
+    def test_iter_and_count_valid_names(self):
+        with set_config(blank_id_generator=lambda: f"https://example.org/#{rdflib.BNode()}"):
+            component = ssnolib.VectorQualification(name="component", description="component",
+                                                    hasValidValues=["x", "y"], before=SSNO.AnyStandardName)
+            at_surface = ssnolib.Qualification(name="surface", description="surface", hasPreposition="at",
+                                               hasValidValues=["sea_floor", "toa"], after=SSNO.AnyStandardName)
+            X = ssnolib.Character(character="X", associatedWith=SSNO.AnyStandardName)
+            snt = ssnolib.StandardNameTable(id="https://example.org/snt")
+            snt.hasModifier = [
+                component, at_surface,
+                ssnolib.Transformation(name="mean_of_X", altersUnit="[X]", hasCharacter=[X], description="mean"),
+                ssnolib.Transformation(name="X_at_2_sigma", altersUnit="[X]", hasCharacter=[X],
+                                       description="nonsense")
+            ]
+            snt.append("standardNames", ssnolib.VectorStandardName(standardName="velocity", unit="m/s",
+                                                                   description="velocity"))
+            snt.append("standardNames", ssnolib.ScalarStandardName(standardName="pressure", unit="Pa",
+                                                                   description="pressure"))
+
+            names = list(snt.iter_valid_names(max_transform_depth=0))
+            self.assertEqual(9 + 3, len(names))  # (1+2)*(1+2) for velocity, 1+2 for pressure
+            self.assertIn("y_velocity_at_toa", names)
+            self.assertNotIn("x_pressure", names)
+            self.assertEqual(len(names), snt.count_valid_names(max_transform_depth=0))
+
+            for depth in (1, 2):
+                names = list(snt.iter_valid_names(max_transform_depth=depth))
+                self.assertEqual(len(names), snt.count_valid_names(max_transform_depth=depth))
+                for name in names:
+                    self.assertIsNotNone(snt.matcher.match(name, max_depth=depth), name)
+            # the grammar is ambiguous for nested transformations, e.g. mean_of_(X_at_2_sigma) and
+            # (mean_of_X)_at_2_sigma construct the same name:
+            self.assertEqual(84, len(names))
+            self.assertEqual(72, len(set(names)))
+            self.assertIn("mean_of_x_velocity_at_toa_at_2_sigma", names)
+            self.assertEqual(12 + 2 * 12, snt.count_valid_names())
+
+            # counting does not enumerate:
+            self.assertEqual(12 * (1 + 2 + 4 + 8 + 16 + 32 + 64 + 128 + 256 + 512 + 1024),
+                             snt.count_valid_names(max_transform_depth=10))
+            with self.assertRaises(ValueError):
+                snt.iter_valid_names(max_transform_depth=-1)
+
+    def test_complete(self):
+        with set_config(blank_id_generator=lambda: f"https://example.org/#{rdflib.BNode()}"):
+            component = ssnolib.VectorQualification(name="component", description="component",
+                                                    hasValidValues=["x", "y"], before=SSNO.AnyStandardName)
+            at_surface = ssnolib.Qualification(name="surface", description="surface", hasPreposition="at",
+                                               hasValidValues=["sea_floor", "toa"], after=SSNO.AnyStandardName)
+            X = ssnolib.Character(character="X", associatedWith=SSNO.AnyStandardName)
+            Y = ssnolib.Character(character="Y", associatedWith=SSNO.AnyStandardName)
+            snt = ssnolib.StandardNameTable(id="https://example.org/snt")
+            snt.hasModifier = [
+                component, at_surface,
+                ssnolib.Transformation(name="derivative_of_X_wrt_Y", altersUnit="[X]/[Y]",
+                                       hasCharacter=[X, Y], description="dX/dY"),
+                ssnolib.Transformation(name="X_at_2_sigma", altersUnit="[X]", hasCharacter=[X],
+                                       description="nonsense")
+            ]
+            snt.append("standardNames", ssnolib.VectorStandardName(standardName="velocity", unit="m/s",
+                                                                   description="velocity"))
+            snt.append("standardNames", ssnolib.ScalarStandardName(standardName="x_coordinate", unit="m",
+                                                                   description="x coordinate"))
+            for i in range(12):
+                snt.append("standardNames", ssnolib.ScalarStandardName(standardName=f"quantity_{i}", unit="Pa",
+                                                                       description="quantity"))
+
+            self.assertEqual(["x_coordinate", "x_coordinate_at_sea_floor", "x_coordinate_at_toa", "x_velocity"],
+                             snt.complete("x_", limit=4))
+            self.assertEqual(["velocity_at_toa", "velocity_at_toa_at_2_sigma"], snt.complete("velocity_at_t"))
+            self.assertEqual(["velocity_at_toa"], snt.complete("velocity_at_t", max_transform_depth=0))
+            self.assertEqual([], snt.complete("temperature"))
+            self.assertEqual([], snt.complete("x_", limit=0))
+            self.assertEqual(20, len(snt.complete("")))
+
+            # the completions equal the valid names starting with the prefix:
+            names = set(snt.iter_valid_names(max_transform_depth=1))
+            for prefix in ("x", "x_", "y_vel", "quantity_1", "derivative_of_quantity_1_wrt_",
+                           "derivative_of_x_velocity_at_toa_wrt_quantity_1", "quantity_11_at"):
+                self.assertEqual({n for n in names if n.startswith(prefix)},
+                                 set(snt.complete(prefix, limit=len(names))), prefix)
+            for name in snt.complete("derivative_of_", max_transform_depth=3):
+                self.assertIsNotNone(snt.matcher.match(name, max_depth=3))
@@ -0,0 +1,40 @@
+import pathlib
+import subprocess
+import sys
+import unittest
+
+__this_dir__ = pathlib.Path(__file__).parent
+
+# packages which take long to import and must only be loaded when used. Asserting on the loaded
+# modules instead of the wall-clock time of "import ssnolib" keeps the test independent of the machine:
+_DEFERRED_PACKAGES = ('numpy', 'ontolutils', 'pint', 'pydantic', 'rdflib', 'requests', 'yaml')
+
+
+def _run(code: str) -> str:
+    return subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True,
+                          cwd=__this_dir__.parent).stdout.strip()
+
+
+class TestImport(unittest.TestCase):
+
+    def test_lazy_imports(self):
+        loaded = _run("import sys\n"
+                      "import ssnolib\n"
+                      "print(' '.join(m for m in sys.modules if m.split('.')[0] in "
+                      f"{_DEFERRED_PACKAGES!r} or m.startswith('ssnolib.ssno')))")
+        self.assertEqual("", loaded)
+
+        self.assertEqual("StandardNameTable ssnolib.schema", _run(
+            "import ssnolib\n"
+            "print(ssnolib.StandardNameTable.__name__, ssnolib.schema.__name__)"
+        ))
+        self.assertEqual("False", _run(
+            "import ssnolib.ssno.unit_utils as unit_utils\n"
+            "print(unit_utils._UREG is not None)"
+        ))
+
+    def test_unknown_attribute(self):
+        import ssnolib
+        with self.assertRaises(AttributeError):
+            ssnolib.not_an_attribute
+        self.assertIn("StandardNameTable", dir(ssnolib))
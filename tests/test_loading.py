@@ -0,0 +1,60 @@
+import pathlib
+import shutil
+import unittest
+
+import yaml
+
+import ssnolib
+from ssnolib import parse_table
+from ssnolib.loading import TableRegistry
+
+__this_dir__ = pathlib.Path(__file__).parent
+
+
+class TestLoading(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = __this_dir__ / 'tmp' / 'tables'
+        self.tmp_dir.mkdir(parents=True, exist_ok=True)
+        for filename in ('simpleSNT.jsonld', 'opencefadb_snt.jsonld'):
+            shutil.copy(__this_dir__ / 'data' / filename, self.tmp_dir / filename)
+        with open(self.tmp_dir / 'snt.yaml', 'w') as f:
+            yaml.dump({'id': 'https://example.org/yaml_snt',
+                       'name': 'YAML SNT',
+                       'standardNames': {'x_velocity': {'description': 'x component of velocity',
+                                                        'unit': 'm s-1'}}}, f)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_load_tables(self):
+        registry = ssnolib.load_tables(self.tmp_dir)
+        self.assertIsInstance(registry, TableRegistry)
+        self.assertEqual(3, len(registry))
+        self.assertEqual(['opencefadb_snt.jsonld', 'simpleSNT.jsonld', 'snt.yaml'],
+                         [info.filename.name for info in registry.timings])
+        self.assertTrue(all(info.seconds > 0 for info in registry.timings))
+        self.assertEqual([], registry.errors)
+
+        expected = parse_table(self.tmp_dir / 'opencefadb_snt.jsonld')
+        key = str(expected.identifier or expected.id)
+        self.assertEqual(len(expected.standardNames), len(registry[key].standardNames))
+        self.assertEqual('YAML SNT', registry['https://example.org/yaml_snt'].title)
+
+        parallel_registry = ssnolib.load_tables(str(self.tmp_dir / '*'), workers=2)
+        self.assertEqual(sorted(registry), sorted(parallel_registry))
+        self.assertEqual([info.key for info in registry.timings], [info.key for info in parallel_registry.timings])
+        self.assertEqual(len(registry[key].standardNames), len(parallel_registry[key].standardNames))
+
+        registry = ssnolib.load_tables([self.tmp_dir / 'snt.yaml'])
+        self.assertEqual(['https://example.org/yaml_snt'], list(registry))
+
+    def test_load_tables_errors(self):
+        (self.tmp_dir / 'invalid.ttl').write_text('no turtle')
+        shutil.copy(self.tmp_dir / 'snt.yaml', self.tmp_dir / 'snt_copy.yaml')
+        with self.assertWarns(UserWarning) as cm:
+            registry = ssnolib.load_tables(self.tmp_dir)
+        self.assertEqual(3, len(registry))
+        self.assertEqual(['invalid.ttl', 'snt_copy.yaml'], [info.filename.name for info in registry.errors])
+        self.assertIsNone(registry.errors[0].key)
+        self.assertIn('2 table file(s) could not be loaded', str(cm.warnings[-1].message))
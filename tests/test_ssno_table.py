@@ -3,7 +3,9 @@ import pathlib
 import platform
 import shutil
 import sys
+import tempfile
 import unittest
+import unittest.mock
 from datetime import datetime
 
 import pydantic
@@ -20,6 +22,7 @@ from ontolutils.namespacelib.m4i import M4I
 from ontolutils.utils.qudt_units import parse_unit
 
 import ssnolib
+from ssnolib import resolution
 from ssnolib import Qualification, Transformation, Character, DomainConceptSet
 from ssnolib import StandardNameTable, AgentRole, StandardName, VectorStandardName
 from ssnolib import parse_table
@@ -345,6 +348,152 @@ class TestSSNOStandardNameTable(unittest.TestCase):
         self.assertEqual('http://qudt.org/vocab/unit/M-PER-SEC', sn.unit)
         self.assertEqual("x_velocity", sn.standardName)
 
+    def test_parse_table_direct_engine(self):
+        def _dump(obj):
+            # the order of the objects depends on the graph, not on the engine:
+            if isinstance(obj, list):
+                return sorted((_dump(o) for o in obj), key=lambda o: json.dumps(o, sort_keys=True, default=str))
+            if isinstance(obj, dict):
+                return {k: _dump(v) for k, v in obj.items()}
+            return obj
+
+        # the engines are compared, hence the tables must not be loaded from snapshots:
+        self.addCleanup(setattr, ssnolib.config, 'use_snapshots', ssnolib.config.use_snapshots)
+        ssnolib.config.use_snapshots = False
+
+        for filename in ("simpleSNT.jsonld", "snt_from_scratch.jsonld", "opencefadb_snt.jsonld"):
+            sparql_snt = parse_table(__this_dir__ / "data" / filename)
+            direct_snt = parse_table(__this_dir__ / "data" / filename, engine="direct")
+            for field in ("id", "title", "version", "description", "hasModifier", "hasDomainConceptSet",
+                          "standardNames"):
+                self.assertEqual(_dump(sparql_snt.model_dump()[field]), _dump(direct_snt.model_dump()[field]))
+            # organizations are created without id, hence blank node ids differ:
+            self.assertEqual(
+                _dump(sparql_snt.model_dump(exclude={"qualifiedAttribution": {"__all__": {"agent": {"id"}}}})),
+                _dump(direct_snt.model_dump(exclude={"qualifiedAttribution": {"__all__": {"agent": {"id"}}}}))
+            )
+            self.assertTrue(direct_snt.verify_name(direct_snt.standardNames[0].standardName))
+
+        with self.assertRaises(ValueError):
+            parse_table(__this_dir__ / "data/simpleSNT.jsonld", engine="sql")
+        with self.assertRaises(ValueError):
+            parse_table(data={"@context": {}, "@id": "https://example.org/#a"}, fmt="jsonld", engine="direct")
+
+    def test_parse_table_rdf_formats(self):
+        # the engines are compared, hence the tables must not be loaded from snapshots:
+        self.addCleanup(setattr, ssnolib.config, 'use_snapshots', ssnolib.config.use_snapshots)
+        ssnolib.config.use_snapshots = False
+        tmp_dir = __this_dir__ / 'tmp'
+        tmp_dir.mkdir(exist_ok=True)
+        filename = __this_dir__ / 'data/opencefadb_snt.jsonld'
+        expected = parse_table(filename)
+        g = rdflib.Graph()
+        g.parse(filename, format="json-ld")
+        for rdf_format, suffix in (("turtle", "ttl"), ("xml", "xml"), ("nt", "nt")):
+            g.serialize(tmp_dir / f"snt.{suffix}", format=rdf_format, encoding="utf-8")
+            for engine in (None, "direct", "sparql"):
+                snt = parse_table(tmp_dir / f"snt.{suffix}", engine=engine)
+                self.assertEqual(expected.title, snt.title)
+                self.assertEqual(sorted((sn.standardName, sn.unit) for sn in expected.standardNames),
+                                 sorted((sn.standardName, sn.unit) for sn in snt.standardNames))
+                self.assertEqual(sorted(m.name for m in expected.hasModifier),
+                                 sorted(m.name for m in snt.hasModifier))
+                self.assertEqual(len(expected.qualifiedAttribution), len(snt.qualifiedAttribution))
+                self.assertTrue(snt.verify_name("blade_angle"))
+
+        # N-Triples with triples not belonging to the table, given as data:
+        nt = g.serialize(format="nt") + '<https://example.org/#a> <https://example.org/#b> "c"@en .\n'
+        snt = parse_table(data=nt, fmt="nt")
+        self.assertEqual(len(expected.standardNames), len(snt.standardNames))
+        with self.assertRaises(ValueError):
+            parse_table(data="<https://example.org/#a> <https://example.org/#b> c .", fmt="nt")
+        with self.assertRaises(ValueError):
+            parse_table(data=nt, fmt="csv")
+
+    def test_snapshot(self):
+        tmp_dir = __this_dir__ / 'tmp'
+        tmp_dir.mkdir(exist_ok=True)
+        snt = parse_table(__this_dir__ / 'data/opencefadb_snt.jsonld')
+        snapshot = snt.to_snapshot(tmp_dir / 'snt.snt')
+        loaded = StandardNameTable.from_snapshot(snapshot)
+        self.assertEqual(snt.model_dump(), loaded.model_dump())
+        self.assertEqual(snt.model_fields_set, loaded.model_fields_set)
+        self.assertIsInstance(loaded.standardNames[0], StandardName)
+        self.assertTrue(loaded.verify_name("blade_angle"))
+        self.assertEqual(snt.get_standard_name("blade_angle"), loaded.get_standard_name("blade_angle"))
+        # in-place changes of a loaded table are recognized, even if the snapshot holds a plain list:
+        snt.__dict__["standardNames"] = list(snt.standardNames)
+        loaded = StandardNameTable.from_snapshot(snt.to_snapshot(tmp_dir / 'snt.snt'))
+        self.assertIsNotNone(loaded.get_standard_name("blade_angle"))
+        loaded.standardNames[0] = StandardName(standardName="snapshot_velocity", unit="m/s", description="velocity")
+        self.assertEqual("snapshot_velocity", loaded.get_standard_name("snapshot_velocity").standardName)
+
+        # written by another version of ssnolib:
+        content = snapshot.read_bytes()
+        (tmp_dir / 'old.snt').write_bytes(content.replace(ssnolib.__version__.encode(), b"0.0.0", 1))
+        with self.assertRaises(ValueError):
+            StandardNameTable.from_snapshot(tmp_dir / 'old.snt')
+        # written in another snapshot format by the same version of ssnolib:
+        header = f"{ssnolib.__version__} {ssnolib.ssno.standard_name_table._SNAPSHOT_FORMAT}".encode()
+        (tmp_dir / 'old.snt').write_bytes(content.replace(header, ssnolib.__version__.encode(), 1))
+        with self.assertRaises(ValueError):
+            StandardNameTable.from_snapshot(tmp_dir / 'old.snt')
+        with self.assertRaises(ValueError):
+            StandardNameTable.from_snapshot(__this_dir__ / 'data/opencefadb_snt.jsonld')
+
+    def test_snapshot_cache(self):
+        with set_config(blank_id_generator=lambda: f"https://example.org/#{rdflib.BNode()}"):
+            snt = StandardNameTable(title=f"Snapshot test {rdflib.BNode()}",
+                                    standardNames=[StandardName(standardName="x_velocity", unit="m/s",
+                                                                description="x velocity")])
+        tmp_dir = __this_dir__ / 'tmp'
+        tmp_dir.mkdir(exist_ok=True)
+        filename = snt.to_jsonld(tmp_dir / 'snt.jsonld', base_uri="https://example.org/")
+        # the snapshots are written to a temporary directory instead of the cache directory of the user:
+        snapshot_dir = pathlib.Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, snapshot_dir)
+        for name in ('use_snapshots', 'snapshot_dir', 'max_snapshots'):
+            self.addCleanup(setattr, ssnolib.config, name, getattr(ssnolib.config, name))
+        ssnolib.config.snapshot_dir = snapshot_dir
+
+        get_snapshot_filename = ssnolib.ssno.standard_name_table._get_snapshot_filename
+        snapshot = get_snapshot_filename(filename.read_bytes(), StandardNameTable, "json-ld", None)
+        direct_snapshot = get_snapshot_filename(filename.read_bytes(), StandardNameTable, "json-ld", "direct")
+        self.assertEqual(snapshot_dir, snapshot.parent)
+
+        # snapshots are opt-in:
+        self.assertFalse(ssnolib.config.use_snapshots)
+        parse_table(filename)
+        self.assertFalse(snapshot.exists())
+
+        ssnolib.config.use_snapshots = True
+        parsed = parse_table(filename)
+        self.assertTrue(snapshot.exists())
+        self.assertEqual(parsed.model_dump(), parse_table(filename).model_dump())
+        self.assertEqual(parsed.model_dump(), StandardNameTable.from_snapshot(snapshot).model_dump())
+
+        # a corrupt snapshot is replaced:
+        snapshot.write_bytes(b"no snapshot")
+        self.assertEqual(parsed.model_dump(), parse_table(filename).model_dump())
+        self.assertEqual(parsed.model_dump(), StandardNameTable.from_snapshot(snapshot).model_dump())
+
+        # the engine and the configuration are part of the key:
+        self.assertFalse(direct_snapshot.exists())
+        parse_table(filename, engine="direct")
+        self.assertTrue(direct_snapshot.exists())
+        raise_error_on_unparsable_unit = ssnolib.config.raise_error_on_unparsable_unit
+        try:
+            ssnolib.config.raise_error_on_unparsable_unit = not raise_error_on_unparsable_unit
+            self.assertNotEqual(snapshot, get_snapshot_filename(filename.read_bytes(), StandardNameTable,
+                                                                "json-ld", None))
+        finally:
+            ssnolib.config.raise_error_on_unparsable_unit = raise_error_on_unparsable_unit
+
+        # only the most recently used snapshots are kept:
+        ssnolib.config.max_snapshots = 1
+        parse_table(filename)
+        self.assertEqual([snapshot], list(snapshot_dir.glob("*.snt")))
+
     def test_standard_name_table_types(self):
         snt = StandardNameTable(id="https://example.org#snt", )
         self.assertIsInstance(snt, StandardNameTable)
@@ -475,6 +624,18 @@ class TestSSNOStandardNameTable(unittest.TestCase):
         self.assertEqual(snt.standardNames[2].standardName, 'ambient_temperature')
         self.assertEqual(snt.standardNames[2].unit, 'http://qudt.org/vocab/unit/K')
 
+        # the objects built by the reader are used as they are, hence their classes are kept:
+        use_snapshots = ssnolib.config.use_snapshots
+        try:
+            ssnolib.config.use_snapshots = False
+            snt = StandardNameTable.parse(__this_dir__ / 'data/simpleSNT.jsonld')
+        finally:
+            ssnolib.config.use_snapshots = use_snapshots
+        self.assertEqual([('StandardName', 'air_density'), ('StandardName', 'coordinate'),
+                          ('VectorStandardName', 'velocity')],
+                         sorted((type(sn).__name__, sn.standardName) for sn in snt.standardNames))
+        self.assertEqual(['C_derivative_of_X', 'component'], sorted(m.name for m in snt.hasModifier))
+
     def test_standard_name_table_from_yaml(self):
         pathlib.Path('snt.yaml').unlink(missing_ok=True)
 
@@ -503,6 +664,127 @@ class TestSSNOStandardNameTable(unittest.TestCase):
         snt = StandardNameTable.parse('snt.yaml', fmt=None)
         self.assertEqual(snt.title, 'SNT')
 
+        snt_yaml_data['standardNames']['velocity'] = {'description': 'velocity',
+                                                      'canonical_unit': 'm s-1',
+                                                      'vector': True}
+        with open('snt_with_vector.yaml', 'w') as f:
+            yaml.dump(snt_yaml_data, f)
+        snt = StandardNameTable.parse('snt_with_vector.yaml')
+        pathlib.Path('snt_with_vector.yaml').unlink()
+        self.assertEqual({'x_velocity': ScalarStandardName, 'y_velocity': ScalarStandardName,
+                          'velocity': VectorStandardName},
+                         {sn.standardName: type(sn) for sn in snt.standardNames})
+        self.assertEqual('http://qudt.org/vocab/unit/M-PER-SEC', snt.get_standard_name('velocity').unit)
+
+    def test_parse_reports_invalid_standard_names(self):
+        units = ['m', 'm s-1', 'K', 'Pa', 'kg m-3', '1', 'm2 s-2', 'W m-2']
+        standard_names = {f'quantity_{i}': {'description': f'Quantity {i}', 'unit': units[i % len(units)],
+                                            'vector': i % 7 == 0} for i in range(10_000)}
+        standard_names['Invalid_Name'] = {'description': 'invalid name', 'unit': 'm'}
+        standard_names['invalid_unit'] = {'description': 'invalid unit', 'unit': 'not-a-unit'}
+        filename = __this_dir__ / 'tmp' / 'large_snt.yaml'
+        filename.parent.mkdir(exist_ok=True)
+        with open(filename, 'w') as f:
+            yaml.dump({'name': 'Large SNT', 'version': 'v1.0.0', 'standardNames': standard_names}, f)
+
+        use_snapshots = ssnolib.config.use_snapshots
+        try:
+            ssnolib.config.use_snapshots = False
+            with self.assertWarns(UserWarning) as cm:
+                snt = StandardNameTable.parse(filename, fmt='yaml')
+        finally:
+            ssnolib.config.use_snapshots = use_snapshots
+        self.assertEqual(10_000, len(snt.standardNames))
+        # all invalid standard names are reported together:
+        messages = [str(w.message) for w in cm.warnings if 'could not be parsed' in str(w.message)]
+        self.assertEqual(1, len(messages))
+        self.assertTrue(messages[0].startswith('2 standard name(s) could not be parsed'))
+        self.assertIn('Invalid_Name', messages[0])
+        self.assertIn('not-a-unit', messages[0])
+        self.assertIsInstance(snt.get_standard_name('quantity_7'), VectorStandardName)
+        self.assertEqual('http://qudt.org/vocab/unit/M-PER-SEC', snt.get_standard_name('quantity_1').unit)
+
+    def test_reload(self):
+        filename = __this_dir__ / 'tmp' / 'opencefadb_snt.jsonld'
+        filename.parent.mkdir(exist_ok=True)
+        shutil.copy(__this_dir__ / 'data' / 'opencefadb_snt.jsonld', filename)
+        use_snapshots = ssnolib.config.use_snapshots
+        try:
+            ssnolib.config.use_snapshots = False
+            snt = parse_table(filename)
+        finally:
+            ssnolib.config.use_snapshots = use_snapshots
+        blade_angle = snt.get_standard_name('blade_angle')
+        blade_angle_at_inlet = snt.get_standard_name('blade_angle_at_inlet')
+        self.assertIsNotNone(snt.get_standard_name('blade_thickness_at_inlet'))
+        grammar = snt.get_qualification_grammar()
+
+        no_changes = {'added': [], 'removed': [], 'changed': []}
+        self.assertEqual({'standardNames': no_changes, 'hasModifier': no_changes}, snt.reload(filename))
+        self.assertIs(blade_angle, snt.get_standard_name('blade_angle'))
+
+        with open(filename) as f:
+            data = json.load(f)
+        standard_names = data['ssno:standardNames']
+        standard_names[:] = [sn for sn in standard_names if sn['ssno:standardName'] != 'blade_number']
+        blade_thickness = next(sn for sn in standard_names if sn['ssno:standardName'] == 'blade_thickness')
+        blade_thickness['ssno:unit'] = 'http://qudt.org/vocab/unit/MilliM'
+        standard_names.append({'@type': 'ssno:ScalarStandardName', 'ssno:standardName': 'blade_width',
+                               'ssno:unit': 'http://qudt.org/vocab/unit/M', 'ssno:description': 'The blade width.',
+                               '@id': 'http://example.org/local/blade_width'})
+        with open(filename, 'w') as f:
+            json.dump(data, f)
+
+        changes = snt.reload(filename)
+        self.assertEqual({'added': ['blade_width'], 'removed': ['blade_number'], 'changed': ['blade_thickness']},
+                         changes['standardNames'])
+        self.assertEqual(no_changes, changes['hasModifier'])
+        self.assertIs(blade_angle, snt.get_standard_name('blade_angle'))
+        self.assertIsNone(snt.get_standard_name('blade_number'))
+        self.assertEqual('http://qudt.org/vocab/unit/MilliM', snt.get_standard_name('blade_thickness').unit)
+        self.assertEqual('http://qudt.org/vocab/unit/MilliM', snt.get_standard_name('blade_thickness_at_inlet').unit)
+        self.assertIsNotNone(snt.get_standard_name('blade_width_at_inlet'))
+        # the lookup structures of unchanged entries are kept:
+        self.assertIs(grammar, snt.get_qualification_grammar())
+        self.assertIs(blade_angle_at_inlet, snt.get_standard_name('blade_angle_at_inlet'))
+
+        location = next(m for m in data['ssno:hasModifier'] if m['schema:name'] == 'location')
+        location['dcterms:description'] = 'The location.'
+        with open(filename, 'w') as f:
+            json.dump(data, f)
+        changes = snt.reload(filename)
+        self.assertEqual(no_changes, changes['standardNames'])
+        self.assertEqual({'added': [], 'removed': [], 'changed': ['location']}, changes['hasModifier'])
+        self.assertIsNot(grammar, snt.get_qualification_grammar())
+        self.assertIsNotNone(snt.get_standard_name('blade_angle_at_inlet'))
+
+    def test_reload_yaml(self):
+        filename = __this_dir__ / 'tmp' / 'snt.yaml'
+        filename.parent.mkdir(exist_ok=True)
+        snt_yaml_data = {'id': 'https://example.org/snt',
+                         'name': 'SNT',
+                         'standardNames': {'x_velocity': {'description': 'x component of velocity',
+                                                          'unit': 'm s-1'},
+                                           'y_velocity': {'description': 'y component of velocity',
+                                                          'unit': 'm s-1'}}}
+        with open(filename, 'w') as f:
+            yaml.dump(snt_yaml_data, f)
+        snt = StandardNameTable.parse(filename)
+        x_velocity = snt.get_standard_name('x_velocity')
+
+        snt_yaml_data['standardNames']['y_velocity']['description'] = 'y-component of velocity'
+        snt_yaml_data['standardNames']['velocity'] = {'description': 'velocity', 'unit': 'm s-1', 'vector': True}
+        with open(filename, 'w') as f:
+            yaml.dump(snt_yaml_data, f)
+        changes = snt.reload(filename)
+        self.assertEqual({'added': ['velocity'], 'removed': [], 'changed': ['y_velocity']}, changes['standardNames'])
+        self.assertIs(x_velocity, snt.get_standard_name('x_velocity'))
+        self.assertIsInstance(snt.get_standard_name('velocity'), VectorStandardName)
+        self.assertEqual('y-component of velocity', str(snt.get_standard_name('y_velocity').description))
+
+        # the standard names are compared by the hashes of the entries of the source now:
+        self.assertEqual({'added': [], 'removed': [], 'changed': []}, snt.reload(filename)['standardNames'])
+
     @unittest.skipIf(condition=9 < get_python_version()[1] < 13,
                      reason="Only testing on min and max python version")
     def test_standard_name_table_from_xml(self):
@@ -548,6 +830,60 @@ class TestSSNOStandardNameTable(unittest.TestCase):
 
         self.assertFalse(snt.verify_name("x_velocity"))
 
+    def test_standard_name_table_from_cf_style_xml(self):
+        tmp_dir = __this_dir__ / 'tmp'
+        tmp_dir.mkdir(exist_ok=True)
+        xml_filename = tmp_dir / 'cf-table.xml'
+        with open(xml_filename, 'w', encoding='utf-8') as f:
+            f.write("""<?xml version="1.0"?>
+<standard_name_table xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"
+                     xsi:noNamespaceSchemaLocation="cf-standard-name-table-1.1.xsd">
+   <version_number>84</version_number>
+   <last_modified>2024-01-19T15:55:10Z</last_modified>
+   <institution>Centre for Environmental Data Analysis</institution>
+   <contact>support@ceda.ac.uk</contact>
+   <entry id="air_density">
+      <canonical_units>kg m-3</canonical_units>
+      <grib></grib>
+      <amip></amip>
+      <description>
+        The density of air.
+      </description>
+   </entry>
+   <entry id="Air_Temperature">
+      <canonical_units>K</canonical_units>
+      <description>Air temperature is the bulk temperature of the air.</description>
+   </entry>
+   <entry id="cloud_area_fraction">
+      <canonical_units>1</canonical_units>
+      <description/>
+   </entry>
+   <alias id="atmosphere_cloud_fraction">
+      <entry_id>cloud_area_fraction</entry_id>
+   </alias>
+   <alias id="unknown_alias">
+      <entry_id>unknown_name</entry_id>
+   </alias>
+</standard_name_table>""")
+        snt = StandardNameTable.parse(xml_filename, fmt='xml', make_standard_names_lowercase=True)
+        self.assertEqual('84', snt.version)
+        self.assertEqual('cf-table', snt.title)
+        self.assertEqual('support@ceda.ac.uk', snt.qualifiedAttribution.agent.mbox)
+        self.assertEqual(['air_density', 'air_temperature', 'cloud_area_fraction'],
+                         [sn.standardName for sn in snt.standardNames])
+        self.assertEqual('The density of air.', snt.standardNames[0].description)
+        self.assertEqual('http://qudt.org/vocab/unit/KiloGM-PER-M3', snt.standardNames[0].unit)
+        self.assertEqual('', snt.standardNames[2].description)
+        self.assertIsNone(snt.standardNames[0].alias)
+        alias = snt.standardNames[2].alias
+        self.assertEqual('atmosphere_cloud_fraction', alias.standardName)
+        self.assertEqual(snt.standardNames[2].unit, alias.unit)
+
+        with open(xml_filename, 'w', encoding='utf-8') as f:
+            f.write("<standard_name_table><version_number>1</version_number></standard_name_table>")
+        with self.assertRaises(KeyError):
+            StandardNameTable.parse(xml_filename, fmt='xml')
+
     def test_standard_name_table_to_yaml(self):
         snt_yaml_filename = pathlib.Path('snt.yaml')
         if not snt_yaml_filename.exists():
@@ -969,6 +1305,245 @@ class TestSSNOStandardNameTable(unittest.TestCase):
             self.assertTrue(snt.verify_name("a_b_density_c"))  # using regex
             self.assertTrue(snt.verify_name("a_b_density_c_d"))  # using regex
 
+    def test_qualification_grammar_cache(self):
+        with set_config(blank_id_generator=base_uri_generator):
+            a = ssnolib.Qualification(name="a", description='a', hasValidValues=["a", "aa"],
+                                      before=SSNO.AnyStandardName)
+            c = ssnolib.Qualification(name="c", description='c', hasValidValues=["c"], hasPreposition="at",
+                                      after=SSNO.AnyStandardName)
+            snt = StandardNameTable(id="https://example.org/snt")
+            snt.hasModifier = [a]
+            snt.append("standardNames", StandardName(standardName="density", description="", unit="kg m-3"))
+
+            grammar = snt.get_qualification_grammar()
+            self.assertIs(grammar, snt.get_qualification_grammar())
+            self.assertEqual("[a] standard_name", grammar.get_rule_as_string())
+            self.assertEqual(r"^(?:(a|aa))?_?standard_name_?$", grammar.pattern)
+            self.assertEqual(("aa",), grammar.match("aa_density", "density"))
+            self.assertIsNone(grammar.match("density_at_c", "density"))
+            self.assertFalse(snt.verify_name("density_at_c"))
+
+            # assigning modifiers invalidates the grammar:
+            snt.hasModifier = [a, c]
+            self.assertIsNot(grammar, snt.get_qualification_grammar())
+            self.assertEqual("[a] standard_name [at c]", snt.get_qualification_rule_as_string())
+            self.assertTrue(snt.verify_name("density_at_c"))
+            self.assertEqual(
+                str(snt.get_standard_name("a_density_at_c").description),
+                "density: No description available. a: No description available. at_c: No description available."
+            )
+
+    def test_verify_name_with_overlapping_core_names(self):
+        with set_config(blank_id_generator=base_uri_generator):
+            kind = ssnolib.Qualification(name="kind", description="kind", hasValidValues=["total"],
+                                         before=SSNO.AnyStandardName)
+            snt = StandardNameTable(id="https://example.org/snt")
+            snt.hasModifier = [kind]
+            snt.append("standardNames", StandardName(standardName="pressure", description="", unit="Pa"))
+            snt.append("standardNames", StandardName(standardName="static_pressure", description="", unit="Pa"))
+            self.assertTrue(snt.verify_name("total_pressure"))
+            self.assertTrue(snt.verify_name("total_static_pressure"))
+            self.assertFalse(snt.verify_name("static_total_pressure"))
+            self.assertEqual(
+                "static_pressure: No description available. total: No description available.",
+                snt.get_standard_name("total_static_pressure").description
+            )
+
+    def test_qualification_glued_to_core_name(self):
+        # the words of a qualification and the core standard name must be separated by "_":
+        with set_config(blank_id_generator=base_uri_generator):
+            surface = ssnolib.Qualification(name="surface", description="surface", hasValidValues=["wall"],
+                                            before=SSNO.AnyStandardName)
+            location = ssnolib.Qualification(name="location", description="location", hasPreposition="at",
+                                             hasValidValues=["outlet"], after=SSNO.AnyStandardName)
+            snt = StandardNameTable(id="https://example.org/snt")
+            snt.hasModifier = [surface, location]
+            snt.append("standardNames", StandardName(standardName="temperature", description="", unit="K"))
+            snt.append("standardNames", StandardName(standardName="kinematic_viscosity", description="",
+                                                     unit="m^2/s"))
+        for name in ("temperature_at_outlet", "wall_temperature", "wall_kinematic_viscosity_at_outlet"):
+            self.assertIsNotNone(snt.get_standard_name(name), name)
+            self.assertIn(name, snt.matcher)
+        for name in ("temperatureat_outlet", "walltemperature", "wallkinematic_viscosity",
+                     "kinematic_viscosityat_outlet"):
+            self.assertIsNone(snt.get_standard_name(name), name)
+            self.assertNotIn(name, snt.matcher)
+
+    def test_resolve_many(self):
+        snt = StandardNameTable(id="https://example.org/snt")
+        snt.append("standardNames", StandardName(standardName="velocity", description="velocity", unit="m/s"))
+        snt.hasModifier = [
+            ssnolib.Transformation(
+                name="mean_of_X",
+                altersUnit="[X]",
+                hasCharacter=[Character(character="X", associatedWith=SSNO.AnyStandardName)],
+                description="mean value of X"
+            )
+        ]
+        names = ["velocity", "mean_of_velocity", "Velocity", "mean_of_pressure", "velocity"]
+        resolved = snt.resolve_many(names)
+        self.assertEqual(5, len(resolved))
+        self.assertIs(resolved[0], snt["velocity"])
+        self.assertIs(resolved[0], resolved[4])
+        self.assertEqual("mean_of_velocity", resolved[1].standardName)
+        self.assertFalse(resolved[2])
+        self.assertEqual("invalid_pattern", resolved[2].reason)
+        self.assertEqual("not_found", resolved[3].reason)
+
+        self.assertEqual([True, True, False, False, True],
+                         [sn is not None for sn in snt.resolve_many(names, return_errors=False)])
+
+        resolved_in_parallel = snt.resolve_many(names, workers=2)
+        self.assertEqual([str(sn.standardName) if sn else sn.reason for sn in resolved],
+                         [str(sn.standardName) if sn else sn.reason for sn in resolved_in_parallel])
+        self.assertEqual(str(QUDT_UNIT.M_PER_SEC), resolved_in_parallel[1].unit)
+
+    def test_derived_standard_name_cache(self):
+        def _build_table():
+            snt = StandardNameTable(id="https://example.org/snt")
+            snt.append("standardNames", StandardName(standardName="velocity", description="", unit="m/s"))
+            snt.hasModifier = [
+                ssnolib.Transformation(
+                    name="mean_of_X",
+                    altersUnit="[X]",
+                    hasCharacter=[Character(character="X", associatedWith=SSNO.AnyStandardName)],
+                    description="mean value of X"
+                )
+            ]
+            return snt
+
+        snt1 = _build_table()
+        snt2 = _build_table()
+        self.assertIsNone(snt1.identifier)
+        self.assertIsNone(snt2.identifier)
+
+        mean_velocity = snt1.get_standard_name("mean_of_velocity")
+        self.assertIs(mean_velocity, snt1.get_standard_name("mean_of_velocity"))
+        self.assertEqual(1, snt1.cache_info()["derived"].hits)
+        self.assertEqual(1, snt1.cache_info()["derived"].currsize)
+        # tables without identifier do not share their cache:
+        self.assertEqual(0, snt2.cache_info()["derived"].currsize)
+
+        snt1.hasModifier = []
+        self.assertEqual(0, snt1.cache_info()["derived"].currsize)
+        self.assertIsNone(snt1.get_standard_name("mean_of_velocity"))
+
+        # removing the core standard name in place discards the names derived from it:
+        self.assertIsNotNone(snt2.get_standard_name("mean_of_velocity"))
+        del snt2.standardNames[0]
+        self.assertIsNone(snt2.get_standard_name("mean_of_velocity"))
+        self.assertEqual(0, snt2.cache_info()["derived"].currsize)
+
+        # copies do not share the cache:
+        snt = _build_table()
+        mean_velocity = snt.get_standard_name("mean_of_velocity")
+        for deep in (False, True):
+            copied = snt.model_copy(deep=deep)
+            self.assertIsNot(snt._derived_name_cache, copied._derived_name_cache)
+            copied.hasModifier = []
+            self.assertIsNone(copied.get_standard_name("mean_of_velocity"))
+            self.assertEqual(1, snt.cache_info()["derived"].currsize)
+            self.assertIs(mean_velocity, snt.get_standard_name("mean_of_velocity"))
+
+    def test_unresolvable_standard_name_cache(self):
+        snt = StandardNameTable(id="https://example.org/snt")
+        snt.append("standardNames", StandardName(standardName="velocity", description="", unit="m/s"))
+        snt.hasModifier = [
+            ssnolib.Transformation(
+                name="mean_of_X",
+                altersUnit="[X]",
+                hasCharacter=[Character(character="X", associatedWith=SSNO.AnyStandardName)],
+                description="mean value of X"
+            )
+        ]
+        self.assertIsNone(snt.get_standard_name("mean_of_pressure"))
+        self.assertIsNone(snt.get_standard_name("mean_of_pressure"))
+        info = snt.cache_info()["unresolvable"]
+        self.assertEqual(1, info.hits)
+        self.assertEqual(1, info.currsize)
+
+        # a new core standard name may make the name valid:
+        snt.append("standardNames", StandardName(standardName="pressure", description="", unit="Pa"))
+        self.assertEqual(0, snt.cache_info()["unresolvable"].currsize)
+        self.assertEqual("mean_of_pressure", snt.get_standard_name("mean_of_pressure").standardName)
+
+        # names which cannot be resolved with a changed copy remain valid in the original table:
+        for deep in (False, True):
+            copied = snt.model_copy(deep=deep)
+            copied.hasModifier = []
+            self.assertIsNone(copied.get_standard_name("mean_of_velocity"))
+            self.assertEqual(1, copied.cache_info()["unresolvable"].currsize)
+            self.assertEqual(0, snt.cache_info()["unresolvable"].currsize)
+            self.assertEqual("mean_of_velocity", snt.get_standard_name("mean_of_velocity").standardName)
+            snt.invalidate_caches()
+
+    def test_verify_many(self):
+        snt = StandardNameTable(id="https://example.org/snt")
+        snt.append("standardNames", StandardName(standardName="velocity", description="", unit="m/s"))
+        snt.append("standardNames", StandardName(standardName="pressure", description="", unit="Pa"))
+        snt.hasModifier = [
+            ssnolib.Transformation(
+                name="mean_of_X",
+                altersUnit="[X]",
+                hasCharacter=[Character(character="X", associatedWith=SSNO.AnyStandardName)],
+                description="mean value of X"
+            )
+        ]
+        names = ["velocity", "velocity", "pressure", "mean_of_velocity", "temperature", "Velocity", "pressure",
+                 "pressure"]
+        units = ["m s-1", "mm/s", "kg/(m*s^2)", str(QUDT_UNIT.M_PER_SEC), "K", "m/s", "m", "not_a_unit"]
+        valid, reasons = snt.verify_many(names, units)
+        self.assertEqual([True, True, True, True, False, False, False, False], valid.tolist())
+        self.assertEqual([resolution.OK, resolution.OK, resolution.OK, resolution.OK, resolution.NOT_FOUND,
+                          resolution.INVALID_PATTERN, resolution.INCOMPATIBLE_UNIT, resolution.INVALID_UNIT],
+                         reasons.tolist())
+
+        import numpy as np
+        valid, reasons = snt.verify_many(np.array(["velocity", "pressure"]), np.array(["m/s", None]))
+        self.assertEqual([True, False], valid.tolist())
+        self.assertEqual(resolution.INCOMPATIBLE_UNIT, reasons[1])  # missing units are dimensionless
+        with self.assertRaises(ValueError):
+            snt.verify_many(["velocity"], [])
+
+    def test_standard_name_index(self):
+        snt = StandardNameTable(id="https://example.org/snt")
+        snt.append("standardNames", StandardName(standardName="velocity", description="", unit="m/s"))
+        snt.append("standardNames", {"standardName": "pressure", "description": "", "unit": "Pa"})
+        self.assertIsInstance(snt["pressure"], StandardName)
+        self.assertEqual(["velocity", "pressure"], list(snt.get_standard_name_dict().keys()))
+
+        snt.add_new_standard_name(StandardName(standardName="density", description="", unit="kg/m^3"), False)
+        self.assertEqual(3, len(snt.standardNames))
+        self.assertEqual("density", snt["density"].standardName)
+        with self.assertRaises(ValueError):
+            snt.add_new_standard_name("density")
+        with self.assertRaises(ValueError):
+            snt.add_new_standard_name(StandardName(standardName="density", description="", unit="kg/m^3"))
+
+        # in-place changes and re-assignments of the list are recognized:
+        snt.standardNames.append(StandardName(standardName="temperature", description="", unit="K"))
+        self.assertEqual("temperature", snt["temperature"].standardName)
+        snt.standardNames = [StandardName(standardName="length", description="", unit="m")]
+        self.assertEqual("length", snt["length"].standardName)
+        with self.assertRaises(KeyError):
+            snt["velocity"]
+        # replacing an item keeps the identity and the length of the list:
+        snt.standardNames[0] = StandardName(standardName="time", description="", unit="s")
+        self.assertEqual("time", snt["time"].standardName)
+        self.assertIsNone(snt.get_standard_name("length"))
+        snt.standardNames.insert(0, snt.standardNames.pop())
+        snt.standardNames[:] = [StandardName(standardName="mass", description="", unit="kg")]
+        self.assertIsNone(snt.get_standard_name("time"))
+        self.assertEqual("mass", snt["mass"].standardName)
+
+        # tables built without validation are tracked, too:
+        snt = StandardNameTable.model_construct(id="https://example.org/snt", standardNames=[
+            StandardName(standardName="velocity", description="", unit="m/s")])
+        self.assertEqual("velocity", snt["velocity"].standardName)
+        snt.standardNames[0] = StandardName(standardName="pressure", description="", unit="Pa")
+        self.assertEqual("pressure", snt["pressure"].standardName)
+        self.assertIsNone(snt.get_standard_name("velocity"))
+
     def test_transformation(self):
         with set_config(blank_id_generator=base_uri_generator):
             # taken from https://cfconventions.org/Data/cf-standard-names/docs/guidelines.html#process
@@ -1072,6 +1647,55 @@ class TestSSNOStandardNameTable(unittest.TestCase):
         self.assertEqual("velocity_derivative_of_mean_of_velocity", new_standard_name.standardName)
         self.assertEqual(str(new_standard_name.unit), str(QUDT_UNIT.UNITLESS))
 
+    def test_nested_transformations(self):
+        snt = StandardNameTable(id="https://example.org/snt", name="Fluid SNT")
+        X = ssnolib.Character(character="X", associatedWith=ssnolib.namespace.SSNO.AnyStandardName)
+        Y = ssnolib.Character(character="Y", associatedWith=ssnolib.namespace.SSNO.AnyStandardName)
+        snt.hasModifier = [
+            ssnolib.Transformation(name="mean_of_X", altersUnit="[X]", hasCharacter=[X, ],
+                                   description="mean value of X"),
+            ssnolib.Transformation(name="derivative_of_X_wrt_Y", altersUnit="[X]/[Y]", hasCharacter=[X, Y],
+                                   description="derivative of X with respect to Y")
+        ]
+        snt.append("standardNames", StandardName(standardName="velocity", description="velocity", unit="m/s"))
+        snt.append("standardNames", StandardName(standardName="length", description="length", unit="m"))
+        snt.append("standardNames", StandardName(standardName="time", description="time", unit="s"))
+
+        # the first argument ends at the first "_wrt_", which a greedy split would miss:
+        name = "derivative_of_velocity_wrt_derivative_of_length_wrt_time"
+        matches, transformation = check_if_standard_name_can_be_build_with_transformation(name, snt)
+        self.assertEqual("derivative_of_X_wrt_Y", transformation.name)
+        self.assertEqual(["velocity", "derivative_of_length_wrt_time"], [m.standardName for m in matches])
+        self.assertEqual(str(QUDT_UNIT.UNITLESS), str(snt.get_standard_name(name).unit))
+
+        # deeply nested names are parsed once, without backtracking over all splits:
+        name = "mean_of_" * 7 + "derivative_of_derivative_of_length_wrt_time_wrt_length"
+        match_transformation = snt.matcher.match_transformation
+        with unittest.mock.patch.object(snt.matcher, "match_transformation",
+                                        side_effect=match_transformation) as parse:
+            self.assertEqual(name, snt.get_standard_name(name).standardName)
+        parse.assert_called_once_with(name)
+        # the nested arguments are cached as derived standard names:
+        self.assertIsNotNone(snt._derived_name_cache.get(name[len("mean_of_"):]))
+
+        max_transformation_depth = ssnolib.config.max_transformation_depth
+        ssnolib.config.max_transformation_depth = 2
+        try:
+            self.assertIsNotNone(snt.matcher.match("mean_of_mean_of_velocity"))
+            self.assertIsNone(snt.matcher.match("mean_of_mean_of_mean_of_velocity"))
+            self.assertIsNotNone(snt.matcher.match("mean_of_mean_of_mean_of_velocity", max_depth=3))
+        finally:
+            ssnolib.config.max_transformation_depth = max_transformation_depth
+
+    def test_get_regex_from_transformation_is_deprecated(self):
+        X = ssnolib.Character(character="X", associatedWith=SSNO.AnyStandardName)
+        Y = ssnolib.Character(character="Y", associatedWith=SSNO.AnyStandardName)
+        derivative = ssnolib.Transformation(name="derivative_of_X_wrt_Y", altersUnit="[X]/[Y]",
+                                            hasCharacter=[X, Y], description="derivative of X with respect to Y")
+        with self.assertWarns(DeprecationWarning):
+            pattern = get_regex_from_transformation(derivative)
+        self.assertEqual("derivative_of_([a-zA-Z_]+)_wrt_([a-zA-Z_]+)", pattern)
+
     def test_complicated_transformation(self):
         qloc = Qualification(
             name="location",
@@ -0,0 +1,103 @@
+import io
+import json
+import pathlib
+import unittest
+
+import rdflib
+from rdflib.compare import isomorphic
+
+import ssnolib
+from ssnolib import parse_table
+from ssnolib.streaming import iter_ntriples, iter_standard_names
+
+__this_dir__ = pathlib.Path(__file__).parent
+
+
+def _names(standard_names):
+    return sorted((sn.standardName, str(sn.unit), type(sn).__name__) for sn in standard_names)
+
+
+class TestStreaming(unittest.TestCase):
+
+    def test_iter_standard_names(self):
+        for filename in ("simpleSNT.jsonld", "snt_from_scratch.jsonld", "opencefadb_snt.jsonld"):
+            filename = __this_dir__ / "data" / filename
+            expected = _names(parse_table(filename).standardNames)
+            self.assertEqual(expected, _names(iter_standard_names(filename)))
+            self.assertEqual(expected, _names(iter_standard_names(str(filename), chunk_size=3)))
+
+            # expanded and flattened JSON-LD:
+            g = rdflib.Graph()
+            g.parse(filename, format="json-ld")
+            expanded = g.serialize(format="json-ld")
+            self.assertEqual(expected, _names(iter_standard_names(io.StringIO(expanded), chunk_size=5)))
+
+        sn = next(ssnolib.iter_standard_names(__this_dir__ / "data/simpleSNT.jsonld"))
+        self.assertIsInstance(sn, ssnolib.StandardName)
+
+    def test_graph_and_context(self):
+        doc = {
+            "@context": {"ssno": "https://matthiasprobst.github.io/ssno#",
+                         "sn": "ssno:standardName",
+                         "units": {"@id": "ssno:unit"}},
+            "@graph": [
+                {"@id": "https://example.org/#snt", "@type": "ssno:StandardNameTable",
+                 "ssno:standardNames": [{"@id": "https://example.org/#velocity"}]},
+                {"@id": "https://example.org/#velocity", "@type": ["ssno:VectorStandardName"],
+                 "sn": "velocity", "units": "m/s", "ssno:description": {"@value": "velocity", "@language": "en"}},
+                {"@id": "https://example.org/#n", "@type": "ssno:ScalarStandardName",
+                 "sn": "n", "units": 1, "ssno:description": "count", "ssno:unknown": [1, {"a": [2.5e3]}]},
+            ]
+        }
+        names = list(iter_standard_names(io.StringIO(json.dumps(doc)), chunk_size=4))
+        self.assertEqual(["velocity", "n"], [sn.standardName for sn in names])
+        self.assertIsInstance(names[0], ssnolib.VectorStandardName)
+        self.assertIsInstance(names[1], ssnolib.ScalarStandardName)
+        self.assertEqual("https://example.org/#velocity", names[0].id)
+        self.assertEqual("http://qudt.org/vocab/unit/M-PER-SEC", names[0].unit)
+
+    def test_streaming(self):
+        n = 1000
+        doc = json.dumps({
+            "@context": {"ssno": "https://matthiasprobst.github.io/ssno#"},
+            "@type": "ssno:StandardNameTable",
+            "ssno:standardNames": [{"@type": "ssno:StandardName", "ssno:standardName": f"quantity_{i}",
+                                    "ssno:unit": "m", "ssno:description": "A quantity"} for i in range(n)]
+        }, indent=2)
+        f = io.StringIO(doc)
+        names = iter_standard_names(f, chunk_size=1024)
+        self.assertEqual("quantity_0", next(names).standardName)
+        # the first name is available after reading the first chunk:
+        self.assertLess(f.tell(), 2 * 1024)
+        self.assertEqual(n - 1, sum(1 for _ in names))
+
+    def test_invalid_json(self):
+        for doc in ('{"ssno:standardNames": [{"@type": "ssno:StandardName"', '{"a": 1} 2', '"a"', '{"a" 1}'):
+            with self.assertRaises(ValueError):
+                list(iter_standard_names(io.StringIO(doc)))
+
+    def test_iter_ntriples(self):
+        nt = (
+            '<https://example.org/#s> <https://example.org/#p> "a \\"quoted\\" \\u00e9\\n"@en-GB .\n'
+            '# a comment\n'
+            '\n'
+            '_:b1 <https://example.org/#p> "3"^^<http://www.w3.org/2001/XMLSchema#integer> . # comment\n'
+            '<https://example.org/#s> <https://example.org/#q> _:b1.\n'
+        )
+        triples = list(iter_ntriples(io.StringIO(nt)))
+        self.assertEqual(3, len(triples))
+        self.assertEqual(rdflib.Literal('a "quoted" \u00e9\n', lang="en-GB"), triples[0][2])
+        self.assertEqual(rdflib.Literal(3), triples[1][2])
+        self.assertEqual(triples[1][0], triples[2][2])
+
+        g = rdflib.Graph()
+        g.parse(data=nt, format="nt")
+        g2 = rdflib.Graph()
+        for triple in iter_ntriples(io.StringIO(nt)):
+            g2.add(triple)
+        self.assertTrue(isomorphic(g, g2))
+
+        self.assertEqual([rdflib.URIRef("https://example.org/#q")],
+                         [p for _, p, _ in iter_ntriples(io.StringIO(nt), predicates={"https://example.org/#q"})])
+        with self.assertRaises(ValueError):
+            list(iter_ntriples(io.StringIO('<https://example.org/#s> <https://example.org/#p> "a"\n')))
@@ -0,0 +1,61 @@
+import unittest
+
+import rdflib
+from ontolutils import set_config
+
+import ssnolib
+from ssnolib.namespace import SSNO
+from ssnolib.suggestion import DeletionIndex, levenshtein
+
+
+class TestSuggestion(unittest.TestCase):
+
+    def test_levenshtein(self):
+        self.assertEqual(0, levenshtein("velocity", "velocity"))
+        self.assertEqual(1, levenshtein("velocity", "velosity"))
+        self.assertEqual(2, levenshtein("temperature", "temprture"))
+        self.assertEqual(3, levenshtein("", "abc"))
+        self.assertEqual(3, levenshtein("velocity", "abc", max_distance=2))
+
+    def test_deletion_index(self):
+        words = ["velocity", "pressure", "density", "x", "y", "at", "of"]
+        index = DeletionIndex(words, max_distance=2)
+        self.assertEqual(7, len(index))
+        self.assertIn("velocity", index)
+        self.assertEqual([(1, "velocity")], index.search("velosity"))
+        self.assertEqual([(1, "pressure")], index.search("presure"))
+        self.assertEqual([(1, "x"), (1, "y")], index.search("z", 1))
+        # the result equals a comparison with every word:
+        for query in ("dens", "pressures", "a", "ox", "velocity"):
+            self.assertEqual(sorted((levenshtein(query, w), w) for w in words if levenshtein(query, w) <= 2),
+                             index.search(query))
+        with self.assertRaises(ValueError):
+            index.search("velocity", 3)
+
+    def test_suggest(self):
+        with set_config(blank_id_generator=lambda: f"https://example.org/#{rdflib.BNode()}"):
+            component = ssnolib.VectorQualification(name="component", description="component",
+                                                    hasValidValues=["x", "y"], before=SSNO.AnyStandardName)
+            at_surface = ssnolib.Qualification(name="surface", description="surface", hasPreposition="at",
+                                               hasValidValues=["sea_floor", "toa"], after=SSNO.AnyStandardName)
+            X = ssnolib.Character(character="X", associatedWith=SSNO.AnyStandardName)
+            snt = ssnolib.StandardNameTable(id="https://example.org/snt")
+            snt.hasModifier = [
+                component, at_surface,
+                ssnolib.Transformation(name="mean_of_X", altersUnit="[X]", hasCharacter=[X], description="mean")
+            ]
+            snt.append("standardNames", ssnolib.VectorStandardName(standardName="velocity", unit="m/s",
+                                                                   description="velocity"))
+            snt.append("standardNames", ssnolib.ScalarStandardName(standardName="air_temperature", unit="K",
+                                                                   description="air temperature"))
+
+            self.assertEqual(["air_temperature"], snt.suggest("air_temprature"))
+            self.assertEqual(["air_temperature"], snt.suggest("airtemperature"))
+            self.assertEqual(["x_velocity_at_sea_floor"], snt.suggest("x_velosity_at_sea_flor"))
+            self.assertEqual(["mean_of_air_temperature"], snt.suggest("meen_of_air_temperature"))
+            self.assertEqual(["x_velocity", "y_velocity"], snt.suggest("z_velocity"))
+            self.assertEqual(["x_velocity"], snt.suggest("z_velocity", k=1))
+            # component is a vector qualification:
+            self.assertEqual(["air_temperature"], snt.suggest("x_air_temperature"))
+            self.assertEqual(["velocity_at_sea_floor"], snt.suggest("velocity_at_sea"))
+            self.assertEqual([], snt.suggest("completely_unrelated_name_here"))
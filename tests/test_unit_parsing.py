@@ -1,6 +1,9 @@
 import unittest
 
-from ssnolib.ssno.unit_utils import _parse_unit, _get_ureg
+from ontolutils import QUDT_UNIT
+
+from ssnolib.ssno.unit_utils import _parse_unit, _format_unit, _get_ureg, reverse_qudt_lookup, unit_cache_info
+from ssnolib.unit_index import QudtUnitIndex
 
 
 class TestUnitParsing(unittest.TestCase):
@@ -16,3 +19,53 @@ class TestUnitParsing(unittest.TestCase):
             _parse_unit("kg m-1 s-1"),
             _get_ureg()("kg/m/s").u
         )
+
+    def test_qudt_unit_index(self):
+        index = QudtUnitIndex(lookup={"m/s": QUDT_UNIT.M_PER_SEC,
+                                      "m s-1": QUDT_UNIT.M_PER_SEC,
+                                      "mm": QUDT_UNIT.MilliM,
+                                      "m": QUDT_UNIT.M})
+        self.assertEqual(4, len(index))
+        self.assertEqual(str(QUDT_UNIT.M_PER_SEC), index.symbol_to_iri("m s-1"))
+        self.assertEqual("m/s", index.iri_to_symbol(QUDT_UNIT.M_PER_SEC))
+        self.assertEqual("m/s", index.iri_to_symbol(str(QUDT_UNIT.M_PER_SEC)))
+        self.assertEqual(str(QUDT_UNIT.M), index.pint_to_iri("m"))  # not the scaled "mm"
+        self.assertEqual(str(QUDT_UNIT.M_PER_SEC), index.pint_to_iri("m/s"))
+        self.assertIsNone(index.symbol_to_iri("K"))
+        self.assertEqual((5, 1), (index.info().hits, index.info().misses))
+
+        index.update({"K": QUDT_UNIT.K, "kelvin": QUDT_UNIT.K})
+        self.assertEqual(str(QUDT_UNIT.K), index.symbol_to_iri("K"))
+        self.assertEqual("K", index.iri_to_symbol(QUDT_UNIT.K))
+        self.assertEqual(str(QUDT_UNIT.K), index.pint_to_iri("K"))
+        self.assertEqual(6, index.info().currsize)
+
+        # entries added to the lookup table directly are recognized, too:
+        index._lookup["Pa"] = QUDT_UNIT.PA
+        self.assertEqual("Pa", index.iri_to_symbol(QUDT_UNIT.PA))
+
+    def test_reverse_qudt_lookup(self):
+        self.assertEqual("m/s", reverse_qudt_lookup(QUDT_UNIT.M_PER_SEC))
+        self.assertEqual("m/s", reverse_qudt_lookup("http://qudt.org/vocab/unit/M-PER-SEC"))
+        self.assertIsNone(reverse_qudt_lookup("http://example.org/unknown_unit"))
+
+    def test_unit_caches(self):
+        info = unit_cache_info()
+        self.assertIs(_parse_unit("m s-1"), _parse_unit("m s-1"))
+        self.assertEqual("m/s", _format_unit("meter / second"))
+        self.assertEqual("m/s", _format_unit("meter / second"))
+        new_info = unit_cache_info()
+        self.assertGreaterEqual(new_info["parse"].hits, info["parse"].hits + 1)
+        self.assertGreaterEqual(new_info["format"].hits, info["format"].hits + 1)
+
+        index = QudtUnitIndex(lookup={"m/s": QUDT_UNIT.M_PER_SEC})
+        self.assertEqual(str(QUDT_UNIT.M_PER_SEC), index.resolve("m s-1"))
+        self.assertEqual(str(QUDT_UNIT.M_PER_SEC), index.resolve("m s-1"))
+        self.assertIsNone(index.resolve("K"))
+        self.assertIsNone(index.resolve("not_a_unit"))
+        self.assertIsNone(index.resolve("not_a_unit"))
+        self.assertEqual((2, 3), (index.cache_info().hits, index.cache_info().misses))
+        # adding entries invalidates the memoized results:
+        index.update({"K": QUDT_UNIT.K})
+        self.assertEqual(0, index.cache_info().currsize)
+        self.assertEqual(str(QUDT_UNIT.K), index.resolve("K"))